@@ -4,6 +4,12 @@ from .round_robin import RR
 from .shortest_job_first import SJF
 from .priority import Priority
 from .multilevel_queue import MultilevelQueue
+from .multilevel_feedback_queue import MultilevelFeedbackQueue
+from .completely_fair import CompletelyFair
 from .preemptive_shortest_job_first import PreemptiveSJF
+from .ready_queue import ReadyQueue
+from .skip_list import SkipList
+from .registry import ALGORITHMS, create_algorithm
+from .closed_form import CLOSED_FORM, ClosedFormDispatcher, run_closed_form
 
-__all__ = ['Algorithm', 'FCFS', 'RR', 'SJF', 'Priority', 'MultilevelQueue', 'PreemptiveSJF']
\ No newline at end of file
+__all__ = ['Algorithm', 'FCFS', 'RR', 'SJF', 'Priority', 'MultilevelQueue', 'MultilevelFeedbackQueue', 'CompletelyFair', 'PreemptiveSJF', 'ReadyQueue', 'SkipList', 'ALGORITHMS', 'create_algorithm', 'CLOSED_FORM', 'ClosedFormDispatcher', 'run_closed_form']
\ No newline at end of file
@@ -1,4 +1,5 @@
 from thread_handling.thread import Thread
+from tracing import Tracer
 
 
 class Algorithm:
@@ -6,15 +7,84 @@ class Algorithm:
     Base class for all scheduling algorithms.
     """
 
+    # Whether the algorithm may take the CPU from a thread before it completes
+    preemptive: bool = True
+
     def __init__(self) -> None:
         self.active_thread: Thread | None = None
+        self.tracer: Tracer | None = (
+            None  # records scheduling decisions such as preemptions
+        )
+        self.core: int = 0  # core the algorithm schedules, reported in trace events
+
+    def trace(
+        self, kind: int, time_step: int, thread: Thread, other: Thread | None = None
+    ) -> None:
+        """
+        Records a scheduling decision about thread, see tracing.events for the kinds.
+        Does nothing unless the tracer records events of this kind.
+        """
+        tracer = self.tracer
+        if tracer is not None and tracer.enabled & kind:
+            tracer.emit(
+                kind,
+                time_step,
+                thread.thread_id,
+                other.thread_id if other is not None else None,
+                core=self.core,
+            )
+
+    def admit(self, threads: list[Thread], time_step: int) -> None:
+        """
+        Adds the threads that arrived at time_step to the algorithm's ready structures.
+        Called by the dispatcher before tick(), with threads in arrival order.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses")
 
-    def tick(self, threads: list[Thread], time_step: int) -> Thread | None:
+    def tick(self, time_step: int) -> Thread | None:
         """
         Runs the algorithm for the current tick and returns the currently active thread.
         """
         raise NotImplementedError("This method should be overridden by subclasses")
 
+    def run_length(self) -> int:
+        """
+        Returns how many more ticks the thread returned by the last tick() may run
+        uninterrupted, assuming no new threads arrive in the meantime.
+        The default of 0 makes the event-driven engine re-run the algorithm every tick.
+        """
+        return 0
+
+    def advance(self, time_step: int, ticks: int) -> None:
+        """
+        Fast-forwards the active thread by the given number of ticks starting at time_step.
+        Only called with ticks <= run_length().
+        """
+        self.active_thread.advance(time_step, ticks)
+
+    def queue_lengths(self) -> dict[str, int]:
+        """
+        Returns the number of threads in each of the algorithm's ready queues by name,
+        e.g. {"ready": 3}. Sampled by the instrumentation after every decision.
+        """
+        return {}
+
+    def steal(self) -> Thread | None:
+        """
+        Removes and returns a waiting (not active) thread so another core can run it,
+        or None if there is nothing to give up. Used by multi-core work stealing.
+        """
+        return None
+
+    def take(self) -> Thread | None:
+        """
+        Removes and returns the waiting (not active) thread that would run next, or
+        None if nothing is waiting. Used by the multi-core global queue, which keeps
+        its waiting threads in an instance of the simulated algorithm, so only the
+        non-preemptive algorithms implement it.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses")
+
     def reset(self):
         """
         Resets the algorithm state for a new simulation.
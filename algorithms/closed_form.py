@@ -0,0 +1,175 @@
+import heapq
+from typing import Callable
+
+import numpy as np
+
+from evaluation.online import LiveMetrics
+from thread_handling.thread import Thread
+from thread_handling.thread_table import ThreadTable
+
+# A schedule: indices of the threads in the order they run, and their start times
+Schedule = tuple[np.ndarray, np.ndarray]
+
+
+def _arrival_order(arrival: np.ndarray, burst: np.ndarray) -> np.ndarray:
+    """
+    Indices of the threads with burst time, stably sorted by arrival like ArrivalIndex.
+    Threads without burst time are finished on arrival and never run.
+    """
+    runnable = np.flatnonzero(burst > 0)
+    return runnable[np.argsort(arrival[runnable], kind="stable")]
+
+
+def fcfs_schedule(arrival: np.ndarray, burst: np.ndarray) -> Schedule:
+    """
+    FCFS runs threads in arrival order, each starting when it has arrived and the
+    previous one has completed: completion[i] = max(arrival[i], completion[i-1]) + burst[i].
+    Unrolled, completion[i] = prefix_burst[i] + max over j <= i of
+    (arrival[j] - prefix_burst[j-1]), a running maximum computed in one vectorized pass.
+    """
+    order = _arrival_order(arrival, burst)
+    bursts = burst[order]
+    prefix = np.cumsum(bursts)
+    completion = np.maximum.accumulate(arrival[order] - (prefix - bursts)) + prefix
+    return order, completion - bursts
+
+
+def sjf_schedule(arrival: np.ndarray, burst: np.ndarray) -> Schedule:
+    """
+    SJF runs the shortest arrived thread whenever the CPU becomes free, ties broken by
+    arrival and then admission order like ReadyQueue. One heap operation per thread
+    over plain integers, O(n log n).
+    """
+    order = _arrival_order(arrival, burst)
+    arrivals = arrival[order].tolist()
+    bursts = burst[order].tolist()
+    count = len(arrivals)
+    push, pop = heapq.heappush, heapq.heappop
+    ready: list[tuple[int, int, int]] = []  # (burst, arrival, rank in arrival order)
+    ran = []
+    starts = []
+    time_step = 0
+    next_arrival = 0
+    for _ in range(count):
+        # When the CPU is idle, jump to the next arrival
+        if not ready and arrivals[next_arrival] > time_step:
+            time_step = arrivals[next_arrival]
+        while next_arrival < count and arrivals[next_arrival] <= time_step:
+            push(ready, (bursts[next_arrival], arrivals[next_arrival], next_arrival))
+            next_arrival += 1
+        run_burst, _, rank = pop(ready)
+        ran.append(rank)
+        starts.append(time_step)
+        time_step += run_burst
+    return order[np.array(ran, dtype=np.int64)], np.array(starts, dtype=np.int64)
+
+
+# Non-preemptive algorithms whose whole schedule can be computed without simulating
+CLOSED_FORM: dict[str, Callable[[np.ndarray, np.ndarray], Schedule]] = {
+    "fcfs": fcfs_schedule,
+    "sjf": sjf_schedule,
+}
+
+
+def _gantt_segments(
+    thread_ids: np.ndarray, start: np.ndarray, completion: np.ndarray
+) -> list[tuple[str, int, int]]:
+    """
+    Builds the Gantt segments the dispatcher would record for runs in order: IDLE
+    before every run that starts after the previous one ended, and back-to-back runs
+    of threads with the same ID merged into one segment.
+    """
+    if len(start) == 0:
+        return []
+    previous_end = np.concatenate(([0], completion[:-1]))
+    gaps = start > previous_end
+
+    # Every run is preceded by its idle gap, if it has one
+    position = np.arange(len(start)) + np.cumsum(gaps)
+    ids = np.empty(len(start) + int(gaps.sum()), dtype=object)
+    starts = np.empty(len(ids), dtype=np.int64)
+    ids[position] = thread_ids
+    starts[position] = start
+    ids[position[gaps] - 1] = "IDLE"
+    starts[position[gaps] - 1] = previous_end[gaps]
+
+    # Segments are contiguous, so a merged segment ends where the next one starts
+    first = np.concatenate(([True], ids[1:] != ids[:-1]))
+    starts = starts[first]
+    ends = np.concatenate((starts[1:], completion[-1:]))
+    return list(zip(ids[first].tolist(), starts.tolist(), ends.tolist()))
+
+
+def run_closed_form(
+    threads: list[Thread], algorithm: str, live: LiveMetrics | None = None
+) -> list[tuple[str, int, int]]:
+    """
+    Computes the schedule of a non-preemptive algorithm in CLOSED_FORM directly,
+    writes the start, completion, waiting and turnaround times into the threads and
+    returns the Gantt segments. The result is identical to running a Dispatcher with
+    the same algorithm, without simulating any ticks. The runs and completed threads
+    are also counted in live, if given, like Dispatcher.live.
+    """
+    if isinstance(threads, ThreadTable):
+        arrival, burst = threads.arrival, threads.burst
+        thread_ids = np.asarray(threads.thread_ids, dtype=object)
+    else:
+        arrival = np.fromiter((th.arrival for th in threads), np.int64, len(threads))
+        burst = np.fromiter((th.burst for th in threads), np.int64, len(threads))
+        thread_ids = np.array([th.thread_id for th in threads], dtype=object)
+
+    order, start = CLOSED_FORM[algorithm](arrival, burst)
+    completion = start + burst[order]
+    turnaround = completion - arrival[order]
+
+    if isinstance(threads, ThreadTable):
+        threads.remaining[order] = 0
+        threads.start_time[order] = start
+        threads.completion_time[order] = completion
+        threads.last_run_time[order] = completion - 1
+        threads.turnaround_time[order] = turnaround
+        threads.waiting_time[order] = turnaround - burst[order]
+    else:
+        for index, first, last in zip(
+            order.tolist(), start.tolist(), completion.tolist()
+        ):
+            thread = threads[index]
+            thread.remaining = 0
+            thread.start_time = first
+            thread.completion_time = last
+            thread.last_run_time = last - 1
+            thread.compute_metrics()
+
+    if live is not None:
+        live.record_runs(thread_ids[order], start, completion)
+        live.complete_all(
+            burst[order], turnaround - burst[order], turnaround, start - arrival[order]
+        )
+    return _gantt_segments(thread_ids[order], start, completion)
+
+
+class ClosedFormDispatcher:
+    """
+    Drop-in replacement for a Dispatcher running one of the CLOSED_FORM algorithms:
+    run() computes the whole schedule at once instead of simulating it tick by tick,
+    with the same thread metrics and gantt_segments.
+    """
+
+    def __init__(self, threads: list[Thread], algorithm: str) -> None:
+        if algorithm not in CLOSED_FORM:
+            raise ValueError(
+                f"No closed form for '{algorithm}'. Choose from: {', '.join(CLOSED_FORM)}"
+            )
+        self.time_step: int = 0  # End of the schedule once run
+        self.threads: list[Thread] = threads  # All threads to be scheduled
+        self.algorithm: str = algorithm  # Name of the algorithm in CLOSED_FORM
+        # Gantt chart data as (thread_id, start, end) runs, end exclusive
+        self.gantt_segments: list[tuple[str, int, int]] = []
+        # Busy time, context switches and metric sums, counted from the whole schedule
+        self.live = LiveMetrics()
+
+    def run(self) -> None:
+        """Computes the complete schedule."""
+        self.live.reset()
+        self.gantt_segments = run_closed_form(self.threads, self.algorithm, self.live)
+        self.time_step = self.gantt_segments[-1][2] if self.gantt_segments else 0
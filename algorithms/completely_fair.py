@@ -0,0 +1,157 @@
+from .algorithm import Algorithm
+from .skip_list import SkipList
+from thread_handling.thread import Thread
+from tracing import QUANTUM_EXPIRY
+
+# Linux's weight of every nice level from -20 to 19, each level about 25% less CPU
+NICE_WEIGHTS = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+)  # fmt: skip
+NICE_0_WEIGHT = 1024
+VRUNTIME_SCALE = 1024  # Virtual runtime of one tick at priority 0
+
+
+def priority_weight(priority: int) -> int:
+    """
+    Weight of a thread, using its priority as the nice level (lower runs more).
+    """
+    return NICE_WEIGHTS[min(max(priority, -20), 19) + 20]
+
+
+class CompletelyFair(Algorithm):
+    """
+    Completely Fair Scheduler in the style of Linux CFS.
+    Every thread accumulates virtual runtime, its CPU time scaled down by its weight,
+    and the thread with the least virtual runtime runs next. Runnable threads are kept
+    in a skip list ordered by virtual runtime, so picking and requeueing are O(log n).
+
+    The running thread gets a slice of the scheduling period in proportion to its
+    weight, where the period is target_latency ticks, stretched so that no slice is
+    shorter than about min_granularity ticks when many threads are runnable.
+    New threads start at the smallest virtual runtime still runnable and wait for
+    the running slice to end.
+    """
+
+    def __init__(self, target_latency: int = 24, min_granularity: int = 3) -> None:
+        super().__init__()
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+        # Waiting threads keyed by (virtual runtime, insertion order), so that
+        # threads with equal virtual runtime run first come first served
+        self.ready_queue = SkipList()
+        self.sequence = 0
+        self.total_weight = 0  # weight of the runnable threads, active one included
+        self.min_vruntime = 0  # never decreases, new threads start here
+        # Active thread state
+        self.vruntime = 0
+        self.weight = NICE_0_WEIGHT
+        self.slice = 0  # ticks the active thread may run before the next pick
+        self.time_used = 0  # ticks the active thread has run of its slice
+
+    def _enqueue(self, thread: Thread, vruntime: int) -> None:
+        self.ready_queue.insert((vruntime, self.sequence), thread)
+        self.sequence += 1
+
+    def _update_min_vruntime(self) -> None:
+        """Moves min_vruntime up to the smallest virtual runtime still runnable."""
+        candidates = []
+        if self.active_thread is not None:
+            candidates.append(self.vruntime)
+        first = self.ready_queue.min()
+        if first is not None:
+            candidates.append(first[0][0])
+        if candidates:
+            self.min_vruntime = max(self.min_vruntime, min(candidates))
+
+    def _slice(self) -> int:
+        """The active thread's share of the scheduling period, at least one tick."""
+        runnable = len(self.ready_queue) + 1
+        period = max(self.target_latency, runnable * self.min_granularity)
+        return max(1, period * self.weight // self.total_weight)
+
+    def admit(self, threads: list[Thread], time_step: int) -> None:
+        """
+        Newly arrived threads start at the smallest virtual runtime still runnable.
+        """
+        self._update_min_vruntime()
+        for th in threads:
+            self.total_weight += priority_weight(th.priority)
+            self._enqueue(th, self.min_vruntime)
+
+    def tick(self, time_step: int) -> Thread | None:
+        """
+        Completely Fair Scheduling
+        Once the active thread finished or used up its slice, run the thread with
+        the least virtual runtime for a new slice.
+        """
+        if self.active_thread and self.active_thread.is_finished():
+            self._update_min_vruntime()
+            self.total_weight -= self.weight
+            self.active_thread = None
+        elif self.active_thread and self.time_used >= self.slice:
+            self.trace(QUANTUM_EXPIRY, time_step, self.active_thread)
+            if self.ready_queue:
+                self._enqueue(self.active_thread, self.vruntime)
+                self.active_thread = None
+            else:
+                # Nothing else to run, start a new slice
+                self.slice = self._slice()
+                self.time_used = 0
+
+        if self.active_thread is None:
+            first = self.ready_queue.pop_min()
+            if first is None:
+                return None
+            (self.vruntime, _), self.active_thread = first
+            self.weight = priority_weight(self.active_thread.priority)
+            self.slice = self._slice()
+            self.time_used = 0
+
+        # Run active thread for one tick
+        self.active_thread.tick(time_step)
+        self.time_used += 1
+        self.vruntime += VRUNTIME_SCALE * NICE_0_WEIGHT // self.weight
+        return self.active_thread
+
+    def run_length(self) -> int:
+        """
+        The active thread runs until it finishes or its slice ends.
+        """
+        return min(self.active_thread.remaining, self.slice - self.time_used)
+
+    def advance(self, time_step: int, ticks: int) -> None:
+        super().advance(time_step, ticks)
+        self.time_used += ticks
+        self.vruntime += ticks * (VRUNTIME_SCALE * NICE_0_WEIGHT // self.weight)
+
+    def queue_lengths(self) -> dict[str, int]:
+        return {"ready": len(self.ready_queue)}
+
+    def steal(self) -> Thread | None:
+        """
+        Gives up the waiting thread with the most virtual runtime.
+        """
+        while self.ready_queue:
+            _, thread = self.ready_queue.pop_max()
+            self.total_weight -= priority_weight(thread.priority)
+            if not thread.is_finished():
+                return thread
+        return None
+
+    def reset(self):
+        super().reset()
+        self.ready_queue.clear()
+        self.sequence = 0
+        self.total_weight = 0
+        self.min_vruntime = 0
+        self.vruntime = 0
+        self.weight = NICE_0_WEIGHT
+        self.slice = 0
+        self.time_used = 0
@@ -1,27 +1,72 @@
+from collections import deque
 from .algorithm import Algorithm
 from thread_handling.thread import Thread
 
 
 class FCFS(Algorithm):
-    def tick(self, threads: list[Thread], time_step: int) -> Thread | None:
+    preemptive = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ready_queue = deque()  # threads in arrival order
+
+    def admit(self, threads: list[Thread], time_step: int) -> None:
+        """
+        Threads are admitted in arrival order, so the queue stays sorted by arrival.
+        """
+        self.ready_queue.extend(threads)
+
+    def tick(self, time_step: int) -> Thread | None:
         """
         Runs the FCFS scheduling algorithm for the current tick. FCFS selects the thread that arrived first among the available threads.
         """
 
         # If there's no active thread or the active thread is finished, pick next thread.
         if self.active_thread is None or self.active_thread.is_finished():
-            # Get all non-finished threads
-            available = [
-                t for t in threads if (not t.is_finished()) and (t.arrival <= time_step)
-            ]
+            # Skip threads that have nothing left to run
+            while self.ready_queue and self.ready_queue[0].is_finished():
+                self.ready_queue.popleft()
             # If no available threads, return None
-            if not available:
+            if not self.ready_queue:
                 return None
             # Pick the one with the earliest arrival time
-            self.active_thread = min(available, key=lambda t: t.arrival)
+            self.active_thread = self.ready_queue.popleft()
 
         # Tick the active thread
         self.active_thread.tick(time_step)
 
         # Return the active thread
         return self.active_thread
+
+    def run_length(self) -> int:
+        """
+        FCFS never preempts, so the active thread runs until it finishes.
+        """
+        return self.active_thread.remaining
+
+    def queue_lengths(self) -> dict[str, int]:
+        return {"ready": len(self.ready_queue)}
+
+    def steal(self) -> Thread | None:
+        """
+        Gives up the most recently queued thread, the one that would wait longest here.
+        """
+        while self.ready_queue:
+            thread = self.ready_queue.pop()
+            if not thread.is_finished():
+                return thread
+        return None
+
+    def take(self) -> Thread | None:
+        """
+        Gives up the first queued thread, the one that would run next.
+        """
+        while self.ready_queue:
+            thread = self.ready_queue.popleft()
+            if not thread.is_finished():
+                return thread
+        return None
+
+    def reset(self):
+        super().reset()
+        self.ready_queue.clear()
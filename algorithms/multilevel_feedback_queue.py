@@ -0,0 +1,214 @@
+from collections import deque
+from .algorithm import Algorithm
+from thread_handling.thread import Thread
+from tracing import PREEMPT, QUANTUM_EXPIRY
+
+
+class MultilevelFeedbackQueue(Algorithm):
+    """
+    Multilevel feedback queue with `levels` round robin queues, level 0 first.
+    New threads enter level 0 and the quantum doubles with every level down, unless
+    `quanta` lists the quantum of every level, which then also sets their number.
+    A thread that uses up its quantum is demoted one level, the bottom level
+    rotates in place. A thread waiting on a higher level preempts the active one.
+
+    Aging promotes a thread one level once it has waited `aging` ticks on its level,
+    and every `boost_interval` ticks all threads are moved back to level 0.
+    Either is disabled when 0.
+
+    Non-empty levels are tracked in a bitmap, so the highest one is found in O(1)
+    from its lowest set bit, whatever the number of levels. Threads are queued in
+    time order, so the next one due for promotion is the oldest entry of a single
+    FIFO across the levels below the top and aging is O(1) amortized as well.
+    """
+
+    def __init__(
+        self,
+        quantum: int,
+        levels: int = 3,
+        boost_interval: int = 0,
+        aging: int = 0,
+        quanta: list[int] | None = None,
+    ) -> None:
+        super().__init__()
+        if quanta is None:
+            quanta = [quantum << level for level in range(levels)]
+        elif any(level_quantum < 1 for level_quantum in quanta):
+            raise ValueError("Every quantum must be at least 1 tick")
+        levels = len(quanta)
+        if levels < 1:
+            raise ValueError("At least one level is needed")
+        self.quantum = quanta[0]  # Quantum of level 0
+        self.quanta = list(quanta)
+        self.boost_interval = boost_interval
+        self.aging = aging
+        # Waiting threads of every level as (thread, queued since, ticks used on level)
+        self.queues: list[deque[tuple[Thread, int, int]]] = [
+            deque() for _ in range(levels)
+        ]
+        self.bitmap = 0  # bit i is set when level i has waiting threads
+        # (level, queue entry) of threads queued below level 0 in queue order, for aging.
+        # Entries of threads that left their level are dropped once they reach the front
+        self.waiting: deque[tuple[int, tuple[Thread, int, int]]] = deque()
+        self.level = 0  # level of the active thread
+        self.time_used = 0  # ticks the active thread has used on its level
+        self.time_step = 0  # time of the last tick
+
+    def _push(self, level: int, thread: Thread, since: int, used: int = 0) -> None:
+        entry = (thread, since, used)
+        self.queues[level].append(entry)
+        self.bitmap |= 1 << level
+        if level and self.aging:
+            self.waiting.append((level, entry))
+
+    def _pop(self, level: int) -> tuple[Thread, int, int]:
+        queue = self.queues[level]
+        entry = queue.popleft()
+        if not queue:
+            self.bitmap &= ~(1 << level)
+        return entry
+
+    def _highest_level(self) -> int:
+        """The highest level with waiting threads, -1 if there is none."""
+        return (self.bitmap & -self.bitmap).bit_length() - 1
+
+    def _oldest_waiting(self) -> tuple[int, tuple[Thread, int, int]] | None:
+        """The thread that has waited longest below level 0 as (level, entry), or None."""
+        waiting = self.waiting
+        while waiting:
+            level, entry = waiting[0]
+            # Still queued on its level, then nothing older is queued there
+            queue = self.queues[level]
+            if queue and queue[0] is entry:
+                return level, entry
+            waiting.popleft()
+        return None
+
+    def _next_aging(self) -> int | None:
+        """When the next waiting thread is due for promotion, or None."""
+        oldest = self._oldest_waiting()
+        return oldest[1][1] + self.aging if oldest else None
+
+    def _boost(self, time_step: int) -> None:
+        """Moves every thread back to level 0, waiting threads keep their order."""
+        waiting = [thread for queue in self.queues for thread, _, _ in queue]
+        for queue in self.queues:
+            queue.clear()
+        self.bitmap = 0
+        self.waiting.clear()
+        for thread in waiting:
+            self._push(0, thread, time_step)
+        self.level = 0
+        self.time_used = 0
+
+    def _age(self, time_step: int) -> None:
+        """
+        Promotes every waiting thread that has waited `aging` ticks on its level,
+        in the order they were queued.
+        """
+        while True:
+            oldest = self._oldest_waiting()
+            if oldest is None or oldest[1][1] + self.aging > time_step:
+                return
+            level = oldest[0]
+            thread, _, _ = self._pop(level)
+            self._push(level - 1, thread, time_step)
+
+    def admit(self, threads: list[Thread], time_step: int) -> None:
+        """
+        Newly arrived threads join the back of level 0.
+        """
+        for th in threads:
+            self._push(0, th, time_step)
+
+    def tick(self, time_step: int) -> Thread | None:
+        """
+        Multilevel Feedback Queue
+        Boosts and ages waiting threads, demotes the active thread once its quantum
+        expires and preempts it for a thread waiting on a higher level, then runs the
+        first thread of the highest non-empty level.
+        """
+        self.time_step = time_step
+        if self.boost_interval and time_step and time_step % self.boost_interval == 0:
+            self._boost(time_step)
+        self._age(time_step)
+
+        # If active thread finished, clear it
+        if self.active_thread and self.active_thread.is_finished():
+            self.active_thread = None
+
+        # Quantum expired: move down one level, the bottom level rotates
+        if self.active_thread and self.time_used >= self.quanta[self.level]:
+            self.trace(QUANTUM_EXPIRY, time_step, self.active_thread)
+            level = min(self.level + 1, len(self.queues) - 1)
+            self._push(level, self.active_thread, time_step)
+            self.active_thread = None
+
+        highest = self._highest_level()
+        if self.active_thread and 0 <= highest < self.level:
+            # Preempted threads keep their level and the ticks used on it
+            self.trace(
+                PREEMPT, time_step, self.active_thread, self.queues[highest][0][0]
+            )
+            self._push(self.level, self.active_thread, time_step, self.time_used)
+            self.active_thread = None
+
+        if self.active_thread is None:
+            if highest < 0:
+                return None
+            self.active_thread, _, self.time_used = self._pop(highest)
+            self.level = highest
+
+        # Tick the active thread
+        self.active_thread.tick(time_step)
+        self.time_used += 1
+        return self.active_thread
+
+    def run_length(self) -> int:
+        """
+        The active thread runs until it finishes, its quantum expires or the next
+        boost or promotion, which may preempt it.
+        """
+        ticks = min(
+            self.active_thread.remaining, self.quanta[self.level] - self.time_used
+        )
+        next_tick = self.time_step + 1
+        if self.boost_interval:
+            boost = -(-next_tick // self.boost_interval) * self.boost_interval
+            ticks = min(ticks, boost - next_tick)
+        due = self._next_aging()
+        if due is not None:
+            ticks = min(ticks, due - next_tick)
+        return ticks
+
+    def advance(self, time_step: int, ticks: int) -> None:
+        super().advance(time_step, ticks)
+        self.time_used += ticks
+        self.time_step = time_step + ticks - 1
+
+    def queue_lengths(self) -> dict[str, int]:
+        return {f"level{level}": len(queue) for level, queue in enumerate(self.queues)}
+
+    def steal(self) -> Thread | None:
+        """
+        Gives up the most recently queued thread of the lowest non-empty level.
+        """
+        for level in reversed(range(len(self.queues))):
+            queue = self.queues[level]
+            while queue:
+                thread = queue.pop()[0]
+                if not queue:
+                    self.bitmap &= ~(1 << level)
+                if not thread.is_finished():
+                    return thread
+        return None
+
+    def reset(self):
+        super().reset()
+        for queue in self.queues:
+            queue.clear()
+        self.bitmap = 0
+        self.waiting.clear()
+        self.level = 0
+        self.time_used = 0
+        self.time_step = 0
@@ -1,6 +1,7 @@
 from collections import deque
 from .algorithm import Algorithm
 from thread_handling.thread import Thread
+from tracing import PREEMPT, QUANTUM_EXPIRY
 
 
 class MultilevelQueue(Algorithm):
@@ -8,8 +9,8 @@ class MultilevelQueue(Algorithm):
     def __init__(self, quantum: int, priority_threshold: int = 2) -> None:
         super().__init__()
         # Two queues: high priority (RR), low priority (FCFS)
-        self.high_queue = deque()  # RR queue (priority 1-2)
-        self.low_queue = deque()  # FCFS queue (priority >= 3)
+        self.high_queue = deque()  # RR queue (priority <= threshold)
+        self.low_queue = deque()  # FCFS queue (priority > threshold)
         self.priority_threshold = (
             priority_threshold  # Priority <= this goes to high queue
         )
@@ -18,45 +19,46 @@ class MultilevelQueue(Algorithm):
             0  # how long the active thread has used the CPU in the current quantum
         )
 
-    def _add_arrivals(self, threads: list[Thread], time_step: int):
+    def admit(self, threads: list[Thread], time_step: int) -> None:
         """
         Move newly arrived thread to an appropriate queue.
         """
         for th in threads:
-            if th.arrival == time_step:
-                if th.priority <= self.priority_threshold:
-                    self.high_queue.append(th)
-                else:
-                    self.low_queue.append(th)
+            if th.priority <= self.priority_threshold:
+                self.high_queue.append(th)
+            else:
+                self.low_queue.append(th)
 
-    def tick(self, threads: list[Thread], time_step: int) -> Thread | None:
+    def tick(self, time_step: int) -> Thread | None:
         """
         Multilevel Queue Scheduling Algorithm
-        High priority queue (priority 1-2) uses Round Robin
-        Low priority queue (priority >=3) uses FCFS
+        High priority queue (priority <= priority_threshold) uses Round Robin
+        Low priority queue (priority > priority_threshold) uses FCFS
         """
-        # Add newly arrived threads to appropriate queue
-        self._add_arrivals(threads, time_step)
-
         # If active thread finished, clear it
         if self.active_thread and self.active_thread.is_finished():
             self.active_thread = None
             self.time_used = 0
 
         # Preemptive low priority thread if a high_priority one arrives
-        if self.active_thread and self.active_thread.priority > 2:
+        if self.active_thread and self.active_thread.priority > self.priority_threshold:
             if self.high_queue:
+                self.trace(PREEMPT, time_step, self.active_thread, self.high_queue[0])
                 self.low_queue.append(self.active_thread)
                 self.active_thread = None
                 self.time_used = 0
 
         # Select from high queue
-        if self.high_queue or (self.active_thread and self.active_thread.priority <= 2):
+        if self.high_queue or (
+            self.active_thread
+            and self.active_thread.priority <= self.priority_threshold
+        ):
             # if no active thread, pick next from queue
             if self.active_thread is None:
                 self.active_thread = self.high_queue.popleft()
             # if quantum has expired
             elif self.time_used >= self.quantum:
+                self.trace(QUANTUM_EXPIRY, time_step, self.active_thread)
                 # Requeue if not finished
                 if not self.active_thread.is_finished():
                     self.high_queue.append(self.active_thread)
@@ -79,11 +81,42 @@ class MultilevelQueue(Algorithm):
         if self.active_thread:
             self.active_thread.tick(time_step)
             # Count Quantum only for high priority threads
-            if self.active_thread.priority <= 2:
+            if self.active_thread.priority <= self.priority_threshold:
                 self.time_used += 1
 
         return self.active_thread
 
+    def run_length(self) -> int:
+        """
+        High priority threads run until they finish or their quantum expires.
+        Low priority threads run to completion unless a high priority thread is waiting.
+        """
+        if self.active_thread.priority <= self.priority_threshold:
+            return min(self.active_thread.remaining, self.quantum - self.time_used)
+        if self.high_queue:
+            return 0
+        return self.active_thread.remaining
+
+    def advance(self, time_step: int, ticks: int) -> None:
+        super().advance(time_step, ticks)
+        # Count Quantum only for high priority threads
+        if self.active_thread.priority <= self.priority_threshold:
+            self.time_used += ticks
+
+    def queue_lengths(self) -> dict[str, int]:
+        return {"high": len(self.high_queue), "low": len(self.low_queue)}
+
+    def steal(self) -> Thread | None:
+        """
+        Gives up the most recently queued thread, low priority threads first.
+        """
+        for queue in (self.low_queue, self.high_queue):
+            while queue:
+                thread = queue.pop()
+                if not thread.is_finished():
+                    return thread
+        return None
+
     def reset(self):
         super().reset()
         self.high_queue.clear()
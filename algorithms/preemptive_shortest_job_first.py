@@ -1,35 +1,61 @@
 from .algorithm import Algorithm
+from .ready_queue import ReadyQueue
 from thread_handling.thread import Thread
+from tracing import PREEMPT
 
 
 class PreemptiveSJF(Algorithm):
-    def tick(self, threads: list[Thread], time_step: int) -> Thread | None:
+    def __init__(self) -> None:
+        super().__init__()
+        # Only waiting threads are queued, so their remaining time is fixed while queued
+        self.ready_queue = ReadyQueue(key=lambda th: (th.remaining, th.arrival))
+
+    def admit(self, threads: list[Thread], time_step: int) -> None:
+        for th in threads:
+            self.ready_queue.push(th)
+
+    def tick(self, time_step: int) -> Thread | None:
         """
         Preemptive Shortest Job First
         Always select a thread with the shortest remaining time.
         Preempts the currently running thread if a shorter one arrives.
-        Prints a message when a preemption occurs.
+        Traces a PREEMPT event when a preemption occurs.
         """
-        # Gather all arrived, non-finished threads
-        available = [
-            th for th in threads if th.arrival <= time_step and not th.is_finished()
-        ]
-        if not available:
-            return None  # No thread available
-
         # Pick the thread with the shortest remaining time
-        shortest = min(available, key=lambda th: (th.remaining, th.arrival))
+        if self.active_thread is None or self.active_thread.is_finished():
+            shortest = self.ready_queue.pop()
+            if shortest is None:
+                return None  # No thread available
+        else:
+            # Requeue the active thread and take the shortest one
+            shortest = self.ready_queue.push_pop(self.active_thread)
 
         # Preemption check
-        if (
-            self.active_thread is None
-            or self.active_thread.is_finished()
-            or self.active_thread is not shortest
-        ):
+        if shortest is not self.active_thread:
             if self.active_thread is not None:
-                print(f"Preempting {self.active_thread.thread_id} for {shortest.thread_id}")
+                self.trace(PREEMPT, time_step, self.active_thread, shortest)
             self.active_thread = shortest
 
         # Tick active thread
         self.active_thread.tick(time_step)
         return self.active_thread
+
+    def run_length(self) -> int:
+        """
+        Running only shrinks the active thread's remaining time, so it stays the
+        shortest thread until a new one arrives.
+        """
+        return self.active_thread.remaining
+
+    def queue_lengths(self) -> dict[str, int]:
+        return {"ready": len(self.ready_queue)}
+
+    def steal(self) -> Thread | None:
+        """
+        Gives up a waiting thread from the bottom of the ready queue.
+        """
+        return self.ready_queue.steal()
+
+    def reset(self):
+        super().reset()
+        self.ready_queue.clear()
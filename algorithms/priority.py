@@ -1,36 +1,59 @@
 from .algorithm import Algorithm
+from .ready_queue import ReadyQueue
 from thread_handling.thread import Thread
+from tracing import PREEMPT
 
 
 class Priority(Algorithm):
-    def tick(self, threads: list[Thread], time_step: int) -> Thread | None:
+    def __init__(self) -> None:
+        super().__init__()
+        self.ready_queue = ReadyQueue(key=lambda th: (th.priority, th.arrival))
+
+    def admit(self, threads: list[Thread], time_step: int) -> None:
+        for th in threads:
+            self.ready_queue.push(th)
+
+    def tick(self, time_step: int) -> Thread | None:
         """
         Preemptive Priority Scheduling Algorithm
         Pick the highest-priority (lowest number) thread that has arrived.
         If a new higher-priority thread arrives, preempt the current active thread.
         """
-        # Gather all threads that have arrived and not finished
-        available = [
-            th for th in threads if th.arrival <= time_step and not th.is_finished()
-        ]
-        if not available:
-            # no threads available to run this tick
-            self.active_thread = None
-            return None
-
         # Choose best thread based on priority, then arrival time
-        highest_priority_thread = min(
-            available, key=lambda th: (th.priority, th.arrival)
-        )
-
-        # Preempt if needed
-        if (
-            self.active_thread is None
-            or self.active_thread.is_finished()
-            or highest_priority_thread.priority < self.active_thread.priority
+        if self.active_thread is None or self.active_thread.is_finished():
+            self.active_thread = self.ready_queue.pop()
+            if self.active_thread is None:
+                # no threads available to run this tick
+                return None
+
+        # Preempt if a waiting thread has a higher priority
+        elif (
+            self.ready_queue
+            and self.ready_queue.peek().priority < self.active_thread.priority
         ):
-            self.active_thread = highest_priority_thread
+            self.trace(PREEMPT, time_step, self.active_thread, self.ready_queue.peek())
+            self.active_thread = self.ready_queue.push_pop(self.active_thread)
 
         # Run active thread for one tick
         self.active_thread.tick(time_step)
         return self.active_thread
+
+    def run_length(self) -> int:
+        """
+        Only a newly arrived higher-priority thread can preempt the active thread,
+        so without arrivals it runs to completion.
+        """
+        return self.active_thread.remaining
+
+    def queue_lengths(self) -> dict[str, int]:
+        return {"ready": len(self.ready_queue)}
+
+    def steal(self) -> Thread | None:
+        """
+        Gives up a waiting thread from the bottom of the ready queue.
+        """
+        return self.ready_queue.steal()
+
+    def reset(self):
+        super().reset()
+        self.ready_queue.clear()
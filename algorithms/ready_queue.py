@@ -0,0 +1,99 @@
+import heapq
+from typing import Callable
+
+from thread_handling.thread import Thread
+
+
+class ReadyQueue:
+    """
+    Binary min-heap of runnable threads ordered by a key function, e.g. (burst, arrival).
+    Ties are broken by the order in which threads were first admitted, so popping
+    returns the same thread as min() over the admitted threads would.
+    Finished threads are deleted lazily when they reach the top of the heap.
+
+    The admission order lives in the heap entries. The one thread taken out to run
+    keeps its order in `taken`, so that requeueing it with push_pop() does not move
+    it behind threads admitted later. Nothing is kept for threads that have left.
+    """
+
+    def __init__(self, key: Callable[[Thread], tuple]) -> None:
+        self.key = key
+        self.heap: list[tuple[tuple, int, Thread]] = []
+        self.admitted = 0  # threads admitted so far, the next admission order
+        self.taken: tuple[int, Thread] | None = None  # last thread popped, its order
+
+    def _entry(self, thread: Thread) -> tuple[tuple, int, Thread]:
+        """
+        Builds the heap entry for a thread from its current key.
+        """
+        if self.taken is not None and self.taken[1] is thread:
+            order = self.taken[0]
+        else:
+            order = self.admitted
+            self.admitted += 1
+        return (self.key(thread), order, thread)
+
+    def _take(self, entry: tuple[tuple, int, Thread]) -> Thread:
+        """
+        Remembers the order of a thread leaving the heap to run.
+        """
+        self.taken = (entry[1], entry[2])
+        return entry[2]
+
+    def _discard_finished(self) -> None:
+        """
+        Removes finished threads from the top of the heap.
+        """
+        while self.heap and self.heap[0][2].is_finished():
+            heapq.heappop(self.heap)
+
+    def push(self, thread: Thread) -> None:
+        """
+        Adds a thread to the queue in O(log n).
+        """
+        heapq.heappush(self.heap, self._entry(thread))
+
+    def peek(self) -> Thread | None:
+        """
+        Returns the best runnable thread without removing it, or None if there is none.
+        """
+        self._discard_finished()
+        return self.heap[0][2] if self.heap else None
+
+    def pop(self) -> Thread | None:
+        """
+        Removes and returns the best runnable thread, or None if there is none.
+        """
+        self._discard_finished()
+        return self._take(heapq.heappop(self.heap)) if self.heap else None
+
+    def push_pop(self, thread: Thread) -> Thread:
+        """
+        Adds a thread and returns the best runnable thread in a single O(log n) step.
+        Returns the given thread itself if nothing in the queue beats it.
+        """
+        self._discard_finished()
+        return self._take(heapq.heappushpop(self.heap, self._entry(thread)))
+
+    def steal(self) -> Thread | None:
+        """
+        Removes and returns a runnable thread from the bottom of the heap, or None.
+        Removing the last leaf keeps the heap valid, so this is O(1) per entry.
+        """
+        while self.heap:
+            thread = self.heap.pop()[2]
+            if not thread.is_finished():
+                return thread
+        return None
+
+    def clear(self) -> None:
+        self.heap.clear()
+        self.admitted = 0
+        self.taken = None
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __bool__(self) -> bool:
+        self._discard_finished()
+        return bool(self.heap)
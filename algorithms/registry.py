@@ -0,0 +1,50 @@
+from .algorithm import Algorithm
+from .first_come_first_serve import FCFS
+from .round_robin import RR
+from .shortest_job_first import SJF
+from .priority import Priority
+from .multilevel_queue import MultilevelQueue
+from .multilevel_feedback_queue import MultilevelFeedbackQueue
+from .completely_fair import CompletelyFair
+from .preemptive_shortest_job_first import PreemptiveSJF
+
+# Command-line name of every algorithm
+ALGORITHMS: dict[str, type[Algorithm]] = {
+    "fcfs": FCFS,
+    "sjf": SJF,
+    "priority": Priority,
+    "rr": RR,
+    "psjf": PreemptiveSJF,
+    "mlq": MultilevelQueue,
+    "mlfq": MultilevelFeedbackQueue,
+    "cfs": CompletelyFair,
+}
+
+# Constructor parameters each algorithm takes, in order
+ALGORITHM_PARAMS: dict[str, tuple[str, ...]] = {
+    "fcfs": (),
+    "sjf": (),
+    "priority": (),
+    "rr": ("quantum",),
+    "psjf": (),
+    "mlq": ("quantum", "priority_threshold"),
+    "mlfq": ("quantum", "levels", "boost_interval", "aging", "quanta"),
+    "cfs": ("target_latency", "min_granularity"),
+}
+
+
+def create_algorithm(name: str, **params) -> Algorithm:
+    """
+    Builds an algorithm from its command-line name. Parameters the algorithm
+    does not take are ignored, so one set of options can be used for any algorithm.
+    """
+    if name not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm '{name}'. Choose from: {', '.join(ALGORITHMS)}")
+    return ALGORITHMS[name](**algorithm_params(name, **params))
+
+
+def algorithm_params(name: str, **params) -> dict:
+    """
+    Returns only the parameters that the named algorithm takes.
+    """
+    return {key: params[key] for key in ALGORITHM_PARAMS[name] if key in params}
@@ -1,6 +1,7 @@
 from collections import deque
 from .algorithm import Algorithm
 from thread_handling.thread import Thread
+from tracing import QUANTUM_EXPIRY
 
 
 class RR(Algorithm):
@@ -12,17 +13,17 @@ class RR(Algorithm):
             0  # how long the active thread has used the CPU in the current quantum
         )
 
-    def tick(self, threads: list[Thread], time_step: int) -> Thread | None:
+    def admit(self, threads: list[Thread], time_step: int) -> None:
+        """
+        Newly arrived threads join the back of the ready queue.
+        """
+        self.ready_queue.extend(threads)
+
+    def tick(self, time_step: int) -> Thread | None:
         """
-        RR adds newly arrived threads to the ready queue.
         If the active thread finished or the quantum expired -> rotate.
         Run the active thread for one tick.
         """
-        # Add newly arrived threads to ready queue
-        for th in threads:
-            if th.arrival == time_step:
-                self.ready_queue.append(th)
-
         # If there is no active thread or it finished, get next thread from queue
         if self.active_thread is None or self.active_thread.is_finished():
             if self.active_thread and self.active_thread.is_finished():
@@ -36,6 +37,7 @@ class RR(Algorithm):
 
         # If quantum expired, rotate
         if self.time_used >= self.quantum:
+            self.trace(QUANTUM_EXPIRY, time_step, self.active_thread)
             # Put active thread back to queue if not finished
             if not self.active_thread.is_finished():
                 self.ready_queue.append(self.active_thread)
@@ -50,6 +52,29 @@ class RR(Algorithm):
         self.time_used += 1
         return self.active_thread
 
+    def run_length(self) -> int:
+        """
+        The active thread runs until it finishes or its quantum expires.
+        """
+        return min(self.active_thread.remaining, self.quantum - self.time_used)
+
+    def advance(self, time_step: int, ticks: int) -> None:
+        super().advance(time_step, ticks)
+        self.time_used += ticks
+
+    def queue_lengths(self) -> dict[str, int]:
+        return {"ready": len(self.ready_queue)}
+
+    def steal(self) -> Thread | None:
+        """
+        Gives up the most recently queued thread, the one that would wait longest here.
+        """
+        while self.ready_queue:
+            thread = self.ready_queue.pop()
+            if not thread.is_finished():
+                return thread
+        return None
+
     def reset(self):
         super().reset()
         self.ready_queue.clear()
@@ -1,9 +1,20 @@
 from .algorithm import Algorithm
+from .ready_queue import ReadyQueue
 from thread_handling.thread import Thread
 
 
 class SJF(Algorithm):
-    def tick(self, threads: list[Thread], time_step: int) -> Thread | None:
+    preemptive = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ready_queue = ReadyQueue(key=lambda th: (th.burst, th.arrival))
+
+    def admit(self, threads: list[Thread], time_step: int) -> None:
+        for th in threads:
+            self.ready_queue.push(th)
+
+    def tick(self, time_step: int) -> Thread | None:
         """
         Non-preemptive Shortest Job First Scheduling Algorithm
         Pick the thread with the shortest remaining time that has arrived
@@ -11,19 +22,36 @@ class SJF(Algorithm):
         """
         # If there is no active thread or it finished, pick next thread
         if self.active_thread is None or self.active_thread.is_finished():
-            if self.active_thread and self.active_thread.is_finished():
-                self.active_thread = None
-
-            # Gather all arrived and not finished threads
-            available = [
-                th for th in threads if th.arrival <= time_step and not th.is_finished()
-            ]
-            if not available:
+            # pick the one with the shortest burst time
+            self.active_thread = self.ready_queue.pop()
+            if self.active_thread is None:
                 return None
 
-            # pick the one with the shortest remaining time
-            self.active_thread = min(available, key=lambda th: (th.burst, th.arrival))
-
         # Run active thread for one tick
         self.active_thread.tick(time_step)
         return self.active_thread
+
+    def run_length(self) -> int:
+        """
+        SJF is non-preemptive, so the active thread runs to completion.
+        """
+        return self.active_thread.remaining
+
+    def queue_lengths(self) -> dict[str, int]:
+        return {"ready": len(self.ready_queue)}
+
+    def steal(self) -> Thread | None:
+        """
+        Gives up a waiting thread from the bottom of the ready queue.
+        """
+        return self.ready_queue.steal()
+
+    def take(self) -> Thread | None:
+        """
+        Gives up the thread at the top of the ready queue, the one that would run next.
+        """
+        return self.ready_queue.pop()
+
+    def reset(self):
+        super().reset()
+        self.ready_queue.clear()
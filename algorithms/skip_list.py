@@ -0,0 +1,127 @@
+import random
+from typing import Any
+
+MAX_LEVEL = 32
+
+
+class SkipList:
+    """
+    Sorted map from unique, comparable keys to values, kept as a skip list.
+    Inserting and removing a key take O(log n) expected time, and taking the
+    smallest key is O(1). Used where a ready queue needs its threads in order.
+    Nodes are lists: [key, value, next on level 0, next on level 1, ...].
+    """
+
+    def __init__(self, seed: int | None = 0) -> None:
+        self.head: list = [None, None] + [None] * MAX_LEVEL
+        self.level = 1  # levels in use
+        self.length = 0
+        # Node heights only affect speed, a fixed seed keeps runs repeatable
+        self.random = random.Random(seed)
+
+    def _predecessors(self, key: Any) -> list[list]:
+        """The last node before key on every level in use."""
+        update = [self.head] * self.level
+        node = self.head
+        for level in reversed(range(self.level)):
+            following = node[2 + level]
+            while following is not None and following[0] < key:
+                node = following
+                following = node[2 + level]
+            update[level] = node
+        return update
+
+    def insert(self, key: Any, value: Any) -> None:
+        """
+        Adds a key that is not in the list yet.
+        """
+        update = self._predecessors(key)
+        # Heights are geometric: each further level with probability 1/2
+        bits = self.random.getrandbits(MAX_LEVEL - 1) | 1 << (MAX_LEVEL - 1)
+        height = (bits & -bits).bit_length()
+        if height > self.level:
+            update.extend([self.head] * (height - self.level))
+            self.level = height
+        node = [key, value] + [None] * height
+        for level in range(height):
+            node[2 + level] = update[level][2 + level]
+            update[level][2 + level] = node
+        self.length += 1
+
+    def remove(self, key: Any) -> Any:
+        """
+        Removes a key and returns its value. Raises KeyError if it is not in the list.
+        """
+        update = self._predecessors(key)
+        node = update[0][2]
+        if node is None or node[0] != key:
+            raise KeyError(key)
+        for level in range(len(node) - 2):
+            update[level][2 + level] = node[2 + level]
+        self._shrink()
+        self.length -= 1
+        return node[1]
+
+    def _shrink(self) -> None:
+        while self.level > 1 and self.head[1 + self.level] is None:
+            self.level -= 1
+
+    def min(self) -> tuple[Any, Any] | None:
+        """
+        The smallest key and its value, or None if the list is empty.
+        """
+        node = self.head[2]
+        return None if node is None else (node[0], node[1])
+
+    def max(self) -> tuple[Any, Any] | None:
+        """
+        The largest key and its value, or None if the list is empty.
+        """
+        node = self.head
+        for level in reversed(range(self.level)):
+            while node[2 + level] is not None:
+                node = node[2 + level]
+        return None if node is self.head else (node[0], node[1])
+
+    def pop_min(self) -> tuple[Any, Any] | None:
+        """
+        Removes and returns the smallest key and its value, or None if the list is empty.
+        """
+        node = self.head[2]
+        if node is None:
+            return None
+        # The first node is the first on every level it reaches
+        for level in range(len(node) - 2):
+            self.head[2 + level] = node[2 + level]
+        self._shrink()
+        self.length -= 1
+        return node[0], node[1]
+
+    def pop_max(self) -> tuple[Any, Any] | None:
+        """
+        Removes and returns the largest key and its value, or None if the list is empty.
+        """
+        last = self.max()
+        if last is not None:
+            self.remove(last[0])
+        return last
+
+    def items(self):
+        """
+        Yields (key, value) pairs in key order.
+        """
+        node = self.head[2]
+        while node is not None:
+            yield node[0], node[1]
+            node = node[2]
+
+    def clear(self) -> None:
+        self.head[2:] = [None] * MAX_LEVEL
+        self.level = 1
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __bool__(self) -> bool:
+        return self.length > 0
@@ -0,0 +1,15 @@
+from .workloads import SHAPES, SIZES, benchmark_workload
+from .startup import measure_startup
+from .suite import compare_results, load_baseline, run_case, run_suite, save_baseline
+
+__all__ = [
+    "SHAPES",
+    "SIZES",
+    "benchmark_workload",
+    "compare_results",
+    "load_baseline",
+    "measure_startup",
+    "run_case",
+    "run_suite",
+    "save_baseline",
+]
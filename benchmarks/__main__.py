@@ -0,0 +1,266 @@
+import argparse
+import sys
+
+from algorithms.registry import ALGORITHMS
+from multicore.balancers import BALANCERS
+
+from .equivalence import (
+    SINGLE_CORE_BALANCERS,
+    rejects_algorithm,
+    single_core_mismatches,
+)
+from .startup import measure_startup
+from .streaming import HEAP_ALGORITHMS, measure_streaming
+from .suite import compare_results, load_baseline, run_suite, save_baseline
+from .workloads import SHAPES, SIZES
+
+
+def add_case_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the options selecting which benchmark cases to run.
+    """
+    parser.add_argument(
+        "--algorithms", nargs="+", choices=ALGORITHMS, metavar="ALGORITHM"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        help=f"thread counts (default {' '.join(map(str, SIZES))})",
+    )
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, metavar="SHAPE")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="runs per case, the best counts (default 3)",
+    )
+
+
+def run_cases(args: argparse.Namespace) -> list[dict]:
+    """
+    Runs the selected cases, printing one line per case as it completes.
+    """
+    results = []
+    print(
+        f"{'Algorithm':<10}{'Size':<10}{'Shape':<18}{'Seconds':<10}{'Ticks/s':<14}{'Events/s':<14}{'Peak MiB':<10}"
+    )
+    for result in run_suite(args.algorithms, args.sizes, args.shapes, args.repeat):
+        rss = result["peak_rss_mb"]
+        print(
+            f"{result['algorithm']:<10}{result['size']:<10}{result['shape']:<18}"
+            f"{result['seconds']:<10.3f}{result['ticks_per_second']:<14.0f}"
+            f"{result['events_per_second']:<14.0f}{rss if rss is None else round(rss, 1)!s:<10}"
+        )
+        results.append(result)
+    return results
+
+
+def startup(args: argparse.Namespace) -> None:
+    """
+    Times the CLI entry point and fails if it is over budget or imports chart libraries.
+    """
+    result = measure_startup(args.args, args.repeat)
+    print(f"Command: python {' '.join(result['command'])}")
+    print(f"Best {result['best_seconds']:.3f} s, mean {result['mean_seconds']:.3f} s")
+    print("Slowest imports:")
+    for module, seconds in result["slowest_imports"]:
+        print(f"  {seconds:>8.3f} s  {module}")
+
+    failures = []
+    if result["deferred_imported"]:
+        failures.append(
+            f"imported at startup: {', '.join(result['deferred_imported'])}"
+        )
+    if args.budget is not None and result["best_seconds"] > args.budget:
+        failures.append(f"slower than the {args.budget:g} s budget")
+    if failures:
+        print("FAILED: " + "; ".join(failures))
+        sys.exit(1)
+
+
+def multicore(args: argparse.Namespace) -> None:
+    """
+    Fails if one core of the multi-core simulator schedules differently from
+    Dispatcher for any algorithm and balancer, or if the global queue accepts a
+    preemptive algorithm.
+    """
+    failures = 0
+    for balancer in args.balancers:
+        for algorithm in args.algorithms:
+            if balancer == "global" and ALGORITHMS[algorithm].preemptive:
+                rejected = rejects_algorithm(algorithm, balancer)
+                print(
+                    f"{algorithm:<10}{balancer:<10}"
+                    + ("rejected, preemptive" if rejected else "accepted, preemptive")
+                )
+                failures += not rejected
+                continue
+            mismatches = single_core_mismatches(algorithm, balancer, args.workloads)
+            print(
+                f"{algorithm:<10}{balancer:<10}{len(mismatches)} of {args.workloads} differ"
+                + (f", e.g. seed {mismatches[0]}" if mismatches else "")
+            )
+            failures += bool(mismatches)
+    if failures:
+        print("FAILED: see the cases that differ or were accepted above")
+        sys.exit(1)
+
+
+def streaming(args: argparse.Namespace) -> None:
+    """
+    Streams workloads through each algorithm and fails if a simulation holds on to
+    more memory than the budget once every thread has finished.
+    """
+    print(
+        f"{'Algorithm':<10}{'Size':<10}{'Shape':<18}{'Retained MiB':<14}{'Peak MiB':<10}"
+    )
+    failures = []
+    for size in args.sizes:
+        for algorithm in args.algorithms:
+            result = measure_streaming(algorithm, size, args.shape)
+            print(
+                f"{algorithm:<10}{size:<10}{args.shape:<18}"
+                f"{result['retained_mb']:<14.2f}{result['peak_mb']:<10.2f}"
+            )
+            if result["retained_mb"] > args.budget:
+                failures.append(f"{algorithm} on {size} threads")
+    if failures:
+        print(f"FAILED: over the {args.budget:g} MiB budget: {', '.join(failures)}")
+        sys.exit(1)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark simulator throughput per algorithm and workload size.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    add_case_arguments(run_parser)
+    run_parser.add_argument("--output", "-o", help="save the results as a baseline")
+
+    compare_parser = commands.add_parser(
+        "compare", help="run the benchmarks and flag regressions against a baseline"
+    )
+    compare_parser.add_argument("baseline", help="baseline file from run --output")
+    add_case_arguments(compare_parser)
+    compare_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="allowed slowdown or memory growth as a fraction (default 0.1)",
+    )
+    compare_parser.add_argument("--output", "-o", help="also save the new results")
+
+    startup_parser = commands.add_parser(
+        "startup", help="time the startup of the main.py command line"
+    )
+    startup_parser.add_argument(
+        "args",
+        nargs="*",
+        default=["--help"],
+        help="main.py arguments to time (default --help)",
+    )
+    startup_parser.add_argument(
+        "--repeat", type=int, default=5, help="interpreter starts (default 5)"
+    )
+    startup_parser.add_argument(
+        "--budget", type=float, help="fail if the best startup takes longer (seconds)"
+    )
+
+    streaming_parser = commands.add_parser(
+        "streaming",
+        help="check that streaming simulations do not keep finished threads",
+    )
+    streaming_parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=ALGORITHMS,
+        default=list(HEAP_ALGORITHMS),
+        metavar="ALGORITHM",
+        help=f"(default {' '.join(HEAP_ALGORITHMS)})",
+    )
+    streaming_parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100_000],
+        help="thread counts (default 100000)",
+    )
+    streaming_parser.add_argument(
+        "--shape", choices=SHAPES, default="saturated-short", metavar="SHAPE"
+    )
+    streaming_parser.add_argument(
+        "--budget",
+        type=float,
+        default=4.0,
+        help="memory a finished simulation may still hold, in MiB (default 4)",
+    )
+
+    multicore_parser = commands.add_parser(
+        "multicore",
+        help="check that one core of the multi-core simulator matches Dispatcher",
+    )
+    multicore_parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=ALGORITHMS,
+        default=list(ALGORITHMS),
+        metavar="ALGORITHM",
+    )
+    multicore_parser.add_argument(
+        "--balancers",
+        nargs="+",
+        choices=BALANCERS,
+        default=list(SINGLE_CORE_BALANCERS),
+        metavar="BALANCER",
+        help=f"(default {' '.join(SINGLE_CORE_BALANCERS)})",
+    )
+    multicore_parser.add_argument(
+        "--workloads",
+        type=int,
+        default=100,
+        help="random workloads per case (default 100)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "multicore":
+        multicore(args)
+        return
+    if args.command == "startup":
+        startup(args)
+        return
+    if args.command == "streaming":
+        streaming(args)
+        return
+    if args.command == "compare":
+        baseline = load_baseline(args.baseline)
+        if not args.sizes:
+            # Only the sizes that are in the baseline can be compared
+            args.sizes = sorted({result["size"] for result in baseline})
+
+    results = run_cases(args)
+    if args.output:
+        save_baseline(results, args.output)
+    if args.command == "run":
+        return
+
+    rows = compare_results(baseline, results, args.tolerance)
+    print(f"\n{'Algorithm':<10}{'Size':<10}{'Shape':<18}{'Speed':<10}{'Memory':<10}")
+    for row in rows:
+        memory = row["memory_change"]
+        print(
+            f"{row['algorithm']:<10}{row['size']:<10}{row['shape']:<18}"
+            f"{row['speed_change']:<+10.1%}{'n/a' if memory is None else format(memory, '+.1%'):<10}"
+            f"{'REGRESSION' if row['regression'] else ''}"
+        )
+    regressions = sum(row["regression"] for row in rows)
+    print(f"\n{regressions} regression(s) in {len(rows)} compared case(s)")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import random
+
+from algorithms.registry import create_algorithm
+from dispatcher import Dispatcher
+from multicore.balancers import BALANCERS
+from multicore.dispatcher import MultiCoreDispatcher
+from thread_handling.thread import Thread
+
+from .suite import PARAMS
+from .workloads import SEED
+
+# Balancers that must schedule one core exactly like Dispatcher, global only for
+# the non-preemptive algorithms, which it is limited to
+SINGLE_CORE_BALANCERS = ("steal", "affinity", "global")
+
+
+def _results(threads: list[Thread]) -> list[tuple[int, int, int, int]]:
+    return [
+        (th.start_time, th.completion_time, th.waiting_time, th.turnaround_time)
+        for th in threads
+    ]
+
+
+def rejects_algorithm(algorithm: str, balancer: str) -> bool:
+    """
+    Whether MultiCoreDispatcher refuses to run the algorithm with the balancer.
+    """
+    try:
+        MultiCoreDispatcher(
+            [],
+            lambda: create_algorithm(algorithm, **PARAMS),
+            1,
+            BALANCERS[balancer](),
+            verbose=False,
+        )
+    except ValueError:
+        return True
+    return False
+
+
+def single_core_mismatches(
+    algorithm: str, balancer: str, workloads: int = 100, seed: int = SEED
+) -> list[int]:
+    """
+    Runs small random workloads, zero-burst threads and ties included, on one core of
+    MultiCoreDispatcher and on Dispatcher, and returns the seeds of the workloads
+    whose Gantt chart or per-thread results differ.
+    """
+    mismatches = []
+    for workload_seed in range(seed, seed + workloads):
+        rng = random.Random(workload_seed)
+        rows = [
+            (f"T{i}", rng.randint(0, 60), rng.randint(0, 15), rng.randint(0, 5))
+            for i in range(rng.randint(1, 30))
+        ]
+
+        threads = [Thread(*row) for row in rows]
+        single = Dispatcher(
+            threads, create_algorithm(algorithm, **PARAMS), verbose=False
+        )
+        single.run()
+
+        core_threads = [Thread(*row) for row in rows]
+        multi = MultiCoreDispatcher(
+            core_threads,
+            lambda: create_algorithm(algorithm, **PARAMS),
+            1,
+            BALANCERS[balancer](),
+            verbose=False,
+        )
+        multi.run()
+
+        if single.gantt_segments != multi.core_segments[0] or _results(
+            threads
+        ) != _results(core_threads):
+            mismatches.append(workload_seed)
+    return mismatches
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+MAIN = Path(__file__).resolve().parent.parent / "main.py"
+
+# Modules the CLI must not import until a chart is drawn
+DEFERRED_MODULES = ("pandas", "plotly")
+
+
+def _run_main(args: list[str], *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, str(MAIN), *args],
+        cwd=MAIN.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_times(args: list[str]) -> list[tuple[str, int, float]]:
+    """
+    Every module imported by `python main.py *args` as (name, nesting depth,
+    cumulative import seconds), parsed from python -X importtime.
+    """
+    modules = []
+    for line in _run_main(args, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the column header
+        # Nested imports are indented by two spaces per level
+        depth = (len(module) - len(module.lstrip()) - 1) // 2
+        modules.append((module.strip(), depth, int(cumulative) / 1e6))
+    return modules
+
+
+def measure_startup(args: list[str] | None = None, repeat: int = 5) -> dict:
+    """
+    Times `python main.py *args` (default --help) in fresh interpreters and reports
+    the best and mean wall time, the slowest top-level imports and which of the
+    DEFERRED_MODULES were imported anyway.
+    """
+    args = ["--help"] if args is None else args
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run_main(args)
+        timings.append(time.perf_counter() - start)
+
+    modules = import_times(args)
+    top_level = sorted(
+        ((name, seconds) for name, depth, seconds in modules if depth == 0),
+        key=lambda item: -item[1],
+    )
+    packages = {name.split(".")[0] for name, _, _ in modules}
+    return {
+        "command": ["main.py", *args],
+        "best_seconds": min(timings),
+        "mean_seconds": sum(timings) / len(timings),
+        "slowest_imports": top_level[:10],
+        "deferred_imported": [name for name in DEFERRED_MODULES if name in packages],
+    }
@@ -0,0 +1,40 @@
+import tracemalloc
+
+from algorithms.registry import create_algorithm
+from streaming_dispatcher import StreamingDispatcher
+from thread_handling.thread import Thread
+
+from .suite import PARAMS
+from .workloads import benchmark_workload
+
+# Algorithms whose ready queue is a heap, the ones that used to keep every thread
+HEAP_ALGORITHMS = ("sjf", "psjf", "priority")
+
+
+def measure_streaming(algorithm: str, size: int, shape: str) -> dict:
+    """
+    Streams a benchmark workload through StreamingDispatcher and reports how much
+    memory the simulation still holds once every thread has finished, and its peak.
+    Only allocations made while simulating are counted, not the workload itself, so
+    the retained memory should not grow with the number of threads.
+    """
+    rows = sorted(benchmark_workload(size, shape).rows(), key=lambda row: row[1])
+    threads = (Thread(*row) for row in rows)
+    dispatcher = StreamingDispatcher(
+        threads, create_algorithm(algorithm, **PARAMS), interval=10**9
+    )
+
+    tracemalloc.start()
+    try:
+        dispatcher.run()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "algorithm": algorithm,
+        "size": size,
+        "shape": shape,
+        "completed": dispatcher.arrival_index.count,
+        "retained_mb": retained / 2**20,
+        "peak_mb": peak / 2**20,
+    }
@@ -0,0 +1,151 @@
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+from algorithms.registry import ALGORITHMS, create_algorithm
+from dispatcher import Dispatcher
+
+from .workloads import SEED, SHAPES, SIZES, benchmark_workload
+
+try:
+    import resource
+except ImportError:  # Windows, peak RSS is not reported
+    resource = None
+
+BASELINE_VERSION = 1
+
+# Algorithm parameters used for every benchmark
+PARAMS = {"quantum": 4, "priority_threshold": 2}
+
+
+def peak_rss_mb() -> float | None:
+    """
+    Peak resident set size of the current process in MiB, if the platform reports it.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_case(algorithm: str, size: int, shape: str, repeat: int) -> dict:
+    """
+    Times one algorithm on one workload with the event-driven engine and returns the
+    best of `repeat` runs. Meant to run in a fresh process so that the peak RSS
+    belongs to this case alone.
+    """
+    threads = benchmark_workload(size, shape)
+    dispatcher = Dispatcher(
+        threads, create_algorithm(algorithm, **PARAMS), verbose=False
+    )
+
+    best = None
+    for _ in range(repeat):
+        dispatcher.reset()
+        events = 0
+        start = time.perf_counter()
+        while not dispatcher.is_finished():
+            dispatcher.step()
+            events += 1
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    ticks = dispatcher.time_step
+    return {
+        "algorithm": algorithm,
+        "size": size,
+        "shape": shape,
+        "seconds": best,
+        "ticks": ticks,
+        "events": events,
+        "ticks_per_second": ticks / best if best else 0,
+        "events_per_second": events / best if best else 0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_suite(
+    algorithms: list[str] | None = None,
+    sizes: list[int] | None = None,
+    shapes: list[str] | None = None,
+    repeat: int = 3,
+) -> Iterator[dict]:
+    """
+    Runs every (algorithm, size, shape) case one after another, each in its own
+    process, and yields the results as they complete.
+    """
+    cases = [
+        (algorithm, size, shape)
+        for size in sizes or SIZES
+        for shape in shapes or SHAPES
+        for algorithm in algorithms or ALGORITHMS
+    ]
+    # One case at a time so cases do not compete for CPU, a new process for each
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        for case in cases:
+            yield pool.submit(run_case, *case, repeat).result()
+
+
+def save_baseline(results: list[dict], filename: str) -> None:
+    """
+    Writes benchmark results with a description of the machine that produced them.
+    """
+    baseline = {
+        "version": BASELINE_VERSION,
+        "seed": SEED,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "results": results,
+    }
+    with open(filename, "w") as file:
+        json.dump(baseline, file, indent=2)
+        file.write("\n")
+
+
+def load_baseline(filename: str) -> list[dict]:
+    """
+    Reads the results of a file written by save_baseline.
+    """
+    with open(filename) as file:
+        baseline = json.load(file)
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported benchmark baseline version in '{filename}'")
+    return baseline["results"]
+
+
+def compare_results(
+    baseline: list[dict], current: list[dict], tolerance: float = 0.1
+) -> list[dict]:
+    """
+    Matches current results to the baseline by (algorithm, size, shape) and returns
+    one row per case with the relative change in throughput and memory. A case is a
+    regression when it is more than `tolerance` slower, or uses that much more memory.
+    """
+    previous = {(r["algorithm"], r["size"], r["shape"]): r for r in baseline}
+    rows = []
+    for result in current:
+        key = (result["algorithm"], result["size"], result["shape"])
+        if key not in previous:
+            continue
+        old = previous[key]
+        speed = result["ticks_per_second"] / old["ticks_per_second"] - 1
+        memory = None
+        if result["peak_rss_mb"] and old["peak_rss_mb"]:
+            memory = result["peak_rss_mb"] / old["peak_rss_mb"] - 1
+        rows.append(
+            {
+                "algorithm": key[0],
+                "size": key[1],
+                "shape": key[2],
+                "speed_change": speed,
+                "memory_change": memory,
+                "regression": speed < -tolerance
+                or (memory is not None and memory > tolerance),
+            }
+        )
+    return rows
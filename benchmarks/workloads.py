@@ -0,0 +1,37 @@
+from thread_handling.thread_generator import generate_threads
+from thread_handling.thread_table import ThreadTable
+
+# Workload sizes (number of threads) benchmarked by default
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+# Burst time ranges: many short threads, or a wide mix of short and long ones
+BURST_SHAPES: dict[str, tuple[int, int]] = {
+    "short": (1, 10),
+    "long": (1, 200),
+}
+
+# Arrival spread as a multiple of the total burst time, i.e. the inverse of the load:
+# a flood where nearly everything queues, a saturated CPU, and a half-idle CPU
+ARRIVAL_SHAPES: dict[str, float] = {
+    "flood": 0.05,
+    "saturated": 1.0,
+    "sparse": 2.0,
+}
+
+# Every workload shape, named "<arrival>-<burst>", e.g. "saturated-short"
+SHAPES = tuple(
+    f"{arrival}-{burst}" for arrival in ARRIVAL_SHAPES for burst in BURST_SHAPES
+)
+
+SEED = 2024  # fixed so every run benchmarks the same workloads
+
+
+def benchmark_workload(size: int, shape: str, seed: int = SEED) -> ThreadTable:
+    """
+    Builds the reproducible workload of a benchmark case.
+    """
+    arrival, burst = shape.split("-")
+    burst_range = BURST_SHAPES[burst]
+    mean_burst = sum(burst_range) / 2
+    max_arrival = max(1, int(size * mean_burst * ARRIVAL_SHAPES[arrival]))
+    return generate_threads(size, max_arrival, burst_range, (0, 5), seed=seed)
@@ -1,42 +1,206 @@
+from typing import Callable
+
 from thread_handling.thread import Thread
+from thread_handling.thread_table import ThreadTable
+from thread_handling.arrival_index import ArrivalIndex
 from algorithms import Algorithm
+from evaluation.online import LiveMetrics
+from tracing import ARRIVAL, COMPLETION, DISPATCH, IDLE, Tracer, console_tracer
+
+
+def record_segment(
+    segments: list[tuple[str, int, int]], thread_id: str, start: int, end: int
+) -> None:
+    """Appends a run to a Gantt chart, extending the last segment if it continues it."""
+    if segments:
+        last_id, last_start, last_end = segments[-1]
+        if last_id == thread_id and last_end == start:
+            segments[-1] = (thread_id, last_start, end)
+            return
+    segments.append((thread_id, start, end))
+
+
+def count_unfinished(threads: list[Thread]) -> int:
+    """Number of threads with execution time left."""
+    if isinstance(threads, ThreadTable):
+        return int((threads.remaining > 0).sum())
+    return sum(1 for th in threads if not th.is_finished())
 
 
 class Dispatcher:
     """
     Manages the scheduling and execution of threads using a specified algorithm.
+    Runs, idle time, arrivals, completions and the algorithm's decisions are recorded
+    by the tracer; a verbose dispatcher without one prints them as they happen.
     """
 
-    def __init__(self, threads: list[Thread], algorithm: Algorithm) -> None:
+    def __init__(
+        self,
+        threads: list[Thread],
+        algorithm: Algorithm,
+        verbose: bool = True,
+        tracer: Tracer | None = None,
+    ) -> None:
         self.time_step: int = 0  # Current time step of the simulation
         self.threads: list[Thread] = threads  # All threads to be scheduled
         self.algorithm: Algorithm = algorithm  # Scheduling algorithm to use
-        self.gantt_chart: list[tuple[str, int]] = []  # List to store Gantt chart data
+        self.verbose: bool = verbose  # Print every tick and scheduling decision
+        if tracer is None and verbose:
+            tracer = console_tracer()
+        self.tracer: Tracer | None = tracer  # Records the simulation's events, if any
+        self.algorithm.tracer = tracer
+        # Gantt chart data as (thread_id, start, end) runs, end exclusive
+        self.gantt_segments: list[tuple[str, int, int]] = []
+        self.arrival_index = ArrivalIndex(threads)  # Threads sorted by arrival time
+        self.current_thread: Thread | None = None  # Thread run by the last tick or step
+        # Busy time, context switches and metric sums, kept up to date as the CPU runs
+        self.live = LiveMetrics()
+        self.unfinished: int = count_unfinished(threads)  # Threads left to complete
+        # Called with every thread as it completes, see on_completion()
+        self.completion_listeners: list[Callable[[Thread], None]] = []
+
+    def _admit_arrivals(self, time_step: int) -> None:
+        """Passes the threads arriving at time_step to the algorithm."""
+        arrivals = self.arrival_index.pop_arrivals(time_step)
+        if arrivals:
+            self._admit(arrivals, time_step)
+
+    def _admit(self, arrivals: list[Thread], time_step: int) -> None:
+        """Traces the arrival of threads and hands them to the algorithm."""
+        trace = self.tracer
+        if trace is not None and trace.enabled & ARRIVAL:
+            for th in arrivals:
+                trace.emit(ARRIVAL, time_step, th.thread_id)
+        self.algorithm.admit(arrivals, time_step)
+
+    def _record(self, thread_id: str, start: int, end: int) -> None:
+        """Logs a run in the Gantt chart and the live metrics."""
+        self.live.record_run(thread_id, start, end)
+        record_segment(self.gantt_segments, thread_id, start, end)
+
+    def _complete(self, thread: Thread) -> None:
+        """Called once for every thread with burst time when it completes."""
+        self.unfinished -= 1
+        self.live.complete(thread)
+        trace = self.tracer
+        if trace is not None and trace.enabled & COMPLETION:
+            trace.emit(COMPLETION, thread.completion_time, thread.thread_id)
+        for listener in self.completion_listeners:
+            listener(thread)
+
+    def on_completion(self, listener: Callable[[Thread], None]) -> None:
+        """
+        Calls listener(thread) whenever a thread completes, right after the tick or
+        step that ran its last tick, with its completion_time and metrics set.
+        """
+        self.completion_listeners.append(listener)
+
+    @property
+    def gantt_chart(self) -> list[tuple[str, int]]:
+        """The Gantt chart expanded back to one (thread_id, time) entry per tick."""
+        return [
+            (thread_id, t)
+            for thread_id, start, end in self.gantt_segments
+            for t in range(start, end)
+        ]
 
     def tick(self) -> None:
         """Advances the simulation by one time step."""
+        # Hand newly arrived threads to the algorithm
+        self._admit_arrivals(self.time_step)
+
         # Get currently active thread from the algorithm
-        current_thread = self.algorithm.tick(self.threads, self.time_step)
+        current_thread = self.current_thread = self.algorithm.tick(self.time_step)
 
         # Log the current thread in the Gantt chart
+        trace = self.tracer
         if current_thread:
-            print(f"Time {self.time_step}: Running Thread {current_thread.thread_id}")
-            self.gantt_chart.append((current_thread.thread_id, self.time_step))
+            if trace is not None and trace.enabled & DISPATCH:
+                trace.emit(DISPATCH, self.time_step, current_thread.thread_id)
+            self._record(current_thread.thread_id, self.time_step, self.time_step + 1)
         # If no thread is active, log idle time
         else:
-            print(f"Time {self.time_step}: CPU IDLE")
-            self.gantt_chart.append(("IDLE", self.time_step))
+            if trace is not None and trace.enabled & IDLE:
+                trace.emit(IDLE, self.time_step)
+            self._record("IDLE", self.time_step, self.time_step + 1)
 
         # Advance time step
         self.time_step += 1
+        if current_thread and current_thread.completion_time == self.time_step:
+            if current_thread.burst > 0:
+                self._complete(current_thread)
+
+    def step(self) -> int:
+        """
+        Advances the simulation to the next scheduling event (arrival, completion,
+        quantum expiry or preemption point) and returns the number of ticks simulated.
+        Produces the same Gantt chart and thread metrics as calling tick() repeatedly.
+        """
+        start = self.time_step
+
+        # Let the algorithm make its decision and run the first tick
+        self._admit_arrivals(start)
+        current_thread = self.current_thread = self.algorithm.tick(start)
+
+        # Nothing that the algorithm has not seen can happen before the next arrival
+        next_arrival = self.arrival_index.next_arrival()
+
+        trace = self.tracer
+        if current_thread:
+            # Run the thread for as long as the algorithm allows, up to the next arrival
+            ticks = 1 + max(0, self.algorithm.run_length())
+            if next_arrival is not None:
+                ticks = min(ticks, next_arrival - start)
+            if ticks > 1:
+                self.algorithm.advance(start + 1, ticks - 1)
+            thread_id = current_thread.thread_id
+            if trace is not None and trace.enabled & DISPATCH:
+                trace.emit(DISPATCH, start, thread_id, length=ticks)
+        else:
+            # The CPU stays idle until the next thread arrives
+            ticks = next_arrival - start if next_arrival is not None else 1
+            thread_id = "IDLE"
+            if trace is not None and trace.enabled & IDLE:
+                trace.emit(IDLE, start, length=ticks)
+
+        # Log the whole run in the Gantt chart
+        self._record(thread_id, start, start + ticks)
+
+        # Advance time step
+        self.time_step += ticks
+        if current_thread and current_thread.completion_time == self.time_step:
+            if current_thread.burst > 0:
+                self._complete(current_thread)
+        return ticks
+
+    def run(self) -> None:
+        """Runs the simulation to completion using the event-driven engine."""
+        while not self.is_finished():
+            self.step()
+        if self.tracer is not None:
+            self.tracer.flush()
+
+    def live_metrics(self) -> dict:
+        """
+        Metrics of the threads completed so far, keyed like calculate_metrics, in O(1).
+        """
+        return self.live.snapshot(self.time_step)
 
     def reset(self) -> None:
         """Resets the dispatcher and all threads for a new simulation."""
         self.time_step = 0
+        self.current_thread = None
+        self.gantt_segments.clear()
+        self.live.reset()
+        self.arrival_index.reset()
         self.algorithm.reset()
-        for thread in self.threads:
-            thread.reset()
+        if isinstance(self.threads, ThreadTable):
+            self.threads.reset()
+        else:
+            for thread in self.threads:
+                thread.reset()
+        self.unfinished = count_unfinished(self.threads)
 
     def is_finished(self) -> bool:
-        """Checks if all threads have finished execution."""
-        return all(th.is_finished() for th in self.threads)
+        """Checks if all threads have finished execution, in O(1)."""
+        return self.unfinished == 0
@@ -1,4 +1,37 @@
-from .metrics import calculate_metrics
-from .visualize import display_gantt_chart, print_metrics_table
+from .metrics import calculate_metrics, priority_breakdown
+from .online import OnlineMetric, QuantileSketch, RunningStats
+from .gantt import aggregate_segments, gantt_figure, render_gantt, thread_color
+from .text_chart import print_text_gantt, text_gantt
+from .export import thread_results, write_metrics_csv, write_metrics_json
+from .columnar import ThreadResultWriter, read_thread_results
+from .visualize import (
+    display_core_gantt_chart,
+    display_gantt_chart,
+    print_comparison_table,
+    print_metrics_table,
+    print_priority_breakdown,
+)
 
-__all__ = ["calculate_metrics", "display_gantt_chart", "print_metrics_table"]
+__all__ = [
+    "aggregate_segments",
+    "calculate_metrics",
+    "OnlineMetric",
+    "QuantileSketch",
+    "RunningStats",
+    "display_core_gantt_chart",
+    "display_gantt_chart",
+    "gantt_figure",
+    "print_comparison_table",
+    "print_metrics_table",
+    "print_priority_breakdown",
+    "print_text_gantt",
+    "priority_breakdown",
+    "read_thread_results",
+    "render_gantt",
+    "text_gantt",
+    "thread_color",
+    "ThreadResultWriter",
+    "thread_results",
+    "write_metrics_csv",
+    "write_metrics_json",
+]
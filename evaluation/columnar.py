@@ -0,0 +1,199 @@
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from thread_handling.thread import Thread
+from thread_handling.thread_table import ThreadTable
+
+# Integer columns of a thread result row, after the thread ID
+RESULT_FIELDS = (
+    "arrival",
+    "burst",
+    "priority",
+    "start_time",
+    "completion_time",
+    "waiting_time",
+    "turnaround_time",
+)
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class ThreadResultWriter:
+    """
+    Writes the results of threads as they complete into a columnar file, NumPy .npz
+    or Parquet (.parquet, needs pyarrow), one row per thread in completion order with
+    the thread_results() fields. Pass it to Dispatcher.on_completion().
+
+    Threads without burst time are finished on arrival and never complete. They are
+    written last, on close(), from the workload passed to it or the threads seen by
+    watch(), so the file has a row for every thread like thread_results().
+
+    Rows are collected chunk_size at a time in preallocated arrays and then written
+    out, so memory stays flat however many threads complete. An .npz file is
+    assembled from the spilled chunks on close(), column by column.
+    """
+
+    def __init__(self, filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.filename = filename
+        self.format = Path(filename).suffix.lower()
+        if self.format not in (".npz", ".parquet"):
+            raise ValueError(
+                f"Unsupported results file '{filename}', use .npz or .parquet"
+            )
+        self.chunk_size = chunk_size
+        self.rows = 0  # rows written so far, the current chunk included
+        self.zero_burst: list[Thread] = []  # threads seen by watch() that never run
+        # Current chunk
+        self.thread_ids: list[str] = []
+        self.chunk = {name: np.empty(chunk_size, np.int64) for name in RESULT_FIELDS}
+
+        if self.format == ".parquet":
+            # Imported now so that a missing pyarrow fails before the simulation runs
+            import pyarrow.parquet  # noqa: F401
+
+            self.parquet = None  # opened with the first chunk
+        else:
+            # Every column is spilled to its own file, thread IDs as UTF-8 with lengths
+            self.spill = tempfile.TemporaryDirectory(
+                dir=Path(filename).resolve().parent
+            )
+            self.columns = {
+                name: open(os.path.join(self.spill.name, name), "wb")
+                for name in RESULT_FIELDS + ("id_lengths", "id_bytes")
+            }
+            self.id_width = 1
+
+    def __call__(self, thread: Thread) -> None:
+        index = len(self.thread_ids)
+        self.thread_ids.append(thread.thread_id)
+        chunk = self.chunk
+        chunk["arrival"][index] = thread.arrival
+        chunk["burst"][index] = thread.burst
+        chunk["priority"][index] = thread.priority
+        chunk["start_time"][index] = thread.start_time
+        chunk["completion_time"][index] = thread.completion_time
+        chunk["waiting_time"][index] = thread.waiting_time
+        chunk["turnaround_time"][index] = thread.turnaround_time
+        self.rows += 1
+        if index + 1 == self.chunk_size:
+            self.flush()
+
+    def write_threads(self, threads: list[Thread]) -> None:
+        """Writes the results of threads that have already completed."""
+        for thread in threads:
+            self(thread)
+
+    def watch(self, threads: Iterable[Thread]) -> Iterator[Thread]:
+        """
+        Passes a stream of threads through, keeping the ones without burst time for
+        close(), e.g. when the workload is not in memory to pass to close() itself.
+        """
+        for thread in threads:
+            if thread.burst == 0:
+                self.zero_burst.append(thread)
+            yield thread
+
+    def flush(self) -> None:
+        """Writes out the rows collected so far."""
+        count = len(self.thread_ids)
+        if not count:
+            return
+        columns = {name: self.chunk[name][:count] for name in RESULT_FIELDS}
+        if self.format == ".parquet":
+            self._write_parquet(columns)
+        else:
+            encoded = [thread_id.encode("utf-8") for thread_id in self.thread_ids]
+            lengths = np.fromiter(map(len, encoded), np.int64, count)
+            self.id_width = max(self.id_width, int(lengths.max()))
+            lengths.astype("<i8").tofile(self.columns["id_lengths"])
+            self.columns["id_bytes"].write(b"".join(encoded))
+            for name in RESULT_FIELDS:
+                columns[name].astype("<i8").tofile(self.columns[name])
+        self.thread_ids = []
+
+    def _write_parquet(self, columns: dict[str, np.ndarray]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.table({"thread_id": self.thread_ids, **columns})
+        if self.parquet is None:
+            self.parquet = pq.ParquetWriter(self.filename, table.schema)
+        self.parquet.write_table(table)
+
+    def close(self, threads: list[Thread] = ()) -> None:
+        """
+        Writes the remaining rows, then those of the threads without burst time seen
+        by watch() or among threads, the simulated workload, and completes the file.
+        """
+        if isinstance(threads, ThreadTable):
+            threads = threads.views(np.flatnonzero(threads.burst == 0))
+        self.write_threads(self.zero_burst)
+        self.write_threads([thread for thread in threads if thread.burst == 0])
+        self.flush()
+        if self.format == ".parquet":
+            if self.parquet is None:
+                self._write_parquet(
+                    {name: np.empty(0, np.int64) for name in RESULT_FIELDS}
+                )
+            self.parquet.close()
+            return
+        for file in self.columns.values():
+            file.close()
+        try:
+            self._assemble_npz()
+        finally:
+            self.spill.cleanup()
+
+    def _assemble_npz(self) -> None:
+        """Copies the spilled columns into the .npz file, chunk_size rows at a time."""
+        spilled = {name: file.name for name, file in self.columns.items()}
+        with zipfile.ZipFile(self.filename, "w", allowZip64=True) as archive:
+            # Thread IDs are padded to the longest one, like a NumPy bytes array
+            id_dtype = np.dtype(f"S{self.id_width}")
+            with open(spilled["id_lengths"], "rb") as lengths, open(
+                spilled["id_bytes"], "rb"
+            ) as source, archive.open("thread_id.npy", "w", force_zip64=True) as member:
+                _write_npy_header(member, id_dtype, self.rows)
+                for start in range(0, self.rows, self.chunk_size):
+                    count = min(self.chunk_size, self.rows - start)
+                    chunk = np.fromfile(lengths, "<i8", count)
+                    data = source.read(int(chunk.sum()))
+                    offsets = np.concatenate(([0], np.cumsum(chunk))).tolist()
+                    ids = np.array(
+                        [data[a:b] for a, b in zip(offsets[:-1], offsets[1:])],
+                        dtype=id_dtype,
+                    )
+                    member.write(ids.tobytes())
+            for name in RESULT_FIELDS:
+                with open(spilled[name], "rb") as source, archive.open(
+                    f"{name}.npy", "w", force_zip64=True
+                ) as member:
+                    _write_npy_header(member, np.dtype("<i8"), self.rows)
+                    while data := source.read(self.chunk_size * 8):
+                        member.write(data)
+
+
+def _write_npy_header(file, dtype: np.dtype, rows: int) -> None:
+    """Writes the header of a one-dimensional .npy array, its data follows."""
+    header = {"descr": dtype.str, "fortran_order": False, "shape": (rows,)}
+    np.lib.format.write_array_header_1_0(file, header)
+
+
+def read_thread_results(filename: str) -> dict[str, np.ndarray]:
+    """
+    Loads a file written by ThreadResultWriter as one array per column, with the
+    thread IDs decoded to strings.
+    """
+    if Path(filename).suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(filename)
+        return {name: table[name].to_numpy() for name in table.column_names}
+    with np.load(filename) as archive:
+        columns = {name: archive[name] for name in archive.files}
+    columns["thread_id"] = np.char.decode(columns["thread_id"], "utf-8")
+    return {"thread_id": columns.pop("thread_id"), **columns}
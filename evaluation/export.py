@@ -0,0 +1,43 @@
+import csv
+import json
+from typing import TextIO
+
+from thread_handling.thread import Thread
+
+
+def thread_results(threads: list[Thread]) -> list[dict]:
+    """
+    Per-thread results as plain dictionaries, ready to be serialized.
+    """
+    return [
+        {
+            "thread_id": th.thread_id,
+            "arrival": th.arrival,
+            "burst": th.burst,
+            "priority": th.priority,
+            "start_time": th.start_time,
+            "completion_time": th.completion_time,
+            "waiting_time": th.waiting_time,
+            "turnaround_time": th.turnaround_time,
+        }
+        for th in threads
+    ]
+
+
+def write_metrics_json(result: dict | list[dict], file: TextIO) -> None:
+    """
+    Writes one or more simulation results as JSON.
+    """
+    json.dump(result, file, indent=2)
+    file.write("\n")
+
+
+def write_metrics_csv(rows: list[dict], file: TextIO) -> None:
+    """
+    Writes flat result rows (e.g. algorithm, parameters and metrics) as CSV.
+    The header is the union of all row keys in first-seen order.
+    """
+    fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    writer = csv.DictWriter(file, fieldnames=fieldnames, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
@@ -0,0 +1,278 @@
+import colorsys
+import zlib
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+DEFAULT_BUCKETS = 500  # Time buckets across the visible window
+DEFAULT_MAX_ROWS = 40  # Drawn rows, including the row grouping the other threads
+EXACT_SEGMENT_LIMIT = 5000  # Windows with at most this many segments are drawn exactly
+OTHER_COLOR = "#9e9e9e"
+STATIC_IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".svg", ".pdf")
+
+
+def thread_color(thread_id: str) -> str:
+    """
+    Hex colour derived from a hash of the thread ID, so a thread has the same colour
+    in every chart and every run.
+    """
+    hue = zlib.crc32(str(thread_id).encode("utf-8")) / 0xFFFFFFFF
+    red, green, blue = colorsys.hls_to_rgb(hue, 0.5, 0.65)
+    return "#{:02x}{:02x}{:02x}".format(
+        round(red * 255), round(green * 255), round(blue * 255)
+    )
+
+
+def _window_segments(
+    segments: list[tuple[str, int, int]], start: int | None, end: int | None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[str], int, int]:
+    """
+    The busy segments overlapping [start, end) clipped to the window, as arrays of
+    thread codes, starts and ends, with the thread ID of every code and the resolved
+    window bounds. Idle time is not drawn. IDs are coded with a dict in one pass,
+    which is much faster than sorting millions of strings.
+    """
+    codes: dict[str, int] = {}
+    count = len(segments)
+    threads = np.fromiter(
+        (codes.setdefault(segment[0], len(codes)) for segment in segments),
+        np.int64,
+        count,
+    )
+    starts = np.fromiter((segment[1] for segment in segments), np.int64, count)
+    ends = np.fromiter((segment[2] for segment in segments), np.int64, count)
+
+    busy = threads != codes.get("IDLE", -1)
+    if start is None:
+        start = int(starts[busy].min()) if busy.any() else 0
+    if end is None:
+        end = int(ends[busy].max()) if busy.any() else start
+    visible = busy & (ends > start) & (starts < end)
+    return (
+        threads[visible],
+        np.maximum(starts[visible], start),
+        np.minimum(ends[visible], end),
+        list(codes),
+        start,
+        end,
+    )
+
+
+def _assign_rows(
+    threads: np.ndarray,
+    thread_ids: list[str],
+    starts: np.ndarray,
+    ends: np.ndarray,
+    max_rows: int,
+) -> tuple[np.ndarray, list[str], int]:
+    """
+    Maps every segment to a drawn row. If more threads ran than max_rows, the
+    max_rows - 1 busiest get a row each and the rest share a final "Other" row.
+    Rows are ordered by first run. Returns the row of every segment, the row labels
+    and the number of grouped threads.
+    """
+    busy = np.bincount(threads, weights=ends - starts, minlength=len(thread_ids))
+    first_run = np.full(len(thread_ids), np.iinfo(np.int64).max)
+    np.minimum.at(first_run, threads, starts)
+
+    ran = np.flatnonzero(np.bincount(threads, minlength=len(thread_ids)))
+    grouped = 0
+    if len(ran) > max_rows:
+        kept = ran[np.argsort(-busy[ran], kind="stable")[: max_rows - 1]]
+        grouped = len(ran) - len(kept)
+    else:
+        kept = ran
+    kept = kept[np.argsort(first_run[kept], kind="stable")]
+
+    # Threads without a row of their own go to the last row
+    row_of_thread = np.full(len(thread_ids), len(kept))
+    row_of_thread[kept] = np.arange(len(kept))
+    row_labels = [thread_ids[code] for code in kept.tolist()]
+    if grouped:
+        row_labels.append(f"Other ({grouped} threads)")
+    return row_of_thread[threads], row_labels, grouped
+
+
+def _bucket_busy_time(
+    rows: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    row_count: int,
+    window_start: int,
+    width: int,
+    buckets: int,
+) -> np.ndarray:
+    """
+    Busy ticks of every row in every bucket, a (row_count, buckets) array.
+    A segment adds its partial first and last buckets directly and its full buckets
+    in between through a difference array, so long segments cost O(1).
+    """
+    busy = np.zeros(row_count * buckets, dtype=np.int64)
+    full = np.zeros((row_count, buckets + 1), dtype=np.int64)
+    relative_start = starts - window_start
+    relative_end = ends - window_start
+    first = relative_start // width
+    last = (relative_end - 1) // width
+
+    single = first == last
+    np.add.at(
+        busy,
+        rows[single] * buckets + first[single],
+        (relative_end - relative_start)[single],
+    )
+
+    spans = ~single
+    rows, first, last = rows[spans], first[spans], last[spans]
+    np.add.at(busy, rows * buckets + first, (first + 1) * width - relative_start[spans])
+    np.add.at(busy, rows * buckets + last, relative_end[spans] - last * width)
+    np.add.at(full, (rows, first + 1), width)
+    np.add.at(full, (rows, last), -width)
+
+    return busy.reshape(row_count, buckets) + np.cumsum(full, axis=1)[:, :-1]
+
+
+def _bucket_layout(start: int, end: int, buckets: int) -> tuple[int, int]:
+    """
+    Width of the time buckets covering [start, end) with at most `buckets` of them,
+    and their count.
+    """
+    width = max(1, -(-(end - start) // buckets))
+    return width, max(1, -(-(end - start) // width))
+
+
+def aggregate_segments(
+    segments: list[tuple[str, int, int]],
+    start: int | None = None,
+    end: int | None = None,
+    buckets: int = DEFAULT_BUCKETS,
+    max_rows: int = DEFAULT_MAX_ROWS,
+) -> dict:
+    """
+    Level-of-detail summary of the segments in the window [start, end) (default the
+    whole schedule): the window is split into at most `buckets` equal time buckets and
+    each drawn row gets its busy ticks per bucket. The amount of data depends only on
+    buckets and max_rows, not on the number of segments.
+    """
+    threads, starts, ends, thread_ids, start, end = _window_segments(
+        segments, start, end
+    )
+    rows, labels, grouped = _assign_rows(threads, thread_ids, starts, ends, max_rows)
+    width, count = _bucket_layout(start, end, buckets)
+    return {
+        "start": start,
+        "end": end,
+        "bucket_width": width,
+        "rows": labels,
+        "grouped_threads": grouped,
+        "segments": len(starts),
+        "busy": _bucket_busy_time(rows, starts, ends, len(labels), start, width, count),
+    }
+
+
+def _row_color(label: str, grouped: int, index: int, row_count: int) -> str:
+    return OTHER_COLOR if grouped and index == row_count - 1 else thread_color(label)
+
+
+def gantt_figure(
+    segments: list[tuple[str, int, int]],
+    start: int | None = None,
+    end: int | None = None,
+    buckets: int = DEFAULT_BUCKETS,
+    max_rows: int = DEFAULT_MAX_ROWS,
+    exact_limit: int = EXACT_SEGMENT_LIMIT,
+) -> "go.Figure":
+    """
+    Builds a Gantt chart of the window [start, end) whose size is bounded however
+    large the schedule is. A window with at most exact_limit segments, e.g. after
+    zooming in, is drawn segment by segment. Otherwise every row shows its time
+    buckets with the opacity set by how busy the thread was in each. Rows are capped
+    at max_rows by grouping the least busy threads into one "Other" row.
+    """
+    import plotly.graph_objects as go
+
+    threads, starts, ends, thread_ids, start, end = _window_segments(
+        segments, start, end
+    )
+    rows, labels, grouped = _assign_rows(threads, thread_ids, starts, ends, max_rows)
+    traces = []
+
+    if len(starts) <= exact_limit:
+        title = f"{len(starts)} segments, {len(labels)} rows"
+        names = np.array(thread_ids, dtype=object)
+        for index, label in enumerate(labels):
+            mine = rows == index
+            traces.append(
+                go.Bar(
+                    name=label,
+                    orientation="h",
+                    y=[label] * int(mine.sum()),
+                    base=starts[mine],
+                    x=ends[mine] - starts[mine],
+                    customdata=np.column_stack((names[threads[mine]], ends[mine])),
+                    hovertemplate="%{customdata[0]}: %{base} - %{customdata[1]}<extra></extra>",
+                    marker_color=_row_color(label, grouped, index, len(labels)),
+                )
+            )
+    else:
+        width, count = _bucket_layout(start, end, buckets)
+        busy_time = _bucket_busy_time(
+            rows, starts, ends, len(labels), start, width, count
+        )
+        title = f"{len(starts)} segments in {len(labels)} rows, {width}-tick buckets"
+        for index, label in enumerate(labels):
+            busy = busy_time[index]
+            active = np.flatnonzero(busy)
+            bucket_start = start + active * width
+            bucket_width = np.minimum(bucket_start + width, end) - bucket_start
+            share = busy[active] / bucket_width
+            traces.append(
+                go.Bar(
+                    name=label,
+                    orientation="h",
+                    y=[label] * len(active),
+                    base=bucket_start,
+                    x=bucket_width,
+                    customdata=share * 100,
+                    hovertemplate=f"{label}: %{{base}} +%{{x}}, %{{customdata:.0f}}% busy<extra></extra>",
+                    marker_color=_row_color(label, grouped, index, len(labels)),
+                    marker_opacity=np.clip(share, 0.15, 1.0),
+                    marker_line_width=0,
+                )
+            )
+
+    fig = go.Figure(traces)
+    fig.update_layout(
+        title=title,
+        barmode="overlay",
+        bargap=0.4,
+        showlegend=False,
+        xaxis={"title": "Time", "type": "linear", "range": [start, end]},
+        yaxis={"autorange": "reversed", "type": "category"},
+        height=max(300, 120 + 22 * len(labels)),
+    )
+    return fig
+
+
+def render_gantt(
+    segments: list[tuple[str, int, int]],
+    filename: str | None = None,
+    show: bool = False,
+    **options,
+) -> "go.Figure":
+    """
+    Builds a bounded Gantt chart with gantt_figure(segments, **options) and writes it
+    to filename without opening a browser: a self-contained HTML page, or a static
+    image for .png, .jpg, .svg and .pdf (these need the kaleido package).
+    """
+    fig = gantt_figure(segments, **options)
+    if filename:
+        if filename.lower().endswith(STATIC_IMAGE_SUFFIXES):
+            fig.write_image(filename)
+        else:
+            fig.write_html(filename, include_plotlyjs=True, full_html=True)
+    if show:
+        fig.show()
+    return fig
@@ -1,41 +1,211 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
 from thread_handling.thread import Thread
+from thread_handling.thread_table import ThreadTable
+
+if TYPE_CHECKING:
+    from .online import LiveMetrics
+
+# Percentiles reported for every per-thread time metric
+PERCENTILES = (50, 95, 99)
+
+
+def thread_columns(threads: list[Thread]) -> dict[str, np.ndarray]:
+    """
+    Returns the per-thread attributes used by the metrics as NumPy arrays.
+    A ThreadTable already stores them that way, other threads are converted once.
+    """
+    names = (
+        "arrival",
+        "burst",
+        "priority",
+        "start_time",
+        "waiting_time",
+        "turnaround_time",
+    )
+    if isinstance(threads, ThreadTable):
+        return {name: getattr(threads, name) for name in names}
+    return {
+        name: np.fromiter((getattr(th, name) for th in threads), np.int64, len(threads))
+        for name in names
+    }
+
+
+def _distribution(name: str, values: np.ndarray) -> dict:
+    """
+    Percentiles and maximum of one per-thread time metric, e.g. waiting_time_p95.
+    Percentiles interpolate linearly like np.percentile, but from a single sort,
+    which is faster than its partition-based selection on large arrays.
+    """
+    if len(values) == 0:
+        return {f"{name}_p{p}": 0 for p in PERCENTILES} | {f"{name}_max": 0}
+    ordered = np.sort(values)
+    stats = {}
+    for p in PERCENTILES:
+        position = p / 100 * (len(ordered) - 1)
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        fraction = position - lower
+        stats[f"{name}_p{p}"] = float(
+            ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+        )
+    stats[f"{name}_max"] = int(ordered[-1])
+    return stats
+
+
+def jain_fairness(values: np.ndarray) -> float:
+    """
+    Jain's fairness index (sum x)^2 / (n * sum x^2): 1.0 when all values are equal,
+    1/n when a single one gets everything.
+    """
+    if len(values) == 0:
+        return 0
+    return float(values.sum() ** 2 / (len(values) * np.square(values).sum()))
+
+
+def gantt_statistics(gantt_segments: list[tuple[str, int, int]]) -> tuple[int, int]:
+    """
+    Returns the CPU busy time and the number of context switches, i.e. dispatches of
+    a thread other than the one that ran last (idle gaps in between do not count).
+    """
+    busy_time = 0
+    context_switches = 0
+    previous = None
+    for tid, start, end in gantt_segments:
+        if tid == "IDLE":
+            continue
+        busy_time += end - start
+        if previous is not None and tid != previous:
+            context_switches += 1
+        previous = tid
+    return busy_time, context_switches
 
 
 def calculate_metrics(
-    threads: list[Thread], gantt_chart: list[tuple[str, int]]
+    threads: list[Thread],
+    gantt_segments: list[tuple[str, int, int]] | list[list[tuple[str, int, int]]],
+    live: "LiveMetrics | None" = None,
 ) -> dict:
     """
-    Calculate key performance metrics based on the completed threads and Gantt chart data.
+    Calculate key performance metrics based on the completed threads and the Gantt chart
+    segments (thread_id, start, end) recorded by the dispatcher. For a multi-core
+    simulation pass one list of segments per core (MultiCoreDispatcher.core_segments):
+    CPU utilization is then averaged over the cores and core_utilization lists each one.
     1. Average Waiting Time
     2. Average Turnaround Time
     3. CPU Utilization
     4. Throughput
     5. Total Time
+    6. Average Response Time (first run - arrival)
+    7. p50/p95/p99/max of waiting, turnaround and response times
+    8. Context Switches (summed over cores)
+    9. Fairness (Jain's index)
+    10. Per-core utilization (multi-core only)
+    Per-thread metrics are computed with NumPy over the thread columns. Passing the
+    dispatcher's live metrics (Dispatcher.live) reuses its busy time, context switches
+    and sums instead of passing over the Gantt chart and computing the means again.
     """
     n = len(threads)
+    columns = thread_columns(threads)
+    waiting = columns["waiting_time"]
+    turnaround = columns["turnaround_time"]
+    response = columns["start_time"] - columns["arrival"]
+
+    # Fairness over each thread's share of its lifetime spent running (burst / turnaround)
+    finished = turnaround > 0
+    if finished.all():
+        fairness = jain_fairness(columns["burst"] / turnaround)
+    else:
+        fairness = jain_fairness(columns["burst"][finished] / turnaround[finished])
+
+    # One Gantt chart per core, a single-core chart is a list of segment tuples
+    if gantt_segments and isinstance(gantt_segments[0], list):
+        core_segments = gantt_segments
+    else:
+        core_segments = [gantt_segments]
 
     # Computing the total simulation time
-    total_time = len(gantt_chart)
+    total_time = max(
+        (segments[-1][2] for segments in core_segments if segments), default=0
+    )
+
+    # The live metrics cover the whole run once every thread has completed
+    if live is not None and (live.completed != n or len(core_segments) > 1):
+        live = None
 
     # CPU busy_time = count the number of ticks where CPU was NOT IDLE
-    busy_time = sum(1 for tid, _ in gantt_chart if tid != "IDLE")
+    if live is not None:
+        core_statistics = [(live.busy_time, live.context_switches)]
+    else:
+        core_statistics = [gantt_statistics(segments) for segments in core_segments]
+    busy_time = sum(busy for busy, _ in core_statistics)
+    context_switches = sum(switches for _, switches in core_statistics)
+
+    if live is not None:
+        avg_waiting = live.mean("waiting_time")
+        avg_turnaround = live.mean("turnaround_time")
+        avg_response = live.mean("response_time")
+    else:
+        # Average waiting time
+        avg_waiting = float(waiting.mean()) if n > 0 else 0
 
-    # Average waiting time
-    avg_waiting = sum(th.waiting_time for th in threads) / n if n > 0 else 0
+        # Average turnaround time
+        avg_turnaround = float(turnaround.mean()) if n > 0 else 0
 
-    # Average turnaround time
-    avg_turnaround = sum(th.turnaround_time for th in threads) / n if n > 0 else 0
+        # Average response time
+        avg_response = float(response.mean()) if n > 0 else 0
 
     # CPU Utilization (percentage) = (Time CPU busy (i.e., sum of busy ticks) / Total simulation time)
-    cpu_utilization = (busy_time / total_time * 100) if total_time > 0 else 0
+    core_utilization = [
+        (busy / total_time * 100) if total_time > 0 else 0
+        for busy, _ in core_statistics
+    ]
+    cpu_utilization = (
+        busy_time / len(core_segments) / total_time * 100 if total_time > 0 else 0
+    )
 
     # Throughput = completed threads / total simulation time
     throughput = (n / total_time) if total_time > 0 else 0
 
-    return {
+    metrics = {
         "average_waiting_time": avg_waiting,
         "average_turnaround_time": avg_turnaround,
         "cpu_utilization": cpu_utilization,
         "throughput": throughput,
         "total_time": total_time,
+        "average_response_time": avg_response,
+        **_distribution("waiting_time", waiting),
+        **_distribution("turnaround_time", turnaround),
+        **_distribution("response_time", response),
+        "context_switches": context_switches,
+        "fairness": fairness,
     }
+    if len(core_segments) > 1:
+        metrics["cores"] = len(core_segments)
+        metrics["core_utilization"] = core_utilization
+    return metrics
+
+
+def priority_breakdown(threads: list[Thread]) -> dict[int, dict]:
+    """
+    Per-priority thread count, average waiting, turnaround and response times and
+    95th percentile waiting time, keyed by priority.
+    """
+    columns = thread_columns(threads)
+    priorities = columns["priority"]
+    response = columns["start_time"] - columns["arrival"]
+
+    breakdown = {}
+    for priority in np.unique(priorities).tolist():
+        mask = priorities == priority
+        waiting = columns["waiting_time"][mask]
+        breakdown[priority] = {
+            "count": int(mask.sum()),
+            "average_waiting_time": float(waiting.mean()),
+            "average_turnaround_time": float(columns["turnaround_time"][mask].mean()),
+            "average_response_time": float(response[mask].mean()),
+            "waiting_time_p95": float(np.percentile(waiting, 95)),
+        }
+    return breakdown
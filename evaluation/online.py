@@ -0,0 +1,296 @@
+import math
+
+from .metrics import PERCENTILES
+
+
+class RunningStats:
+    """
+    Count, mean, variance, minimum and maximum of a stream of values in O(1) memory,
+    using Welford's algorithm. Two instances can be merged (Chan et al.).
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0  # sum of squared differences from the mean
+        self.min: float = math.inf
+        self.max: float = -math.inf
+
+    def add(self, value: float) -> None:
+        """
+        Folds one value into the statistics.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "RunningStats") -> None:
+        """
+        Folds the values summarised by another instance into this one.
+        """
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """
+        Population variance of the values seen so far.
+        """
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def jain_fairness(self) -> float:
+        """
+        Jain's fairness index of the values, mean^2 / (mean^2 + variance).
+        Equal to metrics.jain_fairness over the same values.
+        """
+        square_mean = self.mean * self.mean + self.variance
+        return self.mean * self.mean / square_mean if square_mean else 0
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles of a stream of non-negative values in memory logarithmic in
+    their range (DDSketch). Values are counted in buckets whose bounds grow
+    geometrically, so every reported quantile is within `relative_accuracy` of a value
+    that was actually seen. Two sketches with the same accuracy can be merged.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets: dict[int, int] = {}  # bucket index -> count
+        self.zero_count: int = 0  # values <= 0, which have no logarithm
+        self.count: int = 0
+
+    def add(self, value: float) -> None:
+        """
+        Counts one value.
+        """
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Counts the values of another sketch with the same accuracy.
+        """
+        if other.gamma != self.gamma:
+            raise ValueError("Only sketches with the same accuracy can be merged")
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the approximate q-quantile (0 <= q <= 1) of the values counted so far.
+        """
+        if self.count == 0:
+            return 0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(i-1), gamma^i] in relative terms
+                return 2 * self.gamma**index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class OnlineMetric:
+    """
+    Running statistics and a quantile sketch of one per-thread time metric.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float) -> None:
+        self.stats.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other: "OnlineMetric") -> None:
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+
+    def summary(self, name: str) -> dict:
+        """
+        Mean, standard deviation, percentiles and maximum keyed like the batch metrics,
+        e.g. average_waiting_time, waiting_time_std, waiting_time_p95, waiting_time_max.
+        """
+        stats = {
+            f"average_{name}": self.stats.mean,
+            f"{name}_std": self.stats.std,
+        }
+        if self.stats.count == 0:
+            return stats | {f"{name}_p{p}": 0 for p in PERCENTILES} | {f"{name}_max": 0}
+        for p in PERCENTILES:
+            # The sketch estimate may fall slightly outside the values actually seen
+            estimate = self.sketch.quantile(p / 100)
+            stats[f"{name}_p{p}"] = min(max(estimate, self.stats.min), self.stats.max)
+        stats[f"{name}_max"] = self.stats.max
+        return stats
+
+
+# Per-thread time metrics of completed threads
+TIME_METRICS = ("waiting_time", "turnaround_time", "response_time")
+
+
+def _square_sum(values) -> int:
+    """
+    Exact sum of the squares of an int64 array, which may not fit in int64. Every
+    square must, i.e. values stay below 3 * 10**9: the high and low 32 bits of the
+    squares are summed separately.
+    """
+    squares = values * values
+    return (int((squares >> 32).sum()) << 32) + int((squares & 0xFFFFFFFF).sum())
+
+
+class LiveMetrics:
+    """
+    Running aggregates of a simulation, updated as the CPU runs or idles and as threads
+    complete instead of recomputed from all threads and the Gantt chart at the end:
+    busy time, context switches, and the count, sum and sum of squares of the waiting,
+    turnaround and response times and of the fairness share (burst / turnaround) of
+    the completed threads. Every metric can be read in O(1) at any tick. Integer sums
+    are exact, so the means equal the ones calculate_metrics computes.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.busy_time: int = 0
+        self.context_switches: int = 0
+        self.last_thread_id: str | None = None  # Last thread to run
+        self.completed: int = 0
+        self.sums: dict[str, int] = dict.fromkeys(TIME_METRICS, 0)
+        self.squares: dict[str, int] = dict.fromkeys(TIME_METRICS, 0)
+        self.share_sum: float = 0.0
+        self.share_squares: float = 0.0
+
+    def record_run(self, thread_id: str, start: int, end: int) -> None:
+        """
+        Counts a run of the CPU from start to end, busy unless thread_id is IDLE.
+        Dispatching a thread other than the one that ran last is a context switch,
+        idle time in between does not count.
+        """
+        if thread_id == "IDLE":
+            return
+        self.busy_time += end - start
+        if thread_id != self.last_thread_id:
+            if self.last_thread_id is not None:
+                self.context_switches += 1
+            self.last_thread_id = thread_id
+
+    def complete(self, thread) -> None:
+        """
+        Folds in the metrics of a thread that has just completed.
+        """
+        self.completed += 1
+        for name, value in (
+            ("waiting_time", thread.waiting_time),
+            ("turnaround_time", thread.turnaround_time),
+            ("response_time", thread.start_time - thread.arrival),
+        ):
+            self.sums[name] += value
+            self.squares[name] += value * value
+        share = thread.burst / thread.turnaround_time
+        self.share_sum += share
+        self.share_squares += share * share
+
+    def record_runs(self, thread_ids, start, end) -> None:
+        """
+        Counts many runs at once, given in order as NumPy columns, none of them IDLE,
+        e.g. by a closed-form schedule. Equal to calling record_run() on each.
+        """
+        if len(thread_ids) == 0:
+            return
+        self.busy_time += int((end - start).sum())
+        self.context_switches += int((thread_ids[1:] != thread_ids[:-1]).sum())
+        if self.last_thread_id is not None and thread_ids[0] != self.last_thread_id:
+            self.context_switches += 1
+        self.last_thread_id = thread_ids[-1]
+
+    def complete_all(self, burst, waiting, turnaround, response) -> None:
+        """
+        Folds in the metrics of many completed threads at once, given as NumPy
+        columns. Equal to calling complete() on each, up to float rounding of the
+        fairness shares.
+        """
+        self.completed += len(burst)
+        for name, values in (
+            ("waiting_time", waiting),
+            ("turnaround_time", turnaround),
+            ("response_time", response),
+        ):
+            self.sums[name] += int(values.sum())
+            self.squares[name] += _square_sum(values)
+        share = burst / turnaround
+        self.share_sum += float(share.sum())
+        self.share_squares += float((share * share).sum())
+
+    def mean(self, name: str) -> float:
+        return self.sums[name] / self.completed if self.completed else 0
+
+    def std(self, name: str) -> float:
+        """
+        Population standard deviation of one of the TIME_METRICS.
+        """
+        count = self.completed
+        if not count:
+            return 0.0
+        # Exact in integers, so there is no cancellation when the mean is large
+        return math.sqrt(
+            (count * self.squares[name] - self.sums[name] ** 2) / (count * count)
+        )
+
+    def jain_fairness(self) -> float:
+        """
+        Jain's fairness index of the shares, (sum x)^2 / (n * sum x^2).
+        """
+        if not self.share_squares:
+            return 0
+        return self.share_sum**2 / (self.completed * self.share_squares)
+
+    def snapshot(self, time_step: int) -> dict:
+        """
+        The metrics so far at time_step, keyed like calculate_metrics.
+        """
+        stats = {
+            "completed": self.completed,
+            "cpu_utilization": (
+                self.busy_time / time_step * 100 if time_step > 0 else 0
+            ),
+            "throughput": self.completed / time_step if time_step > 0 else 0,
+            "total_time": time_step,
+            "context_switches": self.context_switches,
+            "fairness": self.jain_fairness(),
+        }
+        for name in TIME_METRICS:
+            stats[f"average_{name}"] = self.mean(name)
+            stats[f"{name}_std"] = self.std(name)
+        return stats
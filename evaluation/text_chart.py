@@ -0,0 +1,74 @@
+UNICODE_SHADES = " ░▒▓█"
+ASCII_SHADES = " .:=#"
+
+
+def text_gantt(
+    gantt_segments: list[tuple[str, int, int]],
+    width: int = 72,
+    max_rows: int = 20,
+    ascii_only: bool = False,
+) -> str:
+    """
+    Renders (thread_id, start, end) segments as a terminal Gantt chart, in pure Python.
+    Time is split into at most `width` columns and every cell is shaded by how busy
+    the thread was in that column. At most max_rows rows are drawn: the busiest
+    threads get their own rows, ordered by first run, and the rest share an "Other" row.
+    """
+    segments = [segment for segment in gantt_segments if segment[0] != "IDLE"]
+    if not segments:
+        return "No Gantt data to display."
+    shades = ASCII_SHADES if ascii_only else UNICODE_SHADES
+    start = min(segment[1] for segment in segments)
+    end = max(segment[2] for segment in segments)
+    span = max(1, end - start)
+    columns = min(width, span)
+
+    # Busy ticks and first run per thread
+    busy: dict[str, int] = {}
+    first_run: dict[str, int] = {}
+    for thread_id, first, last in segments:
+        busy[thread_id] = busy.get(thread_id, 0) + last - first
+        first_run[thread_id] = min(first_run.get(thread_id, first), first)
+
+    kept = list(busy)
+    other = None
+    if len(kept) > max_rows:
+        kept = sorted(kept, key=lambda thread_id: -busy[thread_id])[: max_rows - 1]
+        other = f"Other ({len(busy) - len(kept)})"
+    kept.sort(key=lambda thread_id: first_run[thread_id])
+    labels = kept + ([other] if other else [])
+    row_of = {thread_id: index for index, thread_id in enumerate(kept)}
+
+    # Column c covers [edge(c), edge(c + 1)), so tick t is in column_of(t)
+    def edge(column: int) -> int:
+        return start + column * span // columns
+
+    def column_of(tick: int) -> int:
+        return ((tick - start + 1) * columns - 1) // span
+
+    cells = [[0] * columns for _ in labels]
+    for thread_id, first, last in segments:
+        row = cells[row_of.get(thread_id, len(labels) - 1)]
+        for column in range(column_of(first), column_of(last - 1) + 1):
+            row[column] += min(last, edge(column + 1)) - max(first, edge(column))
+
+    label_width = min(16, max(len(label) for label in labels))
+    lines = [f"Gantt chart: {start} - {end}, {span / columns:g} ticks per column"]
+    for label, row in zip(labels, cells):
+        bar = "".join(
+            shades[-(-busy_ticks * 4 // (edge(column + 1) - edge(column)))]
+            for column, busy_ticks in enumerate(row)
+        )
+        lines.append(f"{label[:label_width]:<{label_width}} |{bar}|")
+    end_label = str(end)
+    lines.append(
+        f"{'':<{label_width}}  {start:<{max(1, columns - len(end_label))}}{end_label}"
+    )
+    return "\n".join(lines)
+
+
+def print_text_gantt(gantt_segments: list[tuple[str, int, int]], **options) -> None:
+    """
+    Prints text_gantt(gantt_segments, **options).
+    """
+    print(text_gantt(gantt_segments, **options))
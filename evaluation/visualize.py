@@ -1,42 +1,35 @@
-import plotly.figure_factory as ff
-import pandas as pd
-import random
+from algorithms.registry import ALGORITHM_PARAMS
+from evaluation.gantt import EXACT_SEGMENT_LIMIT, gantt_figure, thread_color
+from evaluation.text_chart import print_text_gantt
 
+# pandas and plotly take over a second to import, so they are only imported when a
+# chart is drawn. Without them, charts fall back to the text renderer.
 
-def random_color():
-    """
-    Generate a random hex color code.
-    """
-    return "#{:06x}".format(random.randint(0, 0xFFFFFF))
 
-
-def display_gantt_chart(gantt_data: list[tuple[str, int]]):
+def display_gantt_chart(gantt_segments: list[tuple[str, int, int]]):
     """
-    Prints a formatted Gantt chart from the recorded threads (id, time) pairs.
+    Prints a formatted Gantt chart from the recorded (thread_id, start, end) segments.
     """
 
-    # Handle empty gantt_data
-    if not gantt_data:
+    # Handle empty gantt_segments
+    if not gantt_segments:
         print("No Gantt data to display.")
         return
 
-    # Merge consecutive entries of the same thread
-    merged = []
-    current_thread, start_time = gantt_data[0]
-    for i in range(1, len(gantt_data)):
-        thread, time = gantt_data[i]
-        if thread != current_thread:
-            # close previous block at this time
-            merged.append(dict(Task=current_thread, Start=start_time, Finish=time))
-            current_thread = thread
-            start_time = time
-
-    # Add the final block
-    last_time = gantt_data[-1][1] + 1
-    merged.append(dict(Task=current_thread, Start=start_time, Finish=last_time))
-
-    # Convert to DataFrame
-    df = pd.DataFrame(merged)
+    try:
+        import pandas as pd
+        import plotly.figure_factory as ff
+    except ImportError:
+        print_text_gantt(gantt_segments)
+        return
+
+    # Large schedules are aggregated so the browser stays responsive
+    if len(gantt_segments) > EXACT_SEGMENT_LIMIT:
+        gantt_figure(gantt_segments).show()
+        return
+
+    # Convert to DataFrame, one row per segment
+    df = pd.DataFrame(gantt_segments, columns=["Task", "Start", "Finish"])
     try:
         df["Start"] = pd.to_numeric(df["Start"])
         df["Finish"] = pd.to_numeric(df["Finish"])
@@ -46,7 +39,7 @@ def display_gantt_chart(gantt_data: list[tuple[str, int]]):
 
     # Generate colors for each thread
     unique_tasks = df["Task"].unique()
-    thread_colors = {task: random_color() for task in unique_tasks}
+    thread_colors = {task: thread_color(task) for task in unique_tasks}
 
     # Display Gantt chart
     fig = ff.create_gantt(
@@ -61,6 +54,47 @@ def display_gantt_chart(gantt_data: list[tuple[str, int]]):
     fig.show()
 
 
+def display_core_gantt_chart(core_segments: list[list[tuple[str, int, int]]]):
+    """
+    Displays one Gantt row per core from a multi-core simulation, coloured by thread.
+    """
+
+    # One row per busy segment, idle time is left blank
+    rows = [
+        (f"Core {index}", start, end, thread_id)
+        for index, segments in enumerate(core_segments)
+        for thread_id, start, end in segments
+        if thread_id != "IDLE"
+    ]
+    if not rows:
+        print("No Gantt data to display.")
+        return
+    try:
+        import pandas as pd
+        import plotly.figure_factory as ff
+    except ImportError:
+        for index, segments in enumerate(core_segments):
+            print(f"Core {index}")
+            print_text_gantt(segments)
+        return
+    df = pd.DataFrame(rows, columns=["Task", "Start", "Finish", "Resource"])
+
+    # Generate colors for each thread
+    thread_colors = {
+        thread_id: thread_color(thread_id) for thread_id in df["Resource"].unique()
+    }
+
+    fig = ff.create_gantt(
+        df,
+        index_col="Resource",
+        bar_width=0.4,
+        colors=thread_colors,
+        group_tasks=True,
+    )
+    fig.update_layout(xaxis_type="linear")
+    fig.show()
+
+
 def print_metrics_table(metrics: dict, threads: list):
     """
     Print a formatted table of metrics per-thread and averages.
@@ -82,4 +116,68 @@ def print_metrics_table(metrics: dict, threads: list):
     print(f"Average Turnaround Time : {metrics['average_turnaround_time']: .2f}")
     print(f"CPU Utilization         : {metrics['cpu_utilization']: .2f}%")
     print(f"Throughput              : {metrics['throughput']: .4f} threads/tick")
+    print(f"Average Response Time   : {metrics['average_response_time']: .2f}")
+    print(f"Context Switches        : {metrics['context_switches']: d}")
+    print(f"Fairness (Jain's index) : {metrics['fairness']: .4f}")
+    if "core_utilization" in metrics:
+        print(
+            "Core Utilization        : "
+            + ", ".join(f"{value:.1f}%" for value in metrics["core_utilization"])
+        )
+
+    print(f"\n{'Percentiles':<14}{'p50':<10}{'p95':<10}{'p99':<10}{'max':<10}")
+    for name in ("waiting_time", "turnaround_time", "response_time"):
+        label = name.split("_")[0].capitalize()
+        print(
+            f"{label:<14}{metrics[f'{name}_p50']:<10.2f}{metrics[f'{name}_p95']:<10.2f}"
+            f"{metrics[f'{name}_p99']:<10.2f}{metrics[f'{name}_max']:<10}"
+        )
     print("-------------------------------------------------------\n")
+
+
+def print_priority_breakdown(breakdown: dict[int, dict]):
+    """
+    Print the per-priority metrics from metrics.priority_breakdown.
+    """
+
+    print("------------------ METRICS BY PRIORITY ------------------")
+    print(
+        f"{'Priority':<10}{'Threads':<10}{'Waiting':<10}{'Turnaround':<12}{'Response':<10}{'Wait p95':<10}"
+    )
+    for priority, stats in breakdown.items():
+        print(
+            f"{priority:<10}{stats['count']:<10}{stats['average_waiting_time']:<10.2f}"
+            f"{stats['average_turnaround_time']:<12.2f}{stats['average_response_time']:<10.2f}"
+            f"{stats['waiting_time_p95']:<10.2f}"
+        )
+    print("---------------------------------------------------------\n")
+
+
+def print_comparison_table(rows: list[dict]):
+    """
+    Print one line of metrics per algorithm, e.g. the rows from a comparison run.
+    """
+
+    # Show parameters next to the algorithm name, e.g. rr(quantum=4)
+    names = []
+    for row in rows:
+        params = ", ".join(
+            f"{key}={row[key]}"
+            for key in ALGORITHM_PARAMS.get(row["algorithm"], ())
+            if key in row
+        )
+        names.append(f"{row['algorithm']}({params})" if params else row["algorithm"])
+    width = max([len("Algorithm"), *map(len, names)]) + 2
+
+    print("\n------------------- ALGORITHM COMPARISON -------------------")
+    print(
+        f"{'Algorithm':<{width}}{'Waiting':<10}{'Turnaround':<12}{'CPU %':<10}{'Throughput':<12}{'Total':<8}"
+    )
+
+    for name, row in zip(names, rows):
+        print(
+            f"{name:<{width}}{row['average_waiting_time']:<10.2f}{row['average_turnaround_time']:<12.2f}"
+            f"{row['cpu_utilization']:<10.2f}{row['throughput']:<12.4f}{row['total_time']:<8}"
+        )
+
+    print("------------------------------------------------------------\n")
@@ -0,0 +1,16 @@
+from .cache import ResultCache, cache_key, workload_digest
+from .runner import simulate, workload_rows
+from .compare import compare_algorithms
+from .sweep import pareto_front, parameter_grid, sweep
+
+__all__ = [
+    "ResultCache",
+    "cache_key",
+    "workload_digest",
+    "simulate",
+    "workload_rows",
+    "compare_algorithms",
+    "pareto_front",
+    "parameter_grid",
+    "sweep",
+]
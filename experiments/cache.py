@@ -0,0 +1,227 @@
+import hashlib
+import io
+import json
+import os
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from algorithms.registry import ALGORITHMS
+from thread_handling.thread import Thread
+from thread_handling.thread_table import ThreadTable
+
+# Bump whenever a change alters schedules or metrics, so older results are not reused
+SIMULATOR_VERSION = 2
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Per-thread simulation results stored with every entry, in workload order
+RESULT_COLUMNS = (
+    "remaining",
+    "start_time",
+    "completion_time",
+    "waiting_time",
+    "turnaround_time",
+    "last_run_time",
+)
+
+# Gantt chart of one core, or one chart per core of a multi-core simulation
+Segments = list[tuple[str, int, int]] | list[list[tuple[str, int, int]]]
+
+
+def workload_digest(threads: list[Thread]) -> str:
+    """
+    SHA-256 of a workload's contents: thread IDs, arrival, burst and priority in order.
+    The same workload gives the same digest whether it came from a text or binary
+    file or was generated.
+    """
+    if isinstance(threads, ThreadTable):
+        thread_ids = threads.thread_ids
+        columns = (threads.arrival, threads.burst, threads.priority)
+    else:
+        thread_ids = [th.thread_id for th in threads]
+        columns = tuple(
+            np.fromiter((getattr(th, name) for th in threads), np.int64, len(threads))
+            for name in ("arrival", "burst", "priority")
+        )
+    digest = hashlib.sha256()
+    digest.update("\0".join(map(str, thread_ids)).encode("utf-8"))
+    for column in columns:
+        digest.update(np.ascontiguousarray(column, dtype="<i8").tobytes())
+    return digest.hexdigest()
+
+
+def cache_key(digest: str, algorithm: str, params: dict) -> str:
+    """
+    Key of one simulation: the workload digest, the algorithm class and its
+    parameters, and the simulator version.
+    """
+    description = {
+        "version": SIMULATOR_VERSION,
+        "workload": digest,
+        "algorithm": algorithm,
+        "class": ALGORITHMS[algorithm].__name__,
+        "params": params,
+    }
+    return hashlib.sha256(
+        json.dumps(description, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def _pack_segments(gantt_segments: Segments) -> dict[str, np.ndarray]:
+    """
+    Gantt segments as integer columns: a code per thread ID, start, end and core.
+    """
+    if gantt_segments and isinstance(gantt_segments[0], list):
+        cores = gantt_segments
+    else:
+        cores = [gantt_segments]
+    codes: dict[str, int] = {}
+    columns = {"codes": [], "starts": [], "ends": [], "cores": []}
+    for core, segments in enumerate(cores):
+        count = len(segments)
+        columns["codes"].append(
+            np.fromiter(
+                (codes.setdefault(segment[0], len(codes)) for segment in segments),
+                np.int64,
+                count,
+            )
+        )
+        columns["starts"].append(
+            np.fromiter((segment[1] for segment in segments), np.int64, count)
+        )
+        columns["ends"].append(
+            np.fromiter((segment[2] for segment in segments), np.int64, count)
+        )
+        columns["cores"].append(np.full(count, core, dtype=np.int64))
+    return {
+        "segment_ids": np.array(list(codes), dtype=str),
+        **{f"segment_{name}": np.concatenate(parts) for name, parts in columns.items()},
+        "core_count": np.array(len(cores)),
+    }
+
+
+def _unpack_segments(entry: dict[str, np.ndarray]) -> Segments:
+    thread_ids = entry["segment_ids"].tolist()
+    cores = [[] for _ in range(int(entry["core_count"]))]
+    for code, start, end, core in zip(
+        entry["segment_codes"].tolist(),
+        entry["segment_starts"].tolist(),
+        entry["segment_ends"].tolist(),
+        entry["segment_cores"].tolist(),
+    ):
+        cores[core].append((thread_ids[code], start, end))
+    return cores if len(cores) > 1 else cores[0]
+
+
+def restore_results(threads: list[Thread], columns: dict[str, np.ndarray]) -> None:
+    """
+    Writes cached per-thread simulation results back into the threads.
+    """
+    if isinstance(threads, ThreadTable):
+        for name in RESULT_COLUMNS:
+            getattr(threads, name)[:] = columns[name]
+        return
+    values = zip(*(columns[name].tolist() for name in RESULT_COLUMNS))
+    for thread, row in zip(threads, values):
+        for name, value in zip(RESULT_COLUMNS, row):
+            setattr(thread, name, value)
+
+
+class ResultCache:
+    """
+    On-disk cache of simulation results, one compressed NumPy file per cache_key with
+    the metrics, the Gantt segments as integer columns and the per-thread results.
+    Entries are written atomically, so concurrent processes can share a directory.
+    The least recently used entries are evicted once the directory holds more than
+    max_bytes, using file modification times, which get() refreshes.
+    """
+
+    def __init__(
+        self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def get(self, key: str) -> dict | None:
+        """
+        Returns the cached {"metrics", "gantt_segments", "threads"} of a key, or None.
+        "threads" holds the RESULT_COLUMNS, see restore_results(), and a multi-core
+        result has one list of segments per core.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                entry = dict(entry)
+            result = {
+                "metrics": json.loads(str(entry["metrics"])),
+                "gantt_segments": _unpack_segments(entry),
+                "threads": {name: entry[name] for name in RESULT_COLUMNS},
+            }
+        # Missing, evicted meanwhile or damaged entries are misses
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+        os.utime(path)  # mark as recently used
+        return result
+
+    def put(
+        self,
+        key: str,
+        threads: list[Thread],
+        gantt_segments: Segments,
+        metrics: dict,
+    ) -> None:
+        """
+        Stores the result of a finished simulation, then evicts old entries if needed.
+        """
+        if isinstance(threads, ThreadTable):
+            columns = {name: getattr(threads, name) for name in RESULT_COLUMNS}
+        else:
+            columns = {
+                name: np.fromiter(
+                    (getattr(th, name) for th in threads), np.int64, len(threads)
+                )
+                for name in RESULT_COLUMNS
+            }
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            metrics=np.array(json.dumps(metrics)),
+            **_pack_segments(gantt_segments),
+            **columns,
+        )
+
+        # Write to a temporary file first so readers never see a partial entry
+        path = self._path(key)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(buffer.getvalue())
+        os.replace(temporary, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits in max_bytes.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # evicted by another process
+            total -= size
+
+    def clear(self) -> None:
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz"):
+                os.remove(entry.path)
@@ -0,0 +1,54 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.registry import ALGORITHMS, algorithm_params
+from thread_handling.thread import Thread
+from .cache import ResultCache, cache_key, workload_digest
+from .runner import simulate, workload_rows
+
+
+def compare_algorithms(
+    threads: list[Thread],
+    algorithms: list[str] | None = None,
+    max_workers: int | None = None,
+    cache: ResultCache | None = None,
+    **params,
+) -> list[dict]:
+    """
+    Runs every algorithm on its own copy of the same workload, in parallel across
+    processes, and returns one row per algorithm with its parameters and metrics.
+    Parameters such as quantum and priority_threshold go to the algorithms that take them.
+    With a cache, algorithms whose result is cached are not simulated again and new
+    results are stored.
+    """
+    names = list(algorithms or ALGORITHMS)
+    configs = [(name, algorithm_params(name, **params)) for name in names]
+
+    # Look up every configuration first, only the misses are simulated
+    results: list[dict | None] = [None] * len(configs)
+    keys: list[str | None] = [None] * len(configs)
+    if cache is not None:
+        digest = workload_digest(threads)
+        for index, (name, config) in enumerate(configs):
+            keys[index] = cache_key(digest, name, config)
+            cached = cache.get(keys[index])
+            if cached:
+                results[index] = cached["metrics"]
+    missing = [index for index, result in enumerate(results) if result is None]
+
+    if missing:
+        rows = workload_rows(threads)
+        jobs = [(rows, *configs[index], cache, keys[index]) for index in missing]
+        if max_workers == 1:
+            # Run in-process, e.g. where worker processes are unavailable
+            computed = [simulate(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(simulate, *job) for job in jobs]
+                computed = [future.result() for future in futures]
+        for index, metrics in zip(missing, computed):
+            results[index] = metrics
+
+    return [
+        {"algorithm": name, **config, **metrics}
+        for (name, config), metrics in zip(configs, results)
+    ]
@@ -0,0 +1,48 @@
+from algorithms.closed_form import CLOSED_FORM, ClosedFormDispatcher
+from algorithms.registry import create_algorithm
+from dispatcher import Dispatcher
+from evaluation.metrics import calculate_metrics
+from thread_handling.thread import Thread
+from thread_handling.thread_table import ThreadTable
+from .cache import ResultCache
+
+# (thread_id, arrival, burst, priority) for every thread of a workload
+Workload = list[tuple[str, int, int, int]]
+
+
+def workload_rows(threads: list[Thread]) -> Workload:
+    """
+    Reduces threads to their static attributes so the workload can be sent to other
+    processes and rebuilt there as fresh, unsimulated threads.
+    """
+    if isinstance(threads, ThreadTable):
+        return threads.rows()
+    return [(th.thread_id, th.arrival, th.burst, th.priority) for th in threads]
+
+
+def simulate(
+    workload: Workload,
+    algorithm: str,
+    params: dict,
+    cache: ResultCache | None = None,
+    key: str | None = None,
+) -> dict:
+    """
+    Runs one headless simulation on its own copy of the workload and returns the metrics.
+    With a cache, the result is also stored under key.
+    """
+    threads = ThreadTable.from_rows(workload)
+    if algorithm in CLOSED_FORM:
+        # Non-preemptive schedules are computed directly instead of simulated
+        dispatcher = ClosedFormDispatcher(threads, algorithm)
+    else:
+        dispatcher = Dispatcher(
+            threads, create_algorithm(algorithm, **params), verbose=False
+        )
+    dispatcher.run()
+    metrics = calculate_metrics(
+        dispatcher.threads, dispatcher.gantt_segments, dispatcher.live
+    )
+    if cache is not None:
+        cache.put(key, dispatcher.threads, dispatcher.gantt_segments, metrics)
+    return metrics
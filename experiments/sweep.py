@@ -0,0 +1,159 @@
+import hashlib
+import itertools
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator
+
+from algorithms.registry import ALGORITHM_PARAMS, algorithm_params
+from thread_handling.thread import Thread
+from .runner import Workload, simulate, workload_rows
+
+# Workload of the current worker process, sent once when the worker starts
+_worker_workload: Workload = []
+
+
+def _init_worker(workload: Workload) -> None:
+    global _worker_workload
+    _worker_workload = workload
+
+
+def _simulate_config(algorithm: str, params: dict) -> dict:
+    return simulate(_worker_workload, algorithm, params)
+
+
+def parameter_grid(algorithm: str, grid: dict[str, list[int]]) -> list[dict]:
+    """
+    Expands value lists such as {"quantum": [2, 4], "priority_threshold": [1, 2]}
+    into every combination of the parameters the algorithm takes.
+    """
+    keys = [key for key in ALGORITHM_PARAMS[algorithm] if key in grid]
+    return [
+        dict(zip(keys, values))
+        for values in itertools.product(*(grid[key] for key in keys))
+    ]
+
+
+def workload_fingerprint(workload: Workload) -> str:
+    """
+    Short hash identifying a workload, so resumed sweeps never mix up workloads.
+    """
+    return hashlib.sha1(repr(workload).encode()).hexdigest()[:16]
+
+
+def _config_key(algorithm: str, params: dict) -> tuple:
+    return (algorithm, *sorted(params.items()))
+
+
+def load_results(path: str | Path, fingerprint: str) -> list[dict]:
+    """
+    Reads the result rows already written for a workload, skipping a truncated last line.
+    """
+    path = Path(path)
+    if not path.is_file():
+        return []
+    rows = []
+    with open(path, "r") as file:
+        for line in file:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # partially written line from an interrupted sweep
+            if row.get("workload") == fingerprint:
+                rows.append(row)
+    return rows
+
+
+def sweep(
+    threads: list[Thread],
+    algorithm: str,
+    grid: dict[str, list[int]],
+    results_path: str | Path | None = None,
+    max_workers: int | None = None,
+) -> Iterator[dict]:
+    """
+    Runs the algorithm once per parameter combination across a process pool and
+    yields a row (workload, algorithm, parameters, metrics) as each run completes.
+    With results_path, rows are appended to that JSON lines file as they arrive and
+    combinations already recorded there for the same workload are yielded without
+    being simulated again, so an interrupted sweep resumes where it stopped.
+    """
+    workload = workload_rows(threads)
+    fingerprint = workload_fingerprint(workload)
+
+    # Reuse results that were already written
+    done = {}
+    if results_path is not None:
+        for row in load_results(results_path, fingerprint):
+            params = algorithm_params(row["algorithm"], **row)
+            done[_config_key(row["algorithm"], params)] = row
+
+    pending = []
+    for params in parameter_grid(algorithm, grid):
+        row = done.get(_config_key(algorithm, params))
+        if row is not None:
+            yield row
+        else:
+            pending.append(params)
+    if not pending:
+        return
+
+    output = None
+    if results_path is not None:
+        output = open(results_path, "a+")
+        # Start on a fresh line if the last write was cut short
+        if output.tell() > 0:
+            output.seek(output.tell() - 1)
+            if output.read(1) != "\n":
+                output.write("\n")
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(workload,)
+        ) as pool:
+            futures = {
+                pool.submit(_simulate_config, algorithm, params): params
+                for params in pending
+            }
+            for future in as_completed(futures):
+                row = {
+                    "workload": fingerprint,
+                    "algorithm": algorithm,
+                    **futures[future],
+                    **future.result(),
+                }
+                if output is not None:
+                    output.write(json.dumps(row) + "\n")
+                    output.flush()
+                yield row
+    finally:
+        if output is not None:
+            output.close()
+
+
+def pareto_front(rows: list[dict]) -> list[dict]:
+    """
+    Returns the rows not dominated by any other row, i.e. no other setting is at least
+    as good on average waiting time, average turnaround time and throughput and
+    strictly better on one of them.
+    """
+
+    def objectives(row: dict) -> tuple:
+        # Lower is better for every objective
+        return (
+            row["average_waiting_time"],
+            row["average_turnaround_time"],
+            -row["throughput"],
+        )
+
+    front = []
+    for row in rows:
+        point = objectives(row)
+        dominated = any(
+            other is not row
+            and all(a <= b for a, b in zip(objectives(other), point))
+            and objectives(other) != point
+            for other in rows
+        )
+        if not dominated:
+            front.append(row)
+    return front
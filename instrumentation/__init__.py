@@ -0,0 +1,9 @@
+from .probes import Instrumentation, format_report
+from .profiling import SamplingProfiler, profile_call
+
+__all__ = [
+    "Instrumentation",
+    "format_report",
+    "SamplingProfiler",
+    "profile_call",
+]
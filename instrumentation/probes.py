@@ -0,0 +1,216 @@
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator
+
+from dispatcher import Dispatcher
+from evaluation.online import RunningStats
+from tracing import QUANTUM_EXPIRY
+
+# Dispatcher and algorithm methods timed as phases, by phase name
+DISPATCHER_PHASES = {
+    "tick": "tick",
+    "step": "step",
+    "admit": "_admit_arrivals",
+    "record": "_record",
+}
+ALGORITHM_PHASES = {
+    "select": "tick",
+    "run_length": "run_length",
+    "advance": "advance",
+}
+
+
+class PhaseTimer:
+    """
+    Call count and total wall time of one phase.
+    """
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.total_ns: int = 0
+
+    def add(self, elapsed_ns: int) -> None:
+        self.calls += 1
+        self.total_ns += elapsed_ns
+
+
+class Instrumentation:
+    """
+    Opt-in probes for a Dispatcher and its algorithm. attach() wraps the hot methods
+    on the instances with timing and counting wrappers and detach() removes them, so
+    a simulation that is not instrumented runs the original code at no extra cost.
+
+    Phases: tick/step (the whole dispatcher call), admit (arrival handling),
+    select (Algorithm.tick), run_length and advance (event engine), record (Gantt
+    bookkeeping), plus any phase timed with the phase() context manager.
+    Counters: scheduling decisions, idle decisions, context switches, preemptions and
+    quantum expiries, the last as the algorithm traces them through Algorithm.trace,
+    whether or not a tracer records them. Queue lengths from Algorithm.queue_lengths() are sampled after
+    every decision.
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseTimer] = {}
+        self.counters: dict[str, int] = {
+            "decisions": 0,
+            "idle_decisions": 0,
+            "switches": 0,
+            "preemptions": 0,
+            "quantum_expiries": 0,
+        }
+        self.queue_lengths: dict[str, RunningStats] = {}
+        self.attached: list[tuple[object, str]] = []  # (instance, method name) wrapped
+
+    def _timer(self, phase: str) -> PhaseTimer:
+        if phase not in self.phases:
+            self.phases[phase] = PhaseTimer()
+        return self.phases[phase]
+
+    def _wrap(self, instance: object, name: str, phase: str) -> None:
+        """Shadows a method on one instance with a timed version of it."""
+        method = getattr(instance, name)
+        timer = self._timer(phase)
+        clock = time.perf_counter_ns
+
+        @wraps(method)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timer.add(clock() - start)
+
+        setattr(instance, name, timed)
+        self.attached.append((instance, name))
+
+    def _wrap_select(self, algorithm) -> None:
+        """Shadows Algorithm.tick with a version that also counts its decisions."""
+        select = algorithm.tick
+        timer = self._timer("select")
+        clock = time.perf_counter_ns
+        counters = self.counters
+
+        @wraps(select)
+        def counted(time_step: int):
+            previous = algorithm.active_thread
+            start = clock()
+            thread = select(time_step)
+            timer.add(clock() - start)
+
+            counters["decisions"] += 1
+            if thread is None:
+                counters["idle_decisions"] += 1
+            elif previous is not None and thread is not previous:
+                counters["switches"] += 1
+                if not previous.is_finished():
+                    counters["preemptions"] += 1
+            for queue, length in algorithm.queue_lengths().items():
+                if queue not in self.queue_lengths:
+                    self.queue_lengths[queue] = RunningStats()
+                self.queue_lengths[queue].add(length)
+            return thread
+
+        algorithm.tick = counted
+        self.attached.append((algorithm, "tick"))
+
+    def _wrap_trace(self, algorithm) -> None:
+        """
+        Shadows Algorithm.trace with a version that also counts the quantum expiries
+        the algorithm reports, at the point where it decides them.
+        """
+        trace = algorithm.trace
+        counters = self.counters
+
+        @wraps(trace)
+        def counted(kind: int, time_step: int, thread, other=None) -> None:
+            if kind == QUANTUM_EXPIRY:
+                counters["quantum_expiries"] += 1
+            trace(kind, time_step, thread, other)
+
+        algorithm.trace = counted
+        self.attached.append((algorithm, "trace"))
+
+    def attach(self, dispatcher: Dispatcher) -> "Instrumentation":
+        """
+        Starts instrumenting a dispatcher and its algorithm.
+        """
+        for phase, name in DISPATCHER_PHASES.items():
+            self._wrap(dispatcher, name, phase)
+        self._wrap_select(dispatcher.algorithm)
+        self._wrap_trace(dispatcher.algorithm)
+        for phase, name in ALGORITHM_PHASES.items():
+            if phase != "select":
+                self._wrap(dispatcher.algorithm, name, phase)
+        return self
+
+    def detach(self) -> None:
+        """
+        Restores the original methods, the collected data is kept.
+        """
+        for instance, name in reversed(self.attached):
+            delattr(instance, name)
+        self.attached.clear()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Times a block of code as a phase, e.g. with probes.phase("metrics"): ...
+        """
+        timer = self._timer(name)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            timer.add(time.perf_counter_ns() - start)
+
+    def report(self) -> dict:
+        """
+        The collected phase timings, counters and queue length statistics.
+        """
+        return {
+            "phases": {
+                name: {
+                    "calls": timer.calls,
+                    "total_seconds": timer.total_ns / 1e9,
+                    "mean_microseconds": (
+                        timer.total_ns / timer.calls / 1e3 if timer.calls else 0
+                    ),
+                }
+                for name, timer in self.phases.items()
+                if timer.calls
+            },
+            "counters": dict(self.counters),
+            "queue_lengths": {
+                name: {"mean": stats.mean, "max": stats.max}
+                for name, stats in self.queue_lengths.items()
+            },
+        }
+
+
+def format_report(report: dict, write: Callable[[str], None] = print) -> None:
+    """
+    Writes an Instrumentation report as aligned text, one line at a time.
+    Nested phases (admit, select, ...) are shown as a share of tick/step time.
+    """
+    phases = report["phases"]
+    outer = sum(
+        phases.get(name, {}).get("total_seconds", 0) for name in ("tick", "step")
+    )
+
+    write("------------------- INSTRUMENTATION -------------------")
+    write(f"{'Phase':<14}{'Calls':<12}{'Total s':<12}{'Mean us':<12}{'Share':<8}")
+    for name, stats in phases.items():
+        share = stats["total_seconds"] / outer if outer else 0
+        write(
+            f"{name:<14}{stats['calls']:<12}{stats['total_seconds']:<12.4f}"
+            f"{stats['mean_microseconds']:<12.2f}{share:<8.1%}"
+        )
+    write("")
+    for name, value in report["counters"].items():
+        write(f"{name.replace('_', ' ').capitalize():<24}: {value}")
+    for name, stats in report["queue_lengths"].items():
+        write(
+            f"{f'{name.capitalize()} queue length':<24}: mean {stats['mean']:.2f}, max {stats['max']}"
+        )
+    write("-------------------------------------------------------")
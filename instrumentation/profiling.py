@@ -0,0 +1,101 @@
+import cProfile
+import io
+import pstats
+import sys
+import threading
+from collections import Counter
+from typing import Callable
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler: a background thread samples the profiled thread's call stack
+    every `interval` seconds. Unlike cProfile it does not slow down every call, so the
+    relative cost of cheap, frequent functions is not distorted.
+    """
+
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        self.samples: int = 0
+        self.self_counts: Counter[str] = Counter()  # samples on top of the stack
+        self.total_counts: Counter[str] = Counter()  # samples anywhere on the stack
+        self._target: int | None = None  # ident of the profiled thread
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._switch_interval: float = sys.getswitchinterval()
+
+    @staticmethod
+    def _label(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_filename}:{code.co_firstlineno}({code.co_name})"
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            self.samples += 1
+            self.self_counts[self._label(frame)] += 1
+            seen = set()
+            while frame is not None:
+                label = self._label(frame)
+                if label not in seen:  # count recursive functions once per sample
+                    seen.add(label)
+                    self.total_counts[label] += 1
+                frame = frame.f_back
+
+    def start(self) -> None:
+        """
+        Starts sampling the calling thread.
+        """
+        self._target = threading.get_ident()
+        # The sampler needs the GIL at least once per interval to take its samples
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._sampler.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def report(self, limit: int = 25) -> str:
+        """
+        Functions by share of samples, on top of the stack (self) and anywhere (total).
+        """
+        lines = [
+            f"{self.samples} samples every {self.interval * 1000:g} ms",
+            f"{'Self':>8}{'Total':>8}  Function",
+        ]
+        for label, count in self.self_counts.most_common(limit):
+            lines.append(
+                f"{count / self.samples:>8.1%}{self.total_counts[label] / self.samples:>8.1%}  {label}"
+            )
+        return "\n".join(lines)
+
+
+def profile_call(
+    function: Callable[[], None], kind: str = "cprofile", limit: int = 25
+) -> str:
+    """
+    Runs function under cProfile ("cprofile") or the SamplingProfiler ("sample")
+    and returns the text report of the most expensive functions.
+    """
+    if kind == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.runcall(function)
+        output = io.StringIO()
+        stats = pstats.Stats(profiler, stream=output)
+        stats.sort_stats("cumulative").print_stats(limit)
+        return output.getvalue()
+    if kind == "sample":
+        profiler = SamplingProfiler()
+        profiler.start()
+        try:
+            function()
+        finally:
+            profiler.stop()
+        return profiler.report(limit)
+    raise ValueError(f"Unknown profiler '{kind}'. Choose from: cprofile, sample")
@@ -1,4 +1,7 @@
+import argparse
+import sys
 import time
+from contextlib import nullcontext
 from pathlib import Path
 
 from algorithms.first_come_first_serve import FCFS
@@ -7,15 +10,65 @@ from algorithms.priority import Priority
 from algorithms.round_robin import RR
 from algorithms.preemptive_shortest_job_first import PreemptiveSJF
 from algorithms.multilevel_queue import MultilevelQueue
+from algorithms.multilevel_feedback_queue import MultilevelFeedbackQueue
+from algorithms.completely_fair import CompletelyFair
 
 from dispatcher import Dispatcher
-from thread_handling.thread_file_loader import load_threads_from_file
+from streaming_dispatcher import StreamingDispatcher
+from multicore import BALANCERS, MultiCoreDispatcher
+from instrumentation import Instrumentation, format_report, profile_call
+from thread_handling.thread_file_loader import (
+    convert_text_to_binary,
+    iter_thread_chunks,
+    load_threads_from_file,
+)
+from thread_handling.thread_stream import iter_threads
 from thread_handling.thread_generator import generate_threads
+from thread_handling.workload_generator import (
+    ARRIVAL_PATTERNS,
+    BURST_DISTRIBUTIONS,
+    PRIORITY_DISTRIBUTIONS,
+    generate_workload,
+    write_workload,
+)
 
-from evaluation.metrics import calculate_metrics
-from evaluation.visualize import display_gantt_chart, print_metrics_table
+from evaluation.metrics import calculate_metrics, priority_breakdown
+from evaluation.gantt import DEFAULT_MAX_ROWS, render_gantt
+from evaluation.text_chart import print_text_gantt, text_gantt
+from evaluation.visualize import (
+    display_core_gantt_chart,
+    display_gantt_chart,
+    print_comparison_table,
+    print_metrics_table,
+    print_priority_breakdown,
+)
+from evaluation.export import thread_results, write_metrics_csv, write_metrics_json
+from evaluation.columnar import ThreadResultWriter
 from thread_handling.thread import Thread
 from algorithms import Algorithm
+from algorithms.registry import ALGORITHMS, algorithm_params, create_algorithm
+from algorithms.closed_form import CLOSED_FORM, ClosedFormDispatcher
+from experiments.cache import (
+    DEFAULT_MAX_BYTES,
+    ResultCache,
+    cache_key,
+    restore_results,
+    workload_digest,
+)
+from experiments.compare import compare_algorithms
+from experiments.sweep import pareto_front, sweep
+from tracing import (
+    ALL_EVENTS,
+    EVENT_NAMES,
+    BinaryTraceWriter,
+    ChromeTraceWriter,
+    ConsolePrinter,
+    Tracer,
+    convert_to_chrome,
+    event_mask,
+    format_event,
+    read_trace,
+)
 
 TICK_RATE = 5  # Ticks per second
 
@@ -44,28 +97,39 @@ def input_validate(
             print(error_msg)
 
 
-def run(threads: list[Thread], algorithm: Algorithm) -> None:
+def run(
+    threads: list[Thread],
+    algorithm: Algorithm,
+    paced: bool = True,
+    chart: str = "plotly",
+) -> None:
     """
     Run the thread scheduling simulation with the given threads and algorithm.
+    A paced run advances one tick at TICK_RATE, otherwise the event-driven engine
+    jumps straight from one scheduling event to the next.
+    The Gantt chart opens in the browser ("plotly") or is printed ("text").
     """
 
-    # Initialize timing
-    tick_interval = 1.0 / TICK_RATE
-    next_tick = time.time() + tick_interval
-
     # Initialize dispatcher
     dispatcher = Dispatcher(threads, algorithm)
 
-    # Main loop
-    while not dispatcher.is_finished():
-        # Advance simulation by one tick
-        dispatcher.tick()
+    if paced:
+        # Initialize timing
+        tick_interval = 1.0 / TICK_RATE
+        next_tick = time.time() + tick_interval
+
+        # Main loop
+        while not dispatcher.is_finished():
+            # Advance simulation by one tick
+            dispatcher.tick()
 
-        # Wait until the next tick
-        sleep_duration = next_tick - time.time()
-        if sleep_duration > 0:
-            time.sleep(sleep_duration)
-        next_tick += tick_interval
+            # Wait until the next tick
+            sleep_duration = next_tick - time.time()
+            if sleep_duration > 0:
+                time.sleep(sleep_duration)
+            next_tick += tick_interval
+    else:
+        dispatcher.run()
 
     # Simulation Finished
     total_time = dispatcher.time_step
@@ -73,12 +137,21 @@ def run(threads: list[Thread], algorithm: Algorithm) -> None:
     print(f"Total Time: {total_time} ticks\n")
 
     # Print Metrics and Gantt Chart
-    metrics = calculate_metrics(dispatcher.threads, dispatcher.gantt_chart)
-    display_gantt_chart(dispatcher.gantt_chart)
+    metrics = calculate_metrics(
+        dispatcher.threads, dispatcher.gantt_segments, dispatcher.live
+    )
+    if chart == "text":
+        print_text_gantt(dispatcher.gantt_segments)
+    else:
+        display_gantt_chart(dispatcher.gantt_segments)
     print_metrics_table(metrics, dispatcher.threads)
+    print_priority_breakdown(priority_breakdown(dispatcher.threads))
 
 
-def main():
+def interactive():
+    """
+    Interactive mode: prompt for the algorithm and threads, then run a paced simulation.
+    """
     print("Welcome to the thread scheduling simulator.")
     while True:
         print("Please select an algorithm to run:")
@@ -88,10 +161,12 @@ def main():
         print("4. Round Robin")
         print("5. Preemptive SJF")
         print("6. Multilevel Queue")
+        print("7. Multilevel Feedback Queue")
+        print("8. Completely Fair Scheduler")
         print("0. Exit")
         choice = input_validate(
             "Please enter your choice: ",
-            lambda x: x in {"0", "1", "2", "3", "4", "5", "6"},
+            lambda x: x in {"0", "1", "2", "3", "4", "5", "6", "7", "8"},
         )
 
         algorithm = None
@@ -132,6 +207,54 @@ def main():
                     )
                 )
                 algorithm = MultilevelQueue(quantum, threshold)
+            case "7":
+                quantum = int(
+                    input_validate(
+                        "Please specify the quantum of the top level (default 4): ",
+                        lambda x: x.isdigit() and int(x) > 0 or x == "",
+                        default_value="4",
+                    )
+                )
+                levels = int(
+                    input_validate(
+                        "Please specify the number of levels (default 3): ",
+                        lambda x: x.isdigit() and int(x) > 0 or x == "",
+                        default_value="3",
+                    )
+                )
+                boost_interval = int(
+                    input_validate(
+                        "Please specify the boost interval, 0 for none (default 0): ",
+                        lambda x: x.isdigit() or x == "",
+                        default_value="0",
+                    )
+                )
+                aging = int(
+                    input_validate(
+                        "Please specify the aging time, 0 for none (default 0): ",
+                        lambda x: x.isdigit() or x == "",
+                        default_value="0",
+                    )
+                )
+                algorithm = MultilevelFeedbackQueue(
+                    quantum, levels, boost_interval, aging
+                )
+            case "8":
+                target_latency = int(
+                    input_validate(
+                        "Please specify the target latency (default 24): ",
+                        lambda x: x.isdigit() and int(x) > 0 or x == "",
+                        default_value="24",
+                    )
+                )
+                min_granularity = int(
+                    input_validate(
+                        "Please specify the minimum granularity (default 3): ",
+                        lambda x: x.isdigit() and int(x) > 0 or x == "",
+                        default_value="3",
+                    )
+                )
+                algorithm = CompletelyFair(target_latency, min_granularity)
 
         print("\nHow do you want to input threads?")
         print("1. From a file")
@@ -217,13 +340,762 @@ def main():
                     (0, max_priority),
                 )
 
+        print("\nHow do you want to run the simulation?")
+        print("1. Paced (tick by tick)")
+        print("2. Fast (event-driven)")
+        choice = input_validate(
+            "Please enter your choice (default 1): ",
+            lambda x: x in {"1", "2"},
+            default_value="1",
+        )
+
         print("Running threads...\n")
 
         if threads and algorithm:
-            run(threads, algorithm)
+            run(threads, algorithm, paced=choice == "1")
 
         input("Press enter to continue...")
 
 
+def add_algorithm_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the algorithm parameter options.
+    """
+    parser.add_argument("--quantum", type=int, default=4, help="default 4")
+    parser.add_argument("--priority-threshold", type=int, default=2, help="default 2")
+    parser.add_argument(
+        "--levels", type=int, default=3, help="mlfq queue levels (default 3)"
+    )
+    parser.add_argument(
+        "--quanta",
+        type=int,
+        nargs="+",
+        metavar="Q",
+        help="quantum of every mlfq level, top first; sets the number of levels "
+        "(default --quantum, doubled every level down)",
+    )
+    parser.add_argument(
+        "--boost-interval",
+        type=int,
+        default=0,
+        help="ticks between mlfq priority boosts (default 0, none)",
+    )
+    parser.add_argument(
+        "--aging",
+        type=int,
+        default=0,
+        help="ticks an mlfq thread waits before promotion (default 0, none)",
+    )
+    parser.add_argument(
+        "--target-latency",
+        type=int,
+        default=24,
+        help="ticks in which every cfs thread runs once (default 24)",
+    )
+    parser.add_argument(
+        "--min-granularity",
+        type=int,
+        default=3,
+        help="shortest cfs slice in ticks when many threads run (default 3)",
+    )
+
+
+def algorithm_options(args: argparse.Namespace) -> dict:
+    """
+    The algorithm parameter options, for algorithm_params() or compare_algorithms().
+    """
+    options = {
+        "quantum": args.quantum,
+        "priority_threshold": args.priority_threshold,
+        "levels": args.levels,
+        "boost_interval": args.boost_interval,
+        "aging": args.aging,
+        "target_latency": args.target_latency,
+        "min_granularity": args.min_granularity,
+    }
+    # Only set when given, so runs with doubling quanta keep their parameters
+    if args.quanta:
+        options["quanta"] = args.quanta
+        options["levels"] = len(args.quanta)
+    return options
+
+
+def add_workload_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the options selecting a workload file or random generator settings.
+    """
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", help="load threads from a workload file")
+    source.add_argument(
+        "--generate", type=int, metavar="N", help="randomly generate N threads"
+    )
+    parser.add_argument("--max-arrival", type=int, default=100, help="default 100")
+    parser.add_argument("--max-burst", type=int, default=10, help="default 10")
+    parser.add_argument("--max-priority", type=int, default=5, help="default 5")
+    parser.add_argument(
+        "--seed", type=int, help="random seed for a reproducible generated workload"
+    )
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the result cache options.
+    """
+    parser.add_argument(
+        "--cache",
+        metavar="DIR",
+        help="reuse results of identical earlier runs stored in DIR, and store new ones",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_BYTES // 2**20,
+        metavar="MB",
+        help=f"evict the least recently used results above this size "
+        f"(default {DEFAULT_MAX_BYTES // 2**20})",
+    )
+
+
+def open_cache(args: argparse.Namespace) -> ResultCache | None:
+    """
+    The result cache selected by the cache options, if any.
+    """
+    if not args.cache:
+        return None
+    return ResultCache(args.cache, args.cache_size * 2**20)
+
+
+def add_trace_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the event tracing options.
+    """
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="record the simulation's events to a binary trace file",
+    )
+    parser.add_argument(
+        "--chrome-trace",
+        metavar="FILE",
+        help="write the schedule and events as Chrome trace JSON, for Perfetto",
+    )
+    parser.add_argument(
+        "--thread-results",
+        metavar="FILE",
+        help="write every thread's results as it completes to a .npz or .parquet file",
+    )
+    parser.add_argument(
+        "--trace-print",
+        action="store_true",
+        help="print the simulation's events as they happen (stderr)",
+    )
+    parser.add_argument(
+        "--trace-events",
+        nargs="+",
+        choices=EVENT_NAMES.values(),
+        metavar="EVENT",
+        help=f"events to trace (default all): {', '.join(EVENT_NAMES.values())}",
+    )
+    parser.add_argument(
+        "--trace-buffer",
+        type=int,
+        default=65536,
+        metavar="EVENTS",
+        help="events buffered between writes to the trace file (default 65536)",
+    )
+
+
+def open_tracer(args: argparse.Namespace, cores: int = 1) -> Tracer | None:
+    """
+    The tracer selected by the tracing options, if any.
+    """
+    if not args.trace and not args.trace_print and not args.chrome_trace:
+        return None
+    events = event_mask(args.trace_events) if args.trace_events else ALL_EVENTS
+    tracer = Tracer(events, capacity=args.trace_buffer)
+    if args.trace:
+        tracer.subscribe(BinaryTraceWriter(args.trace))
+    if args.chrome_trace:
+        tracer.subscribe(ChromeTraceWriter(args.chrome_trace))
+    if args.trace_print:
+        tracer.subscribe(ConsolePrinter(sys.stderr, cores=cores))
+        if not args.trace and not args.chrome_trace:
+            # Print events as they happen rather than a buffer at a time
+            tracer.flush_size = 1
+    return tracer
+
+
+def load_workload(args: argparse.Namespace) -> list[Thread]:
+    """
+    Builds the threads selected by the workload options.
+    """
+    if args.file:
+        return load_threads_from_file(args.file)
+    return generate_threads(
+        args.generate,
+        args.max_arrival,
+        (1, args.max_burst),
+        (0, args.max_priority),
+        args.seed,
+    )
+
+
+def simulate_batch(
+    args: argparse.Namespace,
+    threads: list[Thread],
+    params: dict,
+    tracer: Tracer | None = None,
+    results: ThreadResultWriter | None = None,
+) -> tuple[list, dict]:
+    """
+    Runs the batch simulation selected by args and returns its Gantt segments, one
+    list per core for several cores, and its metrics. Events go to the tracer and
+    completed threads to the results writer, if any.
+    """
+    exported = tracer is not None or results is not None
+    if args.cores > 1:
+        # Every core schedules its own run queue with its own algorithm instance
+        dispatcher = MultiCoreDispatcher(
+            threads,
+            lambda: create_algorithm(args.algorithm, **params),
+            args.cores,
+            BALANCERS[args.balancer](),
+            verbose=False,
+            tracer=tracer,
+        )
+    elif args.algorithm in CLOSED_FORM and not args.instrument and not exported:
+        # Non-preemptive schedules are computed directly instead of simulated
+        dispatcher = ClosedFormDispatcher(threads, args.algorithm)
+    else:
+        algorithm = create_algorithm(args.algorithm, **params)
+        dispatcher = Dispatcher(threads, algorithm, verbose=False, tracer=tracer)
+    if results is not None:
+        dispatcher.on_completion(results)
+
+    # Probes and profiler reports go to stderr so the results stay machine-readable
+    probes = None
+    if args.instrument:
+        if args.cores > 1:
+            sys.exit("--instrument only supports a single core")
+        probes = Instrumentation().attach(dispatcher)
+    if args.profile:
+        print(profile_call(dispatcher.run, args.profile), file=sys.stderr)
+    else:
+        dispatcher.run()
+
+    segments = dispatcher.core_segments if args.cores > 1 else dispatcher.gantt_segments
+    with probes.phase("metrics") if probes else nullcontext():
+        live = dispatcher.live if args.cores == 1 else None
+        metrics = calculate_metrics(dispatcher.threads, segments, live)
+    if probes:
+        probes.detach()
+        format_report(probes.report(), lambda line: print(line, file=sys.stderr))
+    return segments, metrics
+
+
+def batch(args: argparse.Namespace) -> None:
+    """
+    Batch mode: run one simulation without pacing or per-tick output and write its metrics.
+    """
+    threads = load_workload(args)
+    params = algorithm_params(args.algorithm, **algorithm_options(args))
+
+    if args.paced:
+        if args.cores > 1:
+            sys.exit("--paced only supports a single core")
+        algorithm = create_algorithm(args.algorithm, **params)
+        run(threads, algorithm, chart=args.chart or "plotly")
+        return
+
+    parameters = params
+    if args.cores > 1:
+        if args.balancer == "global" and ALGORITHMS[args.algorithm].preemptive:
+            sys.exit(
+                "--balancer global runs every thread to completion, so it only "
+                "supports the non-preemptive algorithms: "
+                + ", ".join(
+                    name for name, cls in ALGORITHMS.items() if not cls.preemptive
+                )
+            )
+        parameters = {**params, "cores": args.cores, "balancer": args.balancer}
+
+    # Reuse the results of an identical earlier run, unless the run itself is measured,
+    # traced or exported
+    tracer = open_tracer(args, args.cores)
+    results = ThreadResultWriter(args.thread_results) if args.thread_results else None
+    exported = tracer is not None or results is not None
+    measured = args.instrument or args.profile or exported
+    cache = None if measured else open_cache(args)
+    cached = None
+    if cache:
+        key = cache_key(workload_digest(threads), args.algorithm, parameters)
+        cached = cache.get(key)
+    if cached:
+        restore_results(threads, cached["threads"])
+        segments, metrics = cached["gantt_segments"], cached["metrics"]
+    else:
+        try:
+            segments, metrics = simulate_batch(args, threads, params, tracer, results)
+        finally:
+            if tracer is not None:
+                tracer.close()
+            if results is not None:
+                results.close(threads)
+        if cache:
+            cache.put(key, threads, segments, metrics)
+
+    result = {
+        "algorithm": args.algorithm,
+        "parameters": parameters,
+        "metrics": metrics,
+        "priority_breakdown": priority_breakdown(threads),
+        "threads": thread_results(threads),
+    }
+    write_results(
+        args, result, [{"algorithm": args.algorithm, **parameters, **metrics}]
+    )
+
+    # Charts go to stderr so the results stay machine-readable
+    if args.chart == "text":
+        cores = segments if args.cores > 1 else [segments]
+        for index, core in enumerate(cores):
+            if args.cores > 1:
+                print(f"Core {index}", file=sys.stderr)
+            print(text_gantt(core), file=sys.stderr)
+    elif args.chart == "plotly":
+        if args.cores > 1:
+            display_core_gantt_chart(segments)
+        else:
+            display_gantt_chart(segments)
+
+    if args.gantt:
+        # All cores in one chart, one row per thread
+        if args.cores > 1:
+            segments = [segment for core in segments for segment in core]
+        start, end = args.gantt_window or (None, None)
+        try:
+            render_gantt(
+                segments, args.gantt, start=start, end=end, max_rows=args.gantt_rows
+            )
+        except ValueError as error:  # e.g. image export without kaleido
+            sys.exit(f"Could not write {args.gantt}: {error}")
+
+
+def compare(args: argparse.Namespace) -> None:
+    """
+    Compare mode: run every algorithm on the same workload in parallel and report one table.
+    """
+    threads = load_workload(args)
+    rows = compare_algorithms(
+        threads,
+        args.algorithms,
+        args.workers,
+        open_cache(args),
+        **algorithm_options(args),
+    )
+    if args.format == "table":
+        print_comparison_table(rows)
+    else:
+        write_results(args, rows, rows)
+
+
+def parameter_sweep(args: argparse.Namespace) -> None:
+    """
+    Sweep mode: run the algorithm for every parameter combination in parallel, printing
+    results as they complete, then report the Pareto-best settings.
+    """
+    threads = load_workload(args)
+    grid = {"quantum": args.quantum, "priority_threshold": args.priority_threshold}
+
+    rows = []
+    for row in sweep(threads, args.algorithm, grid, args.results, args.workers):
+        params = algorithm_params(row["algorithm"], **row)
+        print(
+            f"{params}: waiting {row['average_waiting_time']:.2f}, "
+            f"turnaround {row['average_turnaround_time']:.2f}, "
+            f"throughput {row['throughput']:.4f}"
+        )
+        rows.append(row)
+
+    print("\nPareto-best settings:")
+    print_comparison_table(pareto_front(rows))
+
+
+def stream(args: argparse.Namespace) -> None:
+    """
+    Stream mode: pull threads lazily in arrival order, print sliding-window statistics
+    every interval and finish with the online summary metrics.
+    """
+    if args.file:
+        threads = iter_threads(iter_thread_chunks(args.file))
+    else:
+        # A generated workload is built whole, then streamed in arrival order
+        table = generate_threads(
+            args.generate,
+            args.max_arrival,
+            (1, args.max_burst),
+            (0, args.max_priority),
+            args.seed,
+        )
+        threads = sorted(iter_threads([table]), key=lambda th: th.arrival)
+    params = algorithm_params(args.algorithm, **algorithm_options(args))
+
+    def print_window(stats: dict) -> None:
+        print(
+            f"[{stats['start']}, {stats['end']}) completed {stats['completed']}, "
+            f"live {stats['live_threads']}, CPU {stats['cpu_utilization']:.1f}%, "
+            f"waiting avg {stats['average_waiting_time']:.2f} p95 {stats['waiting_time_p95']:.2f}, "
+            f"turnaround avg {stats['average_turnaround_time']:.2f} p95 {stats['turnaround_time_p95']:.2f}"
+        )
+
+    results = ThreadResultWriter(args.thread_results) if args.thread_results else None
+    if results is not None:
+        threads = results.watch(threads)
+    dispatcher = StreamingDispatcher(
+        threads,
+        create_algorithm(args.algorithm, **params),
+        interval=args.interval,
+        window_length=args.window,
+        on_window=print_window,
+        tracer=open_tracer(args),
+    )
+    if results is not None:
+        dispatcher.on_completion(results)
+    try:
+        dispatcher.run(args.until)
+    finally:
+        if dispatcher.tracer is not None:
+            dispatcher.tracer.close()
+        if results is not None:
+            results.close()
+    write_metrics_json(
+        {
+            "algorithm": args.algorithm,
+            "parameters": params,
+            "metrics": dispatcher.summary(),
+        },
+        sys.stdout,
+    )
+
+
+def show_trace(args: argparse.Namespace) -> None:
+    """
+    Trace mode: print the events of a binary trace file, one per line, or convert it
+    to Chrome trace JSON.
+    """
+    if args.chrome:
+        convert_to_chrome(args.file, args.chrome)
+        return
+    events = event_mask(args.events) if args.events else ALL_EVENTS
+    for event in read_trace(args.file):
+        if event.kind & events:
+            print(format_event(event, args.cores))
+
+
+def convert(args: argparse.Namespace) -> None:
+    """
+    Convert mode: rewrite a text workload file in the binary fast-load format.
+    """
+    count = convert_text_to_binary(args.source, args.destination, args.id_width)
+    print(f"Wrote {count} threads to {args.destination}")
+
+
+def generate(args: argparse.Namespace) -> None:
+    """
+    Generate mode: write a seeded synthetic workload straight to a workload file.
+    """
+    table = generate_workload(
+        args.threads,
+        seed=args.seed,
+        arrival=args.arrival,
+        arrival_rate=args.arrival_rate,
+        max_arrival=args.max_arrival,
+        cluster_size=args.cluster_size,
+        burst=args.burst,
+        mean_burst=args.mean_burst,
+        burst_shape=args.burst_shape,
+        burst_range=(1, args.max_burst),
+        priority=args.priority,
+        priority_range=(0, args.max_priority),
+        priority_skew=args.priority_skew,
+    )
+    write_workload(args.output, table, args.binary)
+    print(f"Wrote {len(table)} threads to {args.output}")
+
+
+def write_results(args: argparse.Namespace, result, rows: list[dict]) -> None:
+    """
+    Writes a result as JSON or its flat rows as CSV, to --output or stdout.
+    """
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            write_metrics_json(result, output)
+        else:
+            write_metrics_csv(rows, output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Thread scheduling simulator. Runs interactively when no command is given."
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser(
+        "interactive", help="prompt for settings and run a paced simulation"
+    )
+
+    batch_parser = commands.add_parser(
+        "run", help="run one simulation headless and write its metrics"
+    )
+    batch_parser.add_argument("--algorithm", "-a", required=True, choices=ALGORITHMS)
+    add_algorithm_arguments(batch_parser)
+    add_workload_arguments(batch_parser)
+    add_cache_arguments(batch_parser)
+    add_trace_arguments(batch_parser)
+    batch_parser.add_argument("--format", choices=("json", "csv"), default="json")
+    batch_parser.add_argument("--output", "-o", help="output file (default stdout)")
+    batch_parser.add_argument(
+        "--cores", type=int, default=1, help="simulated CPU cores (default 1)"
+    )
+    batch_parser.add_argument(
+        "--balancer",
+        choices=BALANCERS,
+        default="steal",
+        help="how threads are spread over the cores (default steal)",
+    )
+    batch_parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help="time the dispatcher phases and count scheduling events (stderr)",
+    )
+    batch_parser.add_argument(
+        "--profile",
+        choices=("cprofile", "sample"),
+        help="profile the simulation and print the report (stderr)",
+    )
+    batch_parser.add_argument(
+        "--chart",
+        choices=("plotly", "text"),
+        help="show the Gantt chart in the browser or as text (stderr unless --paced), "
+        "default plotly with --paced and none otherwise",
+    )
+    batch_parser.add_argument(
+        "--gantt",
+        metavar="FILE",
+        help="write a Gantt chart to FILE, HTML or an image such as .png (needs kaleido)",
+    )
+    batch_parser.add_argument(
+        "--gantt-window",
+        type=int,
+        nargs=2,
+        metavar=("START", "END"),
+        help="chart only this time window, drawn in more detail",
+    )
+    batch_parser.add_argument(
+        "--gantt-rows",
+        type=int,
+        default=DEFAULT_MAX_ROWS,
+        help=f"most chart rows, the least busy threads are grouped (default {DEFAULT_MAX_ROWS})",
+    )
+    batch_parser.add_argument(
+        "--paced",
+        action="store_true",
+        help="run tick by tick at TICK_RATE with per-tick output and charts instead",
+    )
+
+    compare_parser = commands.add_parser(
+        "compare", help="run all algorithms on one workload in parallel"
+    )
+    compare_parser.add_argument(
+        "--algorithms",
+        nargs="+",
+        choices=ALGORITHMS,
+        metavar="ALGORITHM",
+        help="algorithms to compare (default all)",
+    )
+    add_algorithm_arguments(compare_parser)
+    add_workload_arguments(compare_parser)
+    add_cache_arguments(compare_parser)
+    compare_parser.add_argument(
+        "--workers", type=int, help="worker processes (default one per core)"
+    )
+    compare_parser.add_argument(
+        "--format", choices=("table", "json", "csv"), default="table"
+    )
+    compare_parser.add_argument("--output", "-o", help="output file (default stdout)")
+
+    sweep_parser = commands.add_parser(
+        "sweep", help="run one algorithm over a grid of parameter values"
+    )
+    sweep_parser.add_argument("--algorithm", "-a", required=True, choices=("rr", "mlq"))
+    sweep_parser.add_argument(
+        "--quantum", type=int, nargs="+", default=[4], help="quantum values to try"
+    )
+    sweep_parser.add_argument(
+        "--priority-threshold",
+        type=int,
+        nargs="+",
+        default=[2],
+        help="priority threshold values to try (mlq only)",
+    )
+    add_workload_arguments(sweep_parser)
+    sweep_parser.add_argument(
+        "--workers", type=int, help="worker processes (default one per core)"
+    )
+    sweep_parser.add_argument(
+        "--results",
+        help="JSON lines file that receives each result and lets the sweep resume",
+    )
+
+    stream_parser = commands.add_parser(
+        "stream",
+        help="simulate a workload as a stream with online metrics and bounded memory",
+    )
+    stream_parser.add_argument("--algorithm", "-a", required=True, choices=ALGORITHMS)
+    add_algorithm_arguments(stream_parser)
+    add_workload_arguments(stream_parser)
+    stream_parser.add_argument(
+        "--interval",
+        type=int,
+        default=1000,
+        help="ticks between reports (default 1000)",
+    )
+    stream_parser.add_argument(
+        "--window",
+        type=int,
+        help="ticks covered by each report, a multiple of --interval (default --interval)",
+    )
+    stream_parser.add_argument(
+        "--until", type=int, help="stop at this time even if threads remain"
+    )
+    add_trace_arguments(stream_parser)
+
+    trace_parser = commands.add_parser(
+        "trace", help="print the events of a trace file written with --trace"
+    )
+    trace_parser.add_argument("file", help="binary trace file")
+    trace_parser.add_argument(
+        "--events",
+        nargs="+",
+        choices=EVENT_NAMES.values(),
+        metavar="EVENT",
+        help="events to print (default all)",
+    )
+    trace_parser.add_argument(
+        "--cores", action="store_true", help="show the core of every event"
+    )
+    trace_parser.add_argument(
+        "--chrome",
+        metavar="FILE",
+        help="convert the trace to Chrome trace JSON for Perfetto instead of printing it",
+    )
+
+    convert_parser = commands.add_parser(
+        "convert", help="convert a text workload file to the binary fast-load format"
+    )
+    convert_parser.add_argument("source", help="text workload file")
+    convert_parser.add_argument("destination", help="binary workload file to write")
+    convert_parser.add_argument(
+        "--id-width", type=int, default=16, help="bytes per thread ID (default 16)"
+    )
+
+    generate_parser = commands.add_parser(
+        "generate", help="write a seeded synthetic workload to a workload file"
+    )
+    generate_parser.add_argument("output", help="workload file to write")
+    generate_parser.add_argument(
+        "--threads", "-n", type=int, required=True, help="number of threads"
+    )
+    generate_parser.add_argument(
+        "--seed", type=int, help="random seed, the same seed gives the same workload"
+    )
+    generate_parser.add_argument(
+        "--binary", action="store_true", help="write the binary fast-load format"
+    )
+    generate_parser.add_argument(
+        "--arrival", choices=ARRIVAL_PATTERNS, default="poisson", help="default poisson"
+    )
+    generate_parser.add_argument(
+        "--arrival-rate",
+        type=float,
+        default=0.2,
+        help="mean arrivals per tick (default 0.2)",
+    )
+    generate_parser.add_argument(
+        "--max-arrival",
+        type=int,
+        help="last arrival time for uniform arrivals (default threads / rate)",
+    )
+    generate_parser.add_argument(
+        "--cluster-size",
+        type=float,
+        default=20.0,
+        help="mean threads per cluster for bursty arrivals (default 20)",
+    )
+    generate_parser.add_argument(
+        "--burst",
+        choices=BURST_DISTRIBUTIONS,
+        default="lognormal",
+        help="default lognormal",
+    )
+    generate_parser.add_argument(
+        "--mean-burst", type=float, default=5.0, help="default 5"
+    )
+    generate_parser.add_argument(
+        "--burst-shape",
+        type=float,
+        default=1.0,
+        help="lognormal sigma or Pareto index, which must be > 1 (default 1)",
+    )
+    generate_parser.add_argument(
+        "--max-burst",
+        type=int,
+        default=1_000_000,
+        help="bursts are clipped to this, and uniform bursts drawn up to it (default 1000000)",
+    )
+    generate_parser.add_argument(
+        "--priority",
+        choices=PRIORITY_DISTRIBUTIONS,
+        default="zipf",
+        help="default zipf",
+    )
+    generate_parser.add_argument(
+        "--max-priority", type=int, default=5, help="default 5"
+    )
+    generate_parser.add_argument(
+        "--priority-skew",
+        type=float,
+        default=1.0,
+        help="Zipf exponent for skewed priorities (default 1)",
+    )
+
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = build_parser().parse_args(argv)
+    match args.command:
+        case "run":
+            batch(args)
+        case "compare":
+            compare(args)
+        case "sweep":
+            parameter_sweep(args)
+        case "stream":
+            stream(args)
+        case "trace":
+            show_trace(args)
+        case "convert":
+            convert(args)
+        case "generate":
+            generate(args)
+        case _:
+            interactive()
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,12 @@
+from .balancers import BALANCERS, Affinity, Balancer, GlobalQueue, WorkStealing
+from .dispatcher import Core, MultiCoreDispatcher
+
+__all__ = [
+    "BALANCERS",
+    "Affinity",
+    "Balancer",
+    "GlobalQueue",
+    "WorkStealing",
+    "Core",
+    "MultiCoreDispatcher",
+]
@@ -0,0 +1,162 @@
+import heapq
+from typing import Callable
+from zlib import crc32
+
+from algorithms import Algorithm
+from thread_handling.thread import Thread
+
+
+class Balancer:
+    """
+    Base class for multi-core load balancing: decides which core's run queue receives
+    each arriving thread and what an idle core should run next.
+    """
+
+    def __init__(self) -> None:
+        self.cores: list = []  # the dispatcher's cores, set by attach()
+
+    def attach(self, cores: list, algorithm_factory: Callable[[], Algorithm]) -> None:
+        """
+        Called by the dispatcher with its cores and the factory of their algorithms
+        before the simulation starts.
+        """
+        self.cores = cores
+
+    def assign(self, thread: Thread, time_step: int) -> int | None:
+        """
+        Returns the index of the core whose run queue receives a thread arriving at
+        time_step, or None to keep it in the balancer until take() hands it to an
+        idle core.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses")
+
+    def take(self, core) -> Thread | None:
+        """
+        Returns a thread for a core that has run out of work, or None if there is none.
+        """
+        return None
+
+    def load_changed(self, core) -> None:
+        """
+        Called by the dispatcher whenever the load of a core changes.
+        """
+
+    def reset(self) -> None:
+        """
+        Resets the balancer state for a new simulation.
+        """
+
+
+class GlobalQueue(Balancer):
+    """
+    One shared queue, ordered by an instance of the simulated algorithm: a core that
+    runs out of work takes the waiting thread the algorithm would run next, e.g. the
+    shortest job for sjf, so no core idles while threads are waiting.
+
+    A thread stays on the core it was handed to, which only ever has that one thread,
+    so it runs to completion. That is only the algorithm's own schedule for the
+    non-preemptive ones: a preemptive algorithm is rejected with a ValueError rather
+    than silently simulated without preemption or time slices.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queue: Algorithm | None = None  # created by attach()
+
+    def attach(self, cores: list, algorithm_factory: Callable[[], Algorithm]) -> None:
+        super().attach(cores, algorithm_factory)
+        self.queue = algorithm_factory()
+        if self.queue.preemptive:
+            raise ValueError(
+                "The global queue runs every thread to completion, so it does not "
+                f"support the preemptive {type(self.queue).__name__} algorithm"
+            )
+
+    def assign(self, thread: Thread, time_step: int) -> int | None:
+        self.queue.admit([thread], time_step)
+        return None
+
+    def take(self, core) -> Thread | None:
+        return self.queue.take()
+
+    def reset(self) -> None:
+        self.queue.reset()
+
+
+class WorkStealing(Balancer):
+    """
+    Per-core run queues filled round-robin. A core that runs out of work steals a
+    waiting thread from the most loaded core, found through a max-heap of the cores
+    by load rather than by scanning every core on each steal.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.next_core: int = 0  # core that receives the next arrival
+        # (-load, core index) max-heap of the cores with work waiting. An entry is
+        # stale once its core's load has changed, a newer entry was pushed for it then.
+        self.loads: list[tuple[int, int]] = []
+
+    def assign(self, thread: Thread, time_step: int) -> int | None:
+        core = self.next_core
+        self.next_core = (core + 1) % len(self.cores)
+        return core
+
+    def take(self, core) -> Thread | None:
+        # The most loaded core, the first one on ties
+        loads = self.loads
+        while loads and self.cores[loads[0][1]].load != -loads[0][0]:
+            heapq.heappop(loads)
+        if not loads:
+            return None
+        victim = self.cores[loads[0][1]]
+        if victim is core:
+            return None
+        thread = victim.algorithm.steal()
+        if thread is not None and thread.burst > 0:
+            victim.load -= 1
+            self.load_changed(victim)
+        return thread
+
+    def load_changed(self, core) -> None:
+        # Only a core with work waiting besides its running thread can give some up
+        if core.load >= 2:
+            heapq.heappush(self.loads, (-core.load, core.index))
+            if len(self.loads) > 4 * len(self.cores):
+                # Drop the stale entries
+                self.loads = [
+                    (-other.load, other.index)
+                    for other in self.cores
+                    if other.load >= 2
+                ]
+                heapq.heapify(self.loads)
+
+    def reset(self) -> None:
+        self.next_core = 0
+        self.loads.clear()
+
+
+class Affinity(WorkStealing):
+    """
+    Per-core run queues where each thread always runs on its home core, chosen by a
+    hash of its ID, e.g. to keep a thread's cache warm. With steal=True an idle core
+    may still take waiting threads from other cores.
+    """
+
+    def __init__(self, steal: bool = False) -> None:
+        super().__init__()
+        self.steal = steal
+
+    def assign(self, thread: Thread, time_step: int) -> int | None:
+        return crc32(str(thread.thread_id).encode()) % len(self.cores)
+
+    def take(self, core) -> Thread | None:
+        return super().take(core) if self.steal else None
+
+
+# Command-line name of every balancer
+BALANCERS: dict[str, type[Balancer]] = {
+    "global": GlobalQueue,
+    "steal": WorkStealing,
+    "affinity": Affinity,
+}
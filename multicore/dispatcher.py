@@ -0,0 +1,249 @@
+import heapq
+from typing import Callable
+
+from algorithms import Algorithm
+from dispatcher import count_unfinished, record_segment
+from thread_handling.arrival_index import ArrivalIndex
+from thread_handling.thread import Thread
+from thread_handling.thread_table import ThreadTable
+from tracing import ARRIVAL, COMPLETION, DISPATCH, IDLE, Tracer, console_tracer
+
+from .balancers import Balancer
+
+
+class Core:
+    """
+    One simulated CPU core with its own scheduling algorithm and Gantt chart.
+    """
+
+    def __init__(self, index: int, algorithm: Algorithm) -> None:
+        self.index: int = index
+        self.algorithm: Algorithm = algorithm
+        self.algorithm.core = index
+        # Gantt chart data as (thread_id, start, end) runs, end exclusive
+        self.segments: list[tuple[str, int, int]] = []
+        self.load: int = 0  # threads in this core's run queue, running one included
+        self.thread: Thread | None = None  # thread of the current run
+        self.run_start: int = 0  # time of the current run's first tick
+        self.run_end: int = 0  # planned end of the current run, exclusive
+        self.idle_since: int | None = 0  # start of the current idle period
+
+    def reset(self) -> None:
+        self.algorithm.reset()
+        self.segments.clear()
+        self.load = 0
+        self.thread = None
+        self.run_start = self.run_end = 0
+        self.idle_since = 0
+
+
+class MultiCoreDispatcher:
+    """
+    Simulates threads on several CPU cores. Each core runs its own instance of a
+    scheduling algorithm over its own run queue, and a Balancer decides which core
+    receives each thread. Event-driven like Dispatcher.step: a core is only visited
+    when its run ends or it receives work, so idle cores cost nothing per tick.
+    """
+
+    def __init__(
+        self,
+        threads: list[Thread],
+        algorithm_factory: Callable[[], Algorithm],
+        cores: int,
+        balancer: Balancer,
+        verbose: bool = True,
+        tracer: Tracer | None = None,
+    ) -> None:
+        if cores < 1:
+            raise ValueError("At least one core is needed")
+        self.time_step: int = 0  # Time of the last event
+        self.threads: list[Thread] = threads  # All threads to be scheduled
+        self.verbose: bool = verbose  # Print every run and scheduling decision
+        if tracer is None and verbose:
+            tracer = console_tracer(cores=cores)
+        self.tracer: Tracer | None = tracer  # Records the simulation's events, if any
+        self.cores: list[Core] = [Core(i, algorithm_factory()) for i in range(cores)]
+        for core in self.cores:
+            core.algorithm.tracer = tracer
+        self.balancer: Balancer = balancer
+        self.balancer.attach(self.cores, algorithm_factory)
+        self.arrival_index = ArrivalIndex(threads)  # Threads sorted by arrival time
+        self.unfinished: int = count_unfinished(threads)
+        self.events: list[tuple[int, int]] = []  # (run end, core index) min-heap
+        self.idle: dict[int, Core] = {core.index: core for core in self.cores}
+        # Called with every thread as it completes, see on_completion()
+        self.completion_listeners: list[Callable[[Thread], None]] = []
+
+    def on_completion(self, listener: Callable[[Thread], None]) -> None:
+        """
+        Calls listener(thread) whenever a thread completes, with its completion_time
+        and metrics set, like Dispatcher.on_completion().
+        """
+        self.completion_listeners.append(listener)
+
+    @property
+    def core_segments(self) -> list[list[tuple[str, int, int]]]:
+        """The Gantt chart of every core, one list of (thread_id, start, end) per core."""
+        return [core.segments for core in self.cores]
+
+    def _admit(self, core: Core, threads: list[Thread], time_step: int) -> None:
+        """Adds threads to a core's run queue. The caller must reschedule the core now."""
+        core.load += sum(1 for th in threads if th.burst > 0)
+        self.balancer.load_changed(core)
+        if core.thread is not None and core.run_end > time_step:
+            # Cut the current run short, the new threads may preempt it. The run is
+            # simulated up to now first, so the algorithm admits them in its state now.
+            self._end_run(core, time_step)
+        elif core.idle_since is not None:
+            del self.idle[core.index]
+            if core.idle_since < time_step:
+                self._record_idle(core, time_step)
+            core.idle_since = None
+        core.algorithm.admit(threads, time_step)
+
+    def _record_idle(self, core: Core, time_step: int) -> None:
+        """Logs a core's idle time from idle_since up to time_step."""
+        trace = self.tracer
+        if trace is not None and trace.enabled & IDLE:
+            length = time_step - core.idle_since
+            trace.emit(IDLE, core.idle_since, length=length, core=core.index)
+        record_segment(core.segments, "IDLE", core.idle_since, time_step)
+
+    def _end_run(self, core: Core, time_step: int) -> None:
+        """Simulates the rest of a core's current run up to time_step and logs it."""
+        thread = core.thread
+        ticks = time_step - core.run_start
+        if ticks > 1:
+            core.algorithm.advance(core.run_start + 1, ticks - 1)
+        trace = self.tracer
+        if trace is not None and trace.enabled & DISPATCH:
+            trace.emit(
+                DISPATCH,
+                core.run_start,
+                thread.thread_id,
+                length=ticks,
+                core=core.index,
+            )
+        record_segment(core.segments, thread.thread_id, core.run_start, time_step)
+        if thread.burst > 0 and thread.completion_time == time_step:
+            core.load -= 1
+            self.balancer.load_changed(core)
+            self.unfinished -= 1
+            if trace is not None and trace.enabled & COMPLETION:
+                trace.emit(COMPLETION, time_step, thread.thread_id, core=core.index)
+            for listener in self.completion_listeners:
+                listener(thread)
+        core.thread = None
+        core.run_end = time_step
+
+    def _schedule(self, core: Core, time_step: int) -> None:
+        """Lets the core's algorithm pick a thread and starts its run, or idles the core."""
+        thread = core.algorithm.tick(time_step)
+        while thread is None:
+            # Threads handed over may turn out to have nothing left to run
+            taken = self.balancer.take(core)
+            if taken is None:
+                break
+            self._admit(core, [taken], time_step)
+            thread = core.algorithm.tick(time_step)
+        if thread is None:
+            core.idle_since = time_step
+            self.idle[core.index] = core
+            return
+
+        # Run the thread for as long as the algorithm allows, the first tick already ran
+        core.thread = thread
+        core.run_start = time_step
+        core.run_end = time_step + 1 + max(0, core.algorithm.run_length())
+        heapq.heappush(self.events, (core.run_end, core.index))
+
+    def step(self) -> int:
+        """
+        Advances the simulation to the next event, the end of a core's run or an arrival,
+        and returns the number of ticks that passed.
+        """
+        start = self.time_step
+        times = [self.events[0][0]] if self.events else []
+        next_arrival = self.arrival_index.next_arrival()
+        if next_arrival is not None:
+            times.append(next_arrival)
+        now = min(times) if times else start + 1
+
+        # End the runs finishing now. Entries of runs that were cut short are stale.
+        due: dict[int, Core] = {}
+        while self.events and self.events[0][0] == now:
+            _, index = heapq.heappop(self.events)
+            core = self.cores[index]
+            if core.thread is not None and core.run_end == now:
+                self._end_run(core, now)
+                due[index] = core
+
+        # Hand the arriving threads to their cores, or keep them in the balancer
+        arrivals = self.arrival_index.pop_arrivals(now)
+        assigned: dict[int, list[Thread]] = {}
+        trace = self.tracer
+        for thread in arrivals:
+            index = self.balancer.assign(thread, now)
+            if trace is not None and trace.enabled & ARRIVAL:
+                # Threads kept in the balancer are traced on core 0
+                trace.emit(ARRIVAL, now, thread.thread_id, core=index or 0)
+            if index is not None:
+                assigned.setdefault(index, []).append(thread)
+        for index, threads in assigned.items():
+            self._admit(self.cores[index], threads, now)
+            due[index] = self.cores[index]
+
+        # Nothing is scheduled once the last thread has finished
+        if self.is_finished():
+            self.time_step = now
+            return now - start
+
+        for core in due.values():
+            self._schedule(core, now)
+
+        # New work may let idle cores start, stop at the first that finds none
+        while arrivals and self.idle:
+            core = next(iter(self.idle.values()))
+            thread = self.balancer.take(core)
+            if thread is None:
+                break
+            self._admit(core, [thread], now)
+            self._schedule(core, now)
+
+        self.time_step = now
+        return now - start
+
+    def run(self) -> None:
+        """Runs the simulation to completion, then idles every core up to the end."""
+        while not self.is_finished():
+            self.step()
+        end = max((core.run_end for core in self.cores), default=0)
+        self.time_step = end
+        for core in self.cores:
+            if core.thread is not None:
+                self._end_run(core, core.run_end)
+            if core.idle_since is not None and core.idle_since < end:
+                self._record_idle(core, end)
+                core.idle_since = end
+        if self.tracer is not None:
+            self.tracer.flush()
+
+    def reset(self) -> None:
+        """Resets the dispatcher, cores and all threads for a new simulation."""
+        self.time_step = 0
+        self.arrival_index.reset()
+        self.balancer.reset()
+        self.events.clear()
+        for core in self.cores:
+            core.reset()
+        self.idle = {core.index: core for core in self.cores}
+        if isinstance(self.threads, ThreadTable):
+            self.threads.reset()
+        else:
+            for thread in self.threads:
+                thread.reset()
+        self.unfinished = count_unfinished(self.threads)
+
+    def is_finished(self) -> bool:
+        """Checks if all threads have finished execution."""
+        return self.unfinished == 0
@@ -0,0 +1,165 @@
+from collections import deque
+from typing import Callable, Iterable
+
+from algorithms import Algorithm
+from dispatcher import Dispatcher
+from evaluation.online import TIME_METRICS, OnlineMetric
+from thread_handling.thread import Thread
+from thread_handling.thread_stream import ThreadStream
+from tracing import Tracer
+
+
+class WindowInterval:
+    """
+    Accumulated activity of one reporting interval of a streaming simulation.
+    """
+
+    def __init__(self, start: int, relative_accuracy: float) -> None:
+        self.start: int = start
+        self.end: int = start  # set when the interval is closed
+        self.busy_time: int = 0
+        self.completed: int = 0
+        self.metrics = {name: OnlineMetric(relative_accuracy) for name in TIME_METRICS}
+
+
+class StreamingDispatcher(Dispatcher):
+    """
+    Dispatcher for an unbounded stream of threads sorted by arrival time.
+    Threads are pulled from the iterator only when simulated time reaches their arrival
+    and are retired once finished, after their metrics have been folded into online
+    accumulators, so memory stays proportional to the live threads instead of the
+    history. No Gantt segments are kept: gantt_segments stays empty.
+
+    Every `interval` ticks the statistics of the last `window_length` ticks are passed
+    to `on_window` (the window slides by one interval at a time).
+    """
+
+    def __init__(
+        self,
+        threads: Iterable[Thread],
+        algorithm: Algorithm,
+        interval: int = 1000,
+        window_length: int | None = None,
+        on_window: Callable[[dict], None] | None = None,
+        verbose: bool = False,
+        relative_accuracy: float = 0.01,
+        tracer: Tracer | None = None,
+    ) -> None:
+        window_length = window_length or interval
+        if interval <= 0 or window_length % interval:
+            raise ValueError("window_length must be a positive multiple of interval")
+        super().__init__([], algorithm, verbose, tracer)
+        self.arrival_index = ThreadStream(threads)  # Lazy source of arriving threads
+        self.relative_accuracy = relative_accuracy
+
+        # Totals over the whole simulation, on top of the live metrics
+        self.metrics = {name: OnlineMetric(relative_accuracy) for name in TIME_METRICS}
+
+        # Sliding window of the most recent closed intervals and the open one
+        self.interval = interval
+        self.on_window = on_window
+        self.window: deque[WindowInterval] = deque(maxlen=window_length // interval)
+        self.current_interval = WindowInterval(0, relative_accuracy)
+
+    def _admit_arrivals(self, time_step: int) -> None:
+        """Passes the threads arriving at time_step to the algorithm."""
+        arrivals = self.arrival_index.pop_arrivals(time_step)
+        if arrivals:
+            # Threads without burst time are finished on arrival and never retired
+            self.unfinished += sum(1 for th in arrivals if th.burst > 0)
+            self._admit(arrivals, time_step)
+
+    def _record(self, thread_id: str, start: int, end: int) -> None:
+        """Folds a run into the totals and the intervals it spans instead of storing it."""
+        self.live.record_run(thread_id, start, end)
+        busy = thread_id != "IDLE"
+
+        # Close every interval that ends before the last tick of this run
+        interval = self.current_interval
+        while end - 1 >= interval.start + self.interval:
+            boundary = interval.start + self.interval
+            if busy:
+                interval.busy_time += max(0, boundary - max(start, interval.start))
+            self._close_interval(boundary)
+            interval = self.current_interval
+        if busy:
+            interval.busy_time += end - max(start, interval.start)
+
+    def _close_interval(self, end: int) -> None:
+        """Closes the open interval at end, reports the window and opens the next one."""
+        interval = self.current_interval
+        interval.end = end
+        self.window.append(interval)
+        self.current_interval = WindowInterval(end, self.relative_accuracy)
+        if self.on_window:
+            self.on_window(self.window_stats())
+
+    def _complete(self, thread: Thread) -> None:
+        """Retires a thread that just finished, folding in its metrics."""
+        super()._complete(thread)
+        values = {
+            "waiting_time": thread.waiting_time,
+            "turnaround_time": thread.turnaround_time,
+            "response_time": thread.start_time - thread.arrival,
+        }
+        interval = self.current_interval
+        interval.completed += 1
+        for name, value in values.items():
+            self.metrics[name].add(value)
+            interval.metrics[name].add(value)
+
+    def run(self, until: int | None = None) -> None:
+        """
+        Runs the simulation until the stream is exhausted and every thread has finished,
+        or until time `until` for streams that never end, then reports the last interval.
+        """
+        while not self.is_finished() and (until is None or self.time_step < until):
+            self.step()
+        if self.time_step > self.current_interval.start:
+            self._close_interval(self.time_step)
+        if self.tracer is not None:
+            self.tracer.flush()
+
+    def reset(self) -> None:
+        raise ValueError("A streaming simulation cannot be reset")
+
+    def is_finished(self) -> bool:
+        """Checks if the stream is exhausted and every admitted thread has finished."""
+        return self.arrival_index.is_exhausted() and self.unfinished == 0
+
+    def window_stats(self) -> dict:
+        """
+        Statistics of the threads that finished in the current sliding window.
+        """
+        start = self.window[0].start
+        end = self.window[-1].end
+        busy_time = sum(interval.busy_time for interval in self.window)
+        completed = sum(interval.completed for interval in self.window)
+        stats = {
+            "start": start,
+            "end": end,
+            "completed": completed,
+            "live_threads": self.unfinished,
+            "cpu_utilization": busy_time / (end - start) * 100,
+            "throughput": completed / (end - start),
+        }
+        for name in TIME_METRICS:
+            merged = OnlineMetric(self.relative_accuracy)
+            for interval in self.window:
+                merged.merge(interval.metrics[name])
+            stats.update(merged.summary(name))
+        return stats
+
+    def summary(self) -> dict:
+        """
+        Metrics over every thread retired so far, keyed like calculate_metrics.
+        Percentiles are approximate, within the sketch's relative accuracy.
+        """
+        stats = self.live_metrics()
+        for name in TIME_METRICS:
+            summary = self.metrics[name].summary(name)
+            # The live metrics hold exact sums, use them for the mean and deviation
+            for key in (f"average_{name}", f"{name}_std"):
+                summary[key] = stats.pop(key)
+            stats.update(summary)
+        return stats
@@ -1,5 +1,13 @@
 from .thread import Thread
-from .thread_file_loader import load_threads_from_file
+from .thread_table import ThreadTable, ThreadView
+from .arrival_index import ArrivalIndex
+from .thread_file_loader import (
+    convert_text_to_binary,
+    iter_thread_chunks,
+    load_threads_from_file,
+)
 from .thread_generator import generate_threads
+from .thread_stream import ThreadStream, iter_threads
+from .workload_generator import generate_workload, write_workload
 
-__all__ = ['Thread', 'load_threads_from_file', 'generate_threads']
\ No newline at end of file
+__all__ = ['Thread', 'ThreadTable', 'ThreadView', 'ArrivalIndex', 'load_threads_from_file', 'iter_thread_chunks', 'convert_text_to_binary', 'generate_threads', 'ThreadStream', 'iter_threads', 'generate_workload', 'write_workload']
\ No newline at end of file
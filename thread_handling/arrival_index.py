@@ -0,0 +1,89 @@
+import numpy as np
+
+from .thread import Thread
+from .thread_table import ThreadTable
+
+# Rows of a ThreadTable turned into views at a time, ahead of their arrival
+BLOCK_SIZE = 1024
+
+
+class ArrivalIndex:
+    """
+    Threads sorted by arrival time, with a cursor marking the ones already handed out.
+    Threads that arrive at the same time keep their original order.
+    A ThreadTable is indexed by row instead, and the views of its threads are created
+    a block at a time as they start to arrive.
+    """
+
+    def __init__(self, threads: list[Thread]) -> None:
+        self.table: ThreadTable | None = None
+        if isinstance(threads, ThreadTable):
+            self.table = threads
+            self.rows: np.ndarray = np.argsort(threads.arrival, kind="stable")
+        else:
+            self.threads: list[Thread] = sorted(threads, key=lambda th: th.arrival)
+        self.reset()
+
+    def _load_block(self) -> None:
+        """Creates the views of the next block of table rows in arrival order."""
+        start = self.cursor
+        self.block = self.table.views(self.rows[start : start + BLOCK_SIZE])
+        self.offset = 0
+
+    def pop_arrivals(self, time_step: int) -> list[Thread]:
+        """
+        Returns the threads that arrived up to time_step and were not returned before.
+        Each thread is returned exactly once, so the total cost is O(1) per thread.
+        """
+        if self.upcoming is None or self.upcoming > time_step:
+            return []
+        if self.table is None:
+            start = end = self.cursor
+            while end < len(self.threads) and self.threads[end].arrival <= time_step:
+                end += 1
+            self.cursor = end
+            self.upcoming = self._upcoming()
+            return self.threads[start:end]
+
+        arrivals = []
+        while self.upcoming is not None and self.upcoming <= time_step:
+            if self.offset == len(self.block):
+                self._load_block()
+            start = end = self.offset
+            block = self.block
+            while end < len(block) and block[end].arrival <= time_step:
+                end += 1
+            arrivals += block[start:end]
+            self.cursor += end - start
+            self.offset = end
+            self.upcoming = self._upcoming()
+        return arrivals
+
+    def _upcoming(self) -> int | None:
+        """Arrival time of the first thread that has not arrived yet, if any."""
+        if self.table is not None:
+            if self.offset < len(self.block):
+                return self.block[self.offset].arrival
+            if self.cursor < len(self.rows):
+                return self.table.arrival.item(self.rows.item(self.cursor))
+        elif self.cursor < len(self.threads):
+            return self.threads[self.cursor].arrival
+        return None
+
+    def next_arrival(self) -> int | None:
+        """
+        Returns the arrival time of the next thread that has not arrived yet, if any.
+        """
+        return self.upcoming
+
+    def reset(self) -> None:
+        """
+        Rewinds the cursor for a new simulation.
+        """
+        self.cursor: int = 0  # index of the first thread that has not arrived yet
+        if self.table is not None:
+            # Views of the next rows to arrive, loaded as the first of them arrives so
+            # that they see the table as reset for this simulation
+            self.block: list[Thread] = []
+            self.offset: int = 0  # position of the thread at the cursor in the block
+        self.upcoming: int | None = self._upcoming()  # arrival time of that thread
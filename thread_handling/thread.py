@@ -3,6 +3,20 @@ class Thread:
     Thread Control Block (TCB) used in thread scheduling simulations
     """
 
+    # No per-instance __dict__: a million-thread workload is a million of these
+    __slots__ = (
+        "thread_id",
+        "arrival",
+        "burst",
+        "priority",
+        "remaining",
+        "start_time",
+        "completion_time",
+        "waiting_time",
+        "turnaround_time",
+        "last_run_time",
+    )
+
     def __init__(
         self, thread_id: str, arrival_time: int, burst_time: int, priority: int
     ):
@@ -59,3 +73,18 @@ class Thread:
         if self.is_finished():
             self.completion_time = time_step + 1
             self.compute_metrics()
+
+    def advance(self, time_step: int, ticks: int) -> None:
+        """
+        Simulates `ticks` consecutive ticks of CPU time starting at time_step.
+        Equivalent to calling tick() once per step, used by the event-driven engine.
+        """
+        if ticks <= 0:
+            return
+        self.remaining -= ticks
+        self.last_run_time = time_step + ticks - 1
+        if self.start_time == -1:
+            self.start_time = time_step
+        if self.is_finished():
+            self.completion_time = self.last_run_time + 1
+            self.compute_metrics()
@@ -1,9 +1,26 @@
-from .thread import Thread
+import sys
+from typing import Iterator
 
+from .binary_workload import (
+    is_binary_workload,
+    iter_binary_chunks,
+    read_binary_workload,
+    write_binary_workload,
+)
+from .thread_table import ThreadTable
 
-def load_threads_from_file(filename: str):
-    """Loads threads from a specified file."""
-    threads = []
+DEFAULT_CHUNK_SIZE = 65536  # threads per chunk when streaming a workload file
+
+
+def _parse_text_chunks(filename: str, chunk_size: int) -> Iterator[ThreadTable]:
+    """
+    Parses a whitespace separated text workload in file order, chunk_size threads at a time.
+    Invalid lines are skipped and reported once at the end, on stderr so the results
+    printed to stdout stay machine-readable.
+    """
+    thread_ids, arrivals, bursts, priorities = [], [], [], []
+    skipped = 0
+    first_skipped = ""
 
     # Opens the file and reads line by line
     with open(filename, "r") as file:
@@ -15,29 +32,76 @@ def load_threads_from_file(filename: str):
             # Split line into parts [thread_id, arrival_time, burst_time, priority]
             parts = line.split()
 
-            # Basic validation
-            if len(parts) != 4:
-                print(
-                    f"Error: Each line must contain exactly 4 values. Skipping line: '{line}'"
-                )
-                continue
-            if (
-                not parts[1].isdigit()
-                or not parts[2].isdigit()
-                or not parts[3].isdigit()
+            # Basic validation: 4 values, the last three non-negative integers
+            if len(parts) != 4 or not (
+                parts[1].isdigit() and parts[2].isdigit() and parts[3].isdigit()
             ):
-                print(
-                    f"Error: Arrival time, burst time, and priority must be integers in line: '{line}'"
-                )
+                skipped += 1
+                first_skipped = first_skipped or line
                 continue
 
             # Separating parts and values
-            thread_id = parts[0]
-            arrival_time = int(parts[1])
-            burst_time = int(parts[2])
-            priority = int(parts[3])
+            thread_ids.append(parts[0])
+            arrivals.append(int(parts[1]))
+            bursts.append(int(parts[2]))
+            priorities.append(int(parts[3]))
+
+            if len(thread_ids) == chunk_size:
+                yield ThreadTable(thread_ids, arrivals, bursts, priorities)
+                thread_ids, arrivals, bursts, priorities = [], [], [], []
+
+    if thread_ids:
+        yield ThreadTable(thread_ids, arrivals, bursts, priorities)
+    if skipped:
+        print(
+            f"Error: Skipped {skipped} invalid line(s) in '{filename}'. Each line must contain "
+            f"a thread ID and 3 non-negative integers, e.g. first invalid line: '{first_skipped}'",
+            file=sys.stderr,
+        )
+
+
+def load_threads_from_file(filename: str) -> ThreadTable:
+    """Loads threads from a specified text or binary workload file."""
+    if is_binary_workload(filename):
+        return read_binary_workload(filename)
+    return ThreadTable.concatenate(
+        list(_parse_text_chunks(filename, DEFAULT_CHUNK_SIZE))
+    )
+
+
+def iter_thread_chunks(
+    filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[ThreadTable]:
+    """
+    Yields the threads of a workload file in arrival order, chunk_size at a time, so the
+    whole workload never has to be in memory. Binary files are sorted by construction;
+    text files must already list their threads by arrival time.
+    """
+    if is_binary_workload(filename):
+        yield from iter_binary_chunks(filename, chunk_size)
+        return
+
+    last_arrival = None
+    for chunk in _parse_text_chunks(filename, chunk_size):
+        arrival = chunk.arrival
+        if (last_arrival is not None and arrival[0] < last_arrival) or (
+            arrival[1:] < arrival[:-1]
+        ).any():
+            raise ValueError(
+                f"'{filename}' is not sorted by arrival time. Convert it to the binary "
+                "format, which sorts it, or load it whole with load_threads_from_file."
+            )
+        last_arrival = arrival[-1]
+        yield chunk
 
-            # Create Thread object and add to list
-            threads.append(Thread(thread_id, arrival_time, burst_time, priority))
 
-    return threads
+def convert_text_to_binary(source: str, destination: str, id_width: int = 16) -> int:
+    """
+    Converts a whitespace separated text workload into the binary format, sorted by
+    arrival time, and returns the number of threads written.
+    """
+    table = ThreadTable.concatenate(
+        list(_parse_text_chunks(source, DEFAULT_CHUNK_SIZE))
+    )
+    write_binary_workload(destination, table, id_width)
+    return len(table)
@@ -1,5 +1,5 @@
 import random
-from .thread import Thread
+from .thread_table import ThreadTable
 
 
 def generate_threads(
@@ -7,12 +7,18 @@ def generate_threads(
     max_arrival_time: int = 100,
     burst_time_range: tuple[int, int] = (1, 10),
     priority_range: tuple[int, int] = (0, 10),
-) -> list[Thread]:
-    """Generates a list of random threads based on the specified parameters."""
-    threads = []
-    for i in range(num_threads):
-        arrival_time = random.randint(0, max_arrival_time)
-        burst_time = random.randint(*burst_time_range)
-        priority = random.randint(*priority_range)
-        threads.append(Thread(f"T{i}", arrival_time, burst_time, priority))
-    return threads
+    seed: int | None = None,
+) -> ThreadTable:
+    """
+    Generates a table of random threads based on the specified parameters.
+    With a seed the same workload is generated every time, independent of the global
+    random state.
+    """
+    rng = random.Random(seed) if seed is not None else random
+    arrivals, bursts, priorities = [], [], []
+    for _ in range(num_threads):
+        arrivals.append(rng.randint(0, max_arrival_time))
+        bursts.append(rng.randint(*burst_time_range))
+        priorities.append(rng.randint(*priority_range))
+    thread_ids = [f"T{i}" for i in range(num_threads)]
+    return ThreadTable(thread_ids, arrivals, bursts, priorities)
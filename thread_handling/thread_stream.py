@@ -0,0 +1,58 @@
+from typing import Iterable, Iterator
+
+from .thread import Thread
+from .thread_table import ThreadTable
+
+
+def iter_threads(chunks: Iterable[ThreadTable]) -> Iterator[Thread]:
+    """
+    Flattens ThreadTable chunks, e.g. from iter_thread_chunks, into fresh Thread objects,
+    so each chunk can be freed as soon as its threads have been created.
+    """
+    for chunk in chunks:
+        for row in chunk.rows():
+            yield Thread(*row)
+
+
+class ThreadStream:
+    """
+    Arrival source that pulls threads lazily from an iterator sorted by arrival time.
+    A drop-in replacement for ArrivalIndex that only holds the next thread to arrive.
+    """
+
+    def __init__(self, threads: Iterable[Thread]) -> None:
+        self.threads: Iterator[Thread] = iter(threads)
+        self.pending: Thread | None = next(self.threads, None)  # next thread to arrive
+        self.count: int = 0  # threads handed out so far
+
+    def pop_arrivals(self, time_step: int) -> list[Thread]:
+        """
+        Returns the threads that arrived up to time_step and were not returned before.
+        """
+        arrivals = []
+        while self.pending is not None and self.pending.arrival <= time_step:
+            thread = self.pending
+            arrivals.append(thread)
+            self.pending = next(self.threads, None)
+            if self.pending is not None and self.pending.arrival < thread.arrival:
+                raise ValueError(
+                    f"Thread stream is not sorted by arrival time: {self.pending.thread_id} "
+                    f"arrives at {self.pending.arrival} after {thread.thread_id} at {thread.arrival}"
+                )
+        self.count += len(arrivals)
+        return arrivals
+
+    def next_arrival(self) -> int | None:
+        """
+        Returns the arrival time of the next thread that has not arrived yet, if any.
+        """
+        return self.pending.arrival if self.pending is not None else None
+
+    def is_exhausted(self) -> bool:
+        """
+        Returns True once every thread of the stream has been handed out.
+        """
+        return self.pending is None
+
+    def reset(self) -> None:
+        raise ValueError("A thread stream cannot be rewound")
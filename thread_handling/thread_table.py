@@ -0,0 +1,198 @@
+from itertools import repeat
+
+import numpy as np
+
+from .thread import Thread
+
+
+class ThreadTable:
+    """
+    Struct-of-arrays storage for a whole workload: one NumPy array per Thread attribute.
+    Indexing or iterating yields ThreadView objects, so code written against Thread
+    keeps working, while bulk consumers such as the metrics read the arrays directly.
+    Views are created on every access and not kept, so only the threads a simulation
+    is holding on to cost a Python object; two views of the same row are not the
+    same object.
+    """
+
+    # Simulation state columns, reset to -1 (or the burst for remaining) before a run
+    STATE_COLUMNS = (
+        "start_time",
+        "completion_time",
+        "waiting_time",
+        "turnaround_time",
+        "last_run_time",
+    )
+    # Integer columns of a row after the thread ID, in the order of Thread.__slots__
+    ROW_COLUMNS = ("arrival", "burst", "priority", "remaining") + STATE_COLUMNS
+
+    def __init__(self, thread_ids: list[str], arrival, burst, priority) -> None:
+        # Static attributes from input (IDs may also be a NumPy string array)
+        if not isinstance(thread_ids, np.ndarray):
+            thread_ids = list(thread_ids)
+        self.thread_ids: list[str] = thread_ids
+        self.arrival: np.ndarray = np.array(arrival, dtype=np.int64)
+        self.burst: np.ndarray = np.array(burst, dtype=np.int64)
+        self.priority: np.ndarray = np.array(priority, dtype=np.int64)
+        if (
+            not len(self.thread_ids)
+            == len(self.arrival)
+            == len(self.burst)
+            == len(self.priority)
+        ):
+            raise ValueError("All thread columns must have the same length")
+
+        # Simulation state and metrics
+        self.remaining: np.ndarray = self.burst.copy()
+        for name in self.STATE_COLUMNS:
+            setattr(self, name, np.full(len(self.thread_ids), -1, dtype=np.int64))
+
+    @classmethod
+    def from_threads(cls, threads: list[Thread]) -> "ThreadTable":
+        """
+        Builds a table from Thread objects, keeping their static attributes only.
+        """
+        return cls(
+            [th.thread_id for th in threads],
+            [th.arrival for th in threads],
+            [th.burst for th in threads],
+            [th.priority for th in threads],
+        )
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple[str, int, int, int]]) -> "ThreadTable":
+        """
+        Builds a table from (thread_id, arrival, burst, priority) rows.
+        """
+        if not rows:
+            return cls([], [], [], [])
+        thread_ids, arrival, burst, priority = zip(*rows)
+        return cls(thread_ids, arrival, burst, priority)
+
+    @classmethod
+    def concatenate(cls, tables: list["ThreadTable"]) -> "ThreadTable":
+        """
+        Joins tables into one, keeping their static attributes only.
+        """
+        if not tables:
+            return cls([], [], [], [])
+        thread_ids = []
+        for table in tables:
+            thread_ids.extend(table.thread_ids)
+        return cls(
+            thread_ids,
+            np.concatenate([table.arrival for table in tables]),
+            np.concatenate([table.burst for table in tables]),
+            np.concatenate([table.priority for table in tables]),
+        )
+
+    def rows(self) -> list[tuple[str, int, int, int]]:
+        """
+        Returns the static attributes as (thread_id, arrival, burst, priority) rows.
+        """
+        thread_ids = self.thread_ids
+        if isinstance(thread_ids, np.ndarray):
+            thread_ids = thread_ids.tolist()
+        return list(
+            zip(
+                thread_ids,
+                self.arrival.tolist(),
+                self.burst.tolist(),
+                self.priority.tolist(),
+            )
+        )
+
+    def copy(self) -> "ThreadTable":
+        """
+        Returns a fresh, unsimulated table with the same threads.
+        """
+        return ThreadTable(self.thread_ids, self.arrival, self.burst, self.priority)
+
+    def reset(self) -> None:
+        """
+        Resets every thread to its initial state for re-simulation.
+        """
+        self.remaining[:] = self.burst
+        for name in self.STATE_COLUMNS:
+            getattr(self, name).fill(-1)
+
+    def __len__(self) -> int:
+        return len(self.thread_ids)
+
+    def row(self, index: int) -> tuple:
+        """
+        Every attribute of one thread, in the order of Thread.__slots__.
+        """
+        return (self.thread_ids[index],) + tuple(
+            getattr(self, name).item(index) for name in self.ROW_COLUMNS
+        )
+
+    def views(self, indexes: np.ndarray) -> list["ThreadView"]:
+        """
+        Views of several rows at once, reading each column in bulk.
+        """
+        if isinstance(self.thread_ids, np.ndarray):
+            thread_ids = self.thread_ids[indexes].tolist()
+        else:
+            thread_ids = [self.thread_ids[index] for index in indexes.tolist()]
+        columns = [getattr(self, name)[indexes].tolist() for name in self.ROW_COLUMNS]
+        return list(
+            map(ThreadView, repeat(self), indexes.tolist(), zip(thread_ids, *columns))
+        )
+
+    def __getitem__(self, index: int) -> "ThreadView":
+        if index < 0:
+            index += len(self)
+        return ThreadView(self, index)
+
+    def __iter__(self):
+        for start in range(0, len(self), 1024):
+            yield from self.views(np.arange(start, min(start + 1024, len(self))))
+
+
+class ThreadView(Thread):
+    """
+    A Thread loaded from one row of a ThreadTable, which runs at the speed of a plain
+    Thread: its attributes are slots, copied from the row when the view is created.
+    The state is written back to the row when the thread completes or is reset, so
+    the table's columns hold every thread that is not running.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: ThreadTable, index: int, row: tuple | None = None):
+        self.table = table
+        self.index = index
+        (
+            self.thread_id,
+            self.arrival,
+            self.burst,
+            self.priority,
+            self.remaining,
+            self.start_time,
+            self.completion_time,
+            self.waiting_time,
+            self.turnaround_time,
+            self.last_run_time,
+        ) = row or table.row(index)
+
+    def write_back(self) -> None:
+        """
+        Stores the simulation state in the table row.
+        """
+        table = self.table
+        index = self.index
+        table.remaining[index] = self.remaining
+        table.start_time[index] = self.start_time
+        table.completion_time[index] = self.completion_time
+        table.waiting_time[index] = self.waiting_time
+        table.turnaround_time[index] = self.turnaround_time
+        table.last_run_time[index] = self.last_run_time
+
+    def compute_metrics(self):
+        super().compute_metrics()
+        self.write_back()
+
+    def reset(self) -> None:
+        super().reset()
+        self.write_back()
@@ -0,0 +1,43 @@
+from .events import (
+    ALL_EVENTS,
+    ARRIVAL,
+    COMPLETION,
+    CONSOLE_EVENTS,
+    DISPATCH,
+    EVENT_NAMES,
+    IDLE,
+    PREEMPT,
+    QUANTUM_EXPIRY,
+    TraceEvent,
+    event_mask,
+    format_event,
+)
+from .chrome import ChromeTraceWriter, convert_to_chrome
+from .ring_buffer import TraceBatch, TraceBuffer
+from .subscribers import BinaryTraceWriter, ConsolePrinter, MemoryTrace, read_trace
+from .tracer import Tracer, console_tracer
+
+__all__ = [
+    "ALL_EVENTS",
+    "ARRIVAL",
+    "COMPLETION",
+    "CONSOLE_EVENTS",
+    "DISPATCH",
+    "EVENT_NAMES",
+    "IDLE",
+    "PREEMPT",
+    "QUANTUM_EXPIRY",
+    "TraceEvent",
+    "event_mask",
+    "format_event",
+    "ChromeTraceWriter",
+    "convert_to_chrome",
+    "TraceBatch",
+    "TraceBuffer",
+    "BinaryTraceWriter",
+    "ConsolePrinter",
+    "MemoryTrace",
+    "read_trace",
+    "Tracer",
+    "console_tracer",
+]
@@ -0,0 +1,113 @@
+import json
+from typing import Iterable
+
+from .events import DISPATCH, EVENT_NAMES, IDLE, PREEMPT, TraceEvent
+from .ring_buffer import TraceBatch
+from .subscribers import read_trace
+
+
+class ChromeTraceWriter:
+    """
+    Subscriber writing the events as Chrome trace-event JSON, which opens in Perfetto
+    (ui.perfetto.dev) and chrome://tracing. Every core is a track: runs and idle time
+    are slices, the other events are instant markers on the track of their core.
+
+    Events are written as they arrive and consecutive runs of the same thread are
+    merged like the Gantt chart, so memory stays flat however long the simulation.
+    A tick lasts tick_us microseconds on the trace's time axis.
+    """
+
+    def __init__(self, filename: str, tick_us: float = 1.0) -> None:
+        self.file = open(filename, "w")
+        self.tick_us = tick_us
+        self.first = True  # no event written yet, no separating comma needed
+        # Run or idle slice of every core not written yet as [name, start, end]
+        self.pending: dict[int, list] = {}
+        self.file.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+        self._write(
+            {"ph": "M", "pid": 0, "name": "process_name", "args": {"name": "CPU"}}
+        )
+
+    def _write(self, event: dict) -> None:
+        if not self.first:
+            self.file.write(",\n")
+        self.file.write(json.dumps(event, separators=(",", ":")))
+        self.first = False
+
+    def _write_slice(self, core: int, name: str, start: int, end: int) -> None:
+        self._write(
+            {
+                "ph": "X",
+                "pid": 0,
+                "tid": core,
+                "name": name,
+                "cat": "idle" if name == "IDLE" else "run",
+                "ts": start * self.tick_us,
+                "dur": (end - start) * self.tick_us,
+            }
+        )
+
+    def _slice(self, core: int, name: str, start: int, end: int) -> None:
+        """Extends the pending slice of the core, or writes it and starts a new one."""
+        pending = self.pending.get(core)
+        if pending is None:
+            self._write(
+                {
+                    "ph": "M",
+                    "pid": 0,
+                    "tid": core,
+                    "name": "thread_name",
+                    "args": {"name": f"Core {core}"},
+                }
+            )
+        elif pending[0] == name and pending[2] == start:
+            pending[2] = end
+            return
+        else:
+            self._write_slice(core, *pending)
+        self.pending[core] = [name, start, end]
+
+    def __call__(self, batch: TraceBatch) -> None:
+        self.write_events(batch.events())
+
+    def write_events(self, events: Iterable[TraceEvent]) -> None:
+        for event in events:
+            if event.kind == DISPATCH:
+                self._slice(
+                    event.core, event.thread_id, event.time, event.time + event.length
+                )
+            elif event.kind == IDLE:
+                self._slice(event.core, "IDLE", event.time, event.time + event.length)
+            else:
+                args = {"thread": event.thread_id}
+                if event.kind == PREEMPT:
+                    args["by"] = event.other_id
+                self._write(
+                    {
+                        "ph": "i",
+                        "s": "t",
+                        "pid": 0,
+                        "tid": event.core,
+                        "name": EVENT_NAMES[event.kind],
+                        "ts": event.time * self.tick_us,
+                        "args": args,
+                    }
+                )
+
+    def close(self) -> None:
+        for core, pending in self.pending.items():
+            self._write_slice(core, *pending)
+        self.pending.clear()
+        self.file.write("\n]}\n")
+        self.file.close()
+
+
+def convert_to_chrome(source: str, destination: str, tick_us: float = 1.0) -> None:
+    """
+    Rewrites a binary trace file as Chrome trace-event JSON, one chunk at a time.
+    """
+    writer = ChromeTraceWriter(destination, tick_us)
+    try:
+        writer.write_events(read_trace(source))
+    finally:
+        writer.close()
@@ -0,0 +1,71 @@
+from typing import NamedTuple
+
+# Event kinds, one bit each so a set of kinds is a plain int mask. Plain ints keep the
+# enabled checks on the simulation's hot path cheap.
+DISPATCH = 1  # a thread ran from time for length ticks
+PREEMPT = 2  # thread was preempted by other at time
+QUANTUM_EXPIRY = 4  # thread used up its quantum or slice at time
+ARRIVAL = 8  # thread arrived at time
+COMPLETION = 16  # thread completed at time
+IDLE = 32  # the CPU was idle from time for length ticks
+ALL_EVENTS = DISPATCH | PREEMPT | QUANTUM_EXPIRY | ARRIVAL | COMPLETION | IDLE
+
+# Events printed by a verbose simulation
+CONSOLE_EVENTS = DISPATCH | PREEMPT | IDLE
+
+EVENT_NAMES = {
+    DISPATCH: "dispatch",
+    PREEMPT: "preempt",
+    QUANTUM_EXPIRY: "quantum_expiry",
+    ARRIVAL: "arrival",
+    COMPLETION: "completion",
+    IDLE: "idle",
+}
+
+
+class TraceEvent(NamedTuple):
+    """
+    One recorded event. other_id is the preempting thread of a PREEMPT event, and
+    core is the CPU core of a multi-core simulation.
+    """
+
+    time: int
+    kind: int
+    thread_id: str | None
+    other_id: str | None = None
+    length: int = 1
+    core: int = 0
+
+
+def event_mask(names: list[str]) -> int:
+    """
+    The mask of the named event kinds, e.g. ["dispatch", "preempt"].
+    """
+    kinds = {name: kind for kind, name in EVENT_NAMES.items()}
+    mask = 0
+    for name in names:
+        if name not in kinds:
+            raise ValueError(f"Unknown event '{name}'. Choose from: {', '.join(kinds)}")
+        mask |= kinds[name]
+    return mask
+
+
+def format_event(event: TraceEvent, show_core: bool = False) -> str:
+    """
+    One line describing an event, as printed by a verbose simulation.
+    """
+    last = event.time + event.length - 1
+    span = f"{event.time}" if last == event.time else f"{event.time}-{last}"
+    core = f"Core {event.core} " if show_core else ""
+    if event.kind == DISPATCH:
+        running = "running" if show_core else "Running"
+        return f"Time {span}: {core}{running} Thread {event.thread_id}"
+    if event.kind == IDLE:
+        return f"Time {span}: {core}CPU IDLE"
+    if event.kind == PREEMPT:
+        return f"Preempting {event.thread_id} for {event.other_id}"
+    if event.kind == QUANTUM_EXPIRY:
+        return f"Time {event.time}: {core}Quantum of Thread {event.thread_id} expired"
+    if event.kind == ARRIVAL:
+        return f"Time {event.time}: {core}Thread {event.thread_id} arrived"
+    return f"Time {event.time}: {core}Thread {event.thread_id} completed"
@@ -0,0 +1,118 @@
+from array import array
+from typing import Iterator
+
+from .events import TraceEvent
+
+# Numeric columns of a recorded event with their array type codes
+COLUMNS = (
+    ("times", "q"),
+    ("kinds", "B"),
+    ("lengths", "q"),
+    ("cores", "H"),
+)
+# Thread ID columns, lists of the IDs themselves or None. Holding references instead
+# of indexes into a table of every ID seen keeps memory flat over long simulations.
+ID_COLUMNS = ("threads", "others")
+DEFAULT_CAPACITY = 65536
+
+
+class TraceBatch:
+    """
+    Consecutive recorded events as columns, see COLUMNS and ID_COLUMNS, in the order
+    they were recorded. dropped counts the events overwritten before they were read.
+    """
+
+    def __init__(self, columns: dict[str, array | list], dropped: int = 0) -> None:
+        self.columns = columns
+        self.dropped = dropped
+
+    def __len__(self) -> int:
+        return len(self.columns["times"])
+
+    def events(self) -> Iterator[TraceEvent]:
+        columns = self.columns
+        for event in zip(
+            columns["times"],
+            columns["kinds"],
+            columns["threads"],
+            columns["others"],
+            columns["lengths"],
+            columns["cores"],
+        ):
+            yield TraceEvent(*event)
+
+
+class TraceBuffer:
+    """
+    Fixed-size ring of events, one preallocated array per column. Recording never
+    allocates: once the ring is full the oldest events are overwritten.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("The trace buffer needs room for at least one event")
+        self.capacity = capacity
+        for name, typecode in COLUMNS:
+            column = array(typecode)
+            setattr(self, name, array(typecode, bytes(capacity * column.itemsize)))
+        for name in ID_COLUMNS:
+            setattr(self, name, [None] * capacity)
+        self.written = 0  # events recorded so far
+        self.read = 0  # events passed on by drain() so far
+
+    def append(
+        self,
+        time: int,
+        kind: int,
+        thread: str | None,
+        other: str | None,
+        length: int,
+        core: int,
+    ) -> None:
+        index = self.written % self.capacity
+        self.times[index] = time
+        self.kinds[index] = kind
+        self.threads[index] = thread
+        self.others[index] = other
+        self.lengths[index] = length
+        self.cores[index] = core
+        self.written += 1
+
+    @property
+    def pending(self) -> int:
+        """Events recorded since the last drain() that are still in the ring."""
+        return min(self.written - self.read, self.capacity)
+
+    def _batch(self, start: int, dropped: int) -> TraceBatch:
+        """The events from position start up to the last one recorded."""
+        count = self.written - start
+        first = start % self.capacity
+        columns = {}
+        for name in [name for name, _ in COLUMNS] + list(ID_COLUMNS):
+            column = getattr(self, name)
+            if first + count <= self.capacity:
+                columns[name] = column[first : first + count]
+            else:
+                columns[name] = column[first:] + column[: first + count - self.capacity]
+        return TraceBatch(columns, dropped)
+
+    def drain(self) -> TraceBatch:
+        """
+        The events recorded since the last drain(), as far as they are still in the ring.
+        """
+        start = max(self.read, self.written - self.capacity)
+        batch = self._batch(start, start - self.read)
+        self.read = self.written
+        return batch
+
+    def recent(self) -> TraceBatch:
+        """
+        The last events still in the ring, whether drained or not.
+        """
+        return self._batch(max(0, self.written - self.capacity), 0)
+
+    def clear(self) -> None:
+        self.written = 0
+        self.read = 0
+        for name in ID_COLUMNS:
+            getattr(self, name)[:] = [None] * self.capacity
@@ -0,0 +1,125 @@
+import struct
+import sys
+from array import array
+from typing import Iterator
+
+from .events import ALL_EVENTS, TraceEvent, format_event
+from .ring_buffer import COLUMNS, ID_COLUMNS, TraceBatch
+
+# File layout: a fixed header followed by one chunk per batch. A chunk starts with its
+# event count and the number of distinct thread IDs in it, then those IDs as
+# length-prefixed UTF-8, the ID columns as indexes into them (-1 for none) and the
+# numeric columns, each as little-endian values.
+MAGIC = b"TSIMTRCE"
+VERSION = 1
+HEADER = struct.Struct("<8sI")  # magic, version
+CHUNK = struct.Struct("<II")  # event count, thread IDs
+NAME_LENGTH = struct.Struct("<H")
+
+
+def _to_little_endian(column: array) -> array:
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column
+
+
+class ConsolePrinter:
+    """
+    Subscriber printing every event as one line, see format_event.
+    Core numbers are shown when the simulation has more than one core.
+    """
+
+    def __init__(self, file=None, events: int = ALL_EVENTS, cores: int = 1) -> None:
+        self.file = file  # None prints to the current sys.stdout
+        self.events = events
+        self.show_core = cores > 1
+
+    def __call__(self, batch: TraceBatch) -> None:
+        file = self.file or sys.stdout
+        for event in batch.events():
+            if event.kind & self.events:
+                print(format_event(event, self.show_core), file=file)
+
+
+class MemoryTrace:
+    """
+    Subscriber keeping every event in memory, e.g. for tests and notebooks.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[TraceEvent] = []
+        self.dropped = 0  # events lost because the ring buffer overflowed
+
+    def __call__(self, batch: TraceBatch) -> None:
+        self.events.extend(batch.events())
+        self.dropped += batch.dropped
+
+    def of_kind(self, kinds: int) -> list[TraceEvent]:
+        """The events whose kind is set in the kinds mask."""
+        return [event for event in self.events if event.kind & kinds]
+
+
+class BinaryTraceWriter:
+    """
+    Subscriber appending every batch to a compact binary trace file, read back with
+    read_trace(). Nothing is formatted while the simulation runs.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.file = open(filename, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION))
+        self.dropped = 0
+
+    def __call__(self, batch: TraceBatch) -> None:
+        # Every chunk has its own table of thread IDs, so nothing accumulates
+        index = {None: -1}
+        for name in ID_COLUMNS:
+            for thread_id in batch.columns[name]:
+                if thread_id not in index:
+                    index[thread_id] = len(index) - 1
+        del index[None]
+        self.file.write(CHUNK.pack(len(batch), len(index)))
+        for thread_id in index:
+            encoded = thread_id.encode("utf-8")
+            self.file.write(NAME_LENGTH.pack(len(encoded)))
+            self.file.write(encoded)
+        index[None] = -1
+        for name in ID_COLUMNS:
+            column = array("i", map(index.__getitem__, batch.columns[name]))
+            _to_little_endian(column).tofile(self.file)
+        for name, _ in COLUMNS:
+            _to_little_endian(batch.columns[name]).tofile(self.file)
+        self.dropped += batch.dropped
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def read_trace(filename: str) -> Iterator[TraceEvent]:
+    """
+    Yields the events of a binary trace file in the order they were recorded.
+    """
+    with open(filename, "rb") as file:
+        magic, version = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"'{filename}' is not a trace file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported trace version {version} in '{filename}'")
+        while header := file.read(CHUNK.size):
+            count, names = CHUNK.unpack(header)
+            thread_ids = []
+            for _ in range(names):
+                (length,) = NAME_LENGTH.unpack(file.read(NAME_LENGTH.size))
+                thread_ids.append(file.read(length).decode("utf-8"))
+            thread_ids.append(None)  # index -1
+            columns = {}
+            for name, typecode in [(name, "i") for name in ID_COLUMNS] + list(COLUMNS):
+                column = array(typecode)
+                column.fromfile(file, count)
+                if sys.byteorder == "big":
+                    column.byteswap()
+                columns[name] = column
+            for name in ID_COLUMNS:
+                columns[name] = [thread_ids[index] for index in columns[name]]
+            yield from TraceBatch(columns).events()
@@ -0,0 +1,85 @@
+from typing import Callable, Iterable
+
+from .events import ALL_EVENTS, CONSOLE_EVENTS
+from .ring_buffer import DEFAULT_CAPACITY, TraceBatch, TraceBuffer
+from .subscribers import ConsolePrinter
+
+Subscriber = Callable[[TraceBatch], None]
+
+
+class Tracer:
+    """
+    Records the events of a simulation into a ring buffer and hands them to its
+    subscribers in batches, every flush_size events (by default once the ring is
+    full) and on flush().
+
+    Only the kinds set in enabled are recorded. Emitting code checks
+    `tracer.enabled & KIND` first, so a disabled event costs one bit test and no
+    formatting or allocation.
+    """
+
+    def __init__(
+        self,
+        events: int = ALL_EVENTS,
+        subscribers: Iterable[Subscriber] = (),
+        capacity: int = DEFAULT_CAPACITY,
+        flush_size: int | None = None,
+    ) -> None:
+        self.enabled = events  # mask of the event kinds recorded
+        self.subscribers: list[Subscriber] = list(subscribers)
+        self.buffer = TraceBuffer(capacity)
+        self.flush_size = min(flush_size or capacity, capacity)
+
+    def emit(
+        self,
+        kind: int,
+        time: int,
+        thread_id: str | None = None,
+        other_id: str | None = None,
+        length: int = 1,
+        core: int = 0,
+    ) -> None:
+        """
+        Records an event, see tracing.events for the kinds and their fields.
+        """
+        buffer = self.buffer
+        buffer.append(time, kind, thread_id, other_id, length, core)
+        if buffer.written - buffer.read >= self.flush_size:
+            self.flush()
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        """Passes every later batch of events to subscriber(batch)."""
+        self.subscribers.append(subscriber)
+
+    def flush(self) -> None:
+        """Hands the events recorded since the last flush to the subscribers."""
+        if self.buffer.written == self.buffer.read:
+            return
+        if not self.subscribers:
+            # Nobody to hand events to, the ring keeps the latest for recent()
+            self.buffer.read = self.buffer.written
+            return
+        batch = self.buffer.drain()
+        for subscriber in self.subscribers:
+            subscriber(batch)
+
+    def recent(self) -> TraceBatch:
+        """The last events still in the ring buffer, e.g. to inspect after a failure."""
+        return self.buffer.recent()
+
+    def close(self) -> None:
+        """Flushes the remaining events and closes the subscribers that need it."""
+        self.flush()
+        for subscriber in self.subscribers:
+            close = getattr(subscriber, "close", None)
+            if close is not None:
+                close()
+
+
+def console_tracer(events: int = CONSOLE_EVENTS, file=None, cores: int = 1) -> Tracer:
+    """
+    A tracer printing every event as it happens, what a verbose simulation shows.
+    """
+    return Tracer(
+        events, [ConsolePrinter(file, cores=cores)], capacity=64, flush_size=1
+    )